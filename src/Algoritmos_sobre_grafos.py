@@ -15,10 +15,16 @@
 # Librerías auxiliares                                                --
 # ----------------------------------------------------------------------
 
-from typing import TypeVar
+from collections import deque
+from heapq import heappop, heappush
+from random import Random
+from timeit import Timer, default_timer
+from typing import Iterator, TypeVar
 
+from src.TAD.ConjuntosDisjuntos import ConjuntosDisjuntos
 from src.TAD.Grafo import (Grafo, Orientacion, Peso, Vertice, adyacentes,
-                           aristas, creaGrafo, creaGrafo_, nodos)
+                           aristas, creaGrafo, creaGrafo_, dirigido, nodos,
+                           peso)
 
 A = TypeVar('A')
 
@@ -101,6 +107,37 @@ def recorridoEnProfundidad(i: Vertice, g: Grafo) -> list[Vertice]:
 #    = reverse([4,5,6,3,2,1])
 #    = [1,2,3,6,5,4]
 
+# 3ª solución
+# ===========
+
+# Las soluciones anteriores hacen una llamada recursiva por cada
+# vértice que se saca, comprueban la pertenencia a la lista vis y
+# construyen una nueva lista en cada paso, por lo que su coste es
+# cuadrático y fallan en grafos con muchos vértices por superar el
+# límite de recursión.
+#
+# iterRecorridoEnProfundidad(i, g) es un generador de los vértices del
+# recorrido en profundidad del grafo g desde el vértice i, en el mismo
+# orden que recorridoEnProfundidad. Se usa una pila (una lista en la
+# que los adyacentes se apilan en orden inverso, para que salga primero
+# el primero) y el conjunto de los visitados. Los adyacentes ya
+# visitados no se apilan, por lo que el coste es O(V+E). Por ejemplo,
+#    >>> list(iterRecorridoEnProfundidad(1, grafo2))
+#    [1, 2, 3, 6, 5, 4]
+def iterRecorridoEnProfundidad(i: Vertice, g: Grafo) -> Iterator[Vertice]:
+    vis: set[Vertice] = set()
+    cs = [i]
+    while cs:
+        d = cs.pop()
+        if d in vis:
+            continue
+        vis.add(d)
+        yield d
+        cs.extend(v for v in reversed(adyacentes(g, d)) if v not in vis)
+
+def recorridoEnProfundidad3(i: Vertice, g: Grafo) -> list[Vertice]:
+    return list(iterRecorridoEnProfundidad(i, g))
+
 # Verificación
 # ============
 
@@ -112,6 +149,10 @@ def test_recorridoEnProfundidad() -> None:
     assert recorridoEnProfundidad1(1, grafo3) == [1,2,6,3,5,4]
     assert recorridoEnProfundidad(1, grafo2) == [1,2,3,6,5,4]
     assert recorridoEnProfundidad(1, grafo3) == [1,2,6,3,5,4]
+    assert recorridoEnProfundidad3(1, grafo2) == [1,2,3,6,5,4]
+    assert recorridoEnProfundidad3(1, grafo3) == [1,2,6,3,5,4]
+    g = grafoConexo(100, 200)
+    assert recorridoEnProfundidad3(1, g) == recorridoEnProfundidad(1, g)
     print("Verificado")
 
 # La verificación es
@@ -144,6 +185,9 @@ grafo4: Grafo = creaGrafo_(Orientacion.D,
                            (1,6),
                            [(1,2),(1,3),(1,4),(3,6),(5,4),(6,2),(6,5)])
 
+# 1ª solución
+# ===========
+
 def recorridoEnAnchura(i: Vertice, g: Grafo) -> list[Vertice]:
     def ra(cs: list[Vertice], vis: list[Vertice]) -> list[Vertice]:
         if not cs:
@@ -167,6 +211,34 @@ def recorridoEnAnchura(i: Vertice, g: Grafo) -> list[Vertice]:
 #    = ra([],      [5,6,4,3,2,1])
 #    = [1,2,3,4,6,5]
 
+# 2ª solución
+# ===========
+
+# Como en la 1ª solución de recorridoEnProfundidad, el coste es
+# cuadrático y la recursión falla en grafos con muchos vértices.
+#
+# iterRecorridoEnAnchura(i, g) es un generador de los vértices del
+# recorrido en anchura del grafo g desde el vértice i, en el mismo orden
+# que recorridoEnAnchura. Se usa una cola (con deque) y el conjunto de
+# los vértices ya encolados. Como en la cola cada vértice se visita en
+# su primera aparición, no hace falta encolarlo más veces y el coste es
+# O(V+E). Por ejemplo,
+#    >>> list(iterRecorridoEnAnchura(1, grafo4))
+#    [1, 2, 3, 4, 6, 5]
+def iterRecorridoEnAnchura(i: Vertice, g: Grafo) -> Iterator[Vertice]:
+    vis = {i}
+    cs = deque([i])
+    while cs:
+        d = cs.popleft()
+        yield d
+        for v in adyacentes(g, d):
+            if v not in vis:
+                vis.add(v)
+                cs.append(v)
+
+def recorridoEnAnchura2(i: Vertice, g: Grafo) -> list[Vertice]:
+    return list(iterRecorridoEnAnchura(i, g))
+
 # Verificación
 # ============
 
@@ -176,6 +248,10 @@ def test_recorridoEnAnchura() -> None:
                         [(1,2),(1,3),(1,4),(3,6),(5,4),(6,2),(6,5)])
     assert recorridoEnAnchura(1, grafo4) == [1,2,3,4,6,5]
     assert recorridoEnAnchura(1, grafo5) == [1,2,3,4,6,5]
+    assert recorridoEnAnchura2(1, grafo4) == [1,2,3,4,6,5]
+    assert recorridoEnAnchura2(1, grafo5) == [1,2,3,4,6,5]
+    g = grafoConexo(100, 200)
+    assert recorridoEnAnchura2(1, g) == recorridoEnAnchura(1, g)
     print("Verificado")
 
 # La verificación es
@@ -270,6 +346,9 @@ g4 = creaGrafo (Orientacion.ND,
                  ((5,6),3),((5,7),9),
                  ((6,7),11)])
 
+# 1ª solución
+# ===========
+
 # raiz(d, n) es la raíz de n en el diccionario. Por ejemplo,
 #    raiz({1:1, 3:1, 4:3, 5:4, 2:6, 6:6}, 5)  == 1
 #    raiz({1:1, 3:1, 4:3, 5:4, 2:6, 6:6}, 2)  == 6
@@ -335,7 +414,7 @@ def buscaActualiza(a: tuple[Vertice, Vertice],
         return True, modificaR(x, d[x], y_, d)
     return True, modificaR(y, d[y], x_, d)
 
-def kruskal(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+def kruskal1(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
     def aux(as_: list[tuple[Peso, Vertice, Vertice]],
             d: dict[Vertice, Vertice],
             ae: list[tuple[Peso, Vertice, Vertice]],
@@ -390,20 +469,92 @@ def kruskal(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
 #
 # No es posible añadir más aristas, pues formarían ciclos.
 
+# 2ª solución
+# ===========
+
+# La 1ª solución recorre todo el diccionario en cada unión, copia la
+# lista de aristas en cada paso (con as_[1:]) y la profundidad de la
+# recursión es el número de aristas consideradas. En esta solución los
+# árboles del bosque se representan mediante conjuntos disjuntos (ver
+# TAD/ConjuntosDisjuntos.py), en los que el vértice v es el elemento
+# v-x (donde x es el menor vértice), y las aristas se recorren con un
+# bucle, por lo que su coste es O(E log E) (el de ordenar las aristas).
+#
+# En los grafos no dirigidos cada arista aparece dos veces en
+# aristas(g) y, como la (x,y) con x < y está antes en el orden, la
+# (y,x) siempre se desecha. Por ello basta considerar las primeras.
+def kruskal(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+    vs = nodos(g)
+    x0 = vs[0]
+    as_ = sorted((p, x, y) for ((x, y), p) in aristas(g)
+                 if dirigido(g) or x <= y)
+    c = ConjuntosDisjuntos(len(vs))
+    ae: list[tuple[Peso, Vertice, Vertice]] = []
+    n = len(vs) - 1
+    for (p, x, y) in as_:
+        if len(ae) == n:
+            break
+        if c.une(x - x0, y - x0):
+            ae.append((p, x, y))
+    ae.reverse()
+    return ae
+
 # Verificación
 # ============
 
 def test_kruskal() -> None:
-    assert kruskal(g1) == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
-    assert kruskal(g2) == [(32,2,5),(13,1,2),(12,2,4),(11,1,3)]
-    assert kruskal(g3) == [(9,5,7),(7,2,3),(6,1,6),(5,4,5),(5,1,2),(3,5,6)]
-    assert kruskal(g4) == [(9,5,7),(6,1,6),(5,4,5),(5,1,2),(3,5,6),(1,3,5)]
+    for kruskal_ in [kruskal1, kruskal]:
+        assert kruskal_(g1) == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
+        assert kruskal_(g2) == [(32,2,5),(13,1,2),(12,2,4),(11,1,3)]
+        assert kruskal_(g3) == \
+            [(9,5,7),(7,2,3),(6,1,6),(5,4,5),(5,1,2),(3,5,6)]
+        assert kruskal_(g4) == \
+            [(9,5,7),(6,1,6),(5,4,5),(5,1,2),(3,5,6),(1,3,5)]
+    g = grafoConexo(200, 400)
+    assert kruskal1(g) == kruskal(g)
     print("Verificado")
 
 # La verificación es
 #    >>> test_kruskal()
 #    Verificado
 
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# grafoConexo(n, m) es un grafo no dirigido y conexo con los vértices de
+# 1 a n y m aristas (además de las n-1 de un árbol aleatorio que los une
+# a todos), con pesos aleatorios entre 1 y 1000. Por ejemplo,
+#    >>> grafoConexo(4, 1)
+#    G ND ([1, 2, 3, 4], [((1, 2), 69), ((1, 2), 311), ((1, 3), 739), ((2, 4), 491)])
+def grafoConexo(n: int, m: int) -> Grafo:
+    r = Random(n)
+    as_ = [((r.randint(1, v - 1), v), r.randint(1, 1000))
+           for v in range(2, n + 1)]
+    as_ += [((r.randint(1, n), r.randint(1, n)), r.randint(1, 1000))
+            for _ in range(m)]
+    return creaGrafo(Orientacion.ND, (1, n), as_)
+
+# La comparación es
+#    >>> g = grafoConexo(200, 400)
+#    >>> tiempo('kruskal1(g)')
+#    0.01 segundos
+#    >>> tiempo('kruskal(g)')
+#    0.00 segundos
+#    >>> g = grafoConexo(300, 600)
+#    >>> tiempo('kruskal1(g)')
+#    RecursionError: maximum recursion depth exceeded
+#    >>> g = grafoConexo(10**4, 4*10**4)
+#    >>> tiempo('kruskal(g)')
+#    0.09 segundos
+#    >>> g = grafoConexo(10**5, 4*10**5)
+#    >>> tiempo('kruskal(g)')
+#    1.62 segundos
+
 # ---------------------------------------------------------------------
 # Ejercicio 4. El [algoritmo de Prim](https://bit.ly/466fwRe) calcula un
 # árbol recubridor mínimo en un grafo conexo y ponderado. Es decir,
@@ -433,7 +584,10 @@ def test_kruskal() -> None:
 #    prim(g3)  == [(9,5,7),(7,2,3),(5,5,4),(3,6,5),(6,1,6),(5,1,2)]
 # ---------------------------------------------------------------------
 
-def prim(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+# 1ª solución
+# ===========
+
+def prim1(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
     n, *ns = nodos(g)
     def prim_(t: list[Vertice],
               r: list[Vertice],
@@ -451,19 +605,112 @@ def prim(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
         return prim_([v_] + t, [x for x in r if x != v_], [e] + ae, as_)
     return prim_([n], ns, [], aristas(g))
 
+# 2ª solución
+# ===========
+
+# La 1ª solución recorre todas las aristas del grafo en cada paso y
+# comprueba la pertenencia a las listas t y r, por lo que su coste es
+# O(V·E·V). En esta solución se usa un montículo (con el módulo heapq)
+# con las aristas (c,u,v) tales que u está en el árbol. Cuando se
+# añade un vértice u al árbol se añaden al montículo las aristas de u a
+# los vértices que no están en el árbol y, en cada paso, se saca la
+# menor arista del montículo descartando las que llegan a un vértice
+# que ya está en el árbol (eliminación perezosa). El coste es
+# O(E log V).
+#
+# Como la menor arista válida del montículo es la menor de las aristas
+# (c,u,v) con u en el árbol y v fuera de él, el resultado coincide con
+# el de la 1ª solución.
+def prim(g: Grafo) -> list[tuple[Peso, Vertice, Vertice]]:
+    n, *ns = nodos(g)
+    if not aristas(g):
+        return []
+    enArbol = {n}
+    m: list[tuple[Peso, Vertice, Vertice]] = []
+
+    def anade(u: Vertice) -> None:
+        for v in adyacentes(g, u):
+            if v not in enArbol:
+                heappush(m, (peso(u, v, g), u, v))
+
+    anade(n)
+    ae: list[tuple[Peso, Vertice, Vertice]] = []
+    while m and len(enArbol) <= len(ns):
+        e = heappop(m)
+        (_, _, v) = e
+        if v not in enArbol:
+            enArbol.add(v)
+            ae.append(e)
+            anade(v)
+    ae.reverse()
+    return ae
+
 # Verificación
 # ============
 
 def test_prim() -> None:
-    assert prim(g1)  == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
-    assert prim(g2)  == [(32,2,5),(12,2,4),(13,1,2),(11,1,3)]
-    assert prim(g3)  == [(9,5,7),(7,2,3),(5,5,4),(3,6,5),(6,1,6),(5,1,2)]
+    for prim_ in [prim1, prim]:
+        assert prim_(g1) == [(55,2,4),(34,1,3),(32,2,5),(12,1,2)]
+        assert prim_(g2) == [(32,2,5),(12,2,4),(13,1,2),(11,1,3)]
+        assert prim_(g3) == \
+            [(9,5,7),(7,2,3),(5,5,4),(3,6,5),(6,1,6),(5,1,2)]
+    g = grafoConexo(100, 200)
+    assert prim1(g) == prim(g)
     print("Verificado")
 
 # La verificación es
 #    >>> test_prim()
 #    Verificado
 
+# Comparación de eficiencia
+# =========================
+
+# grafoCompleto(n) es el grafo completo no dirigido con los vértices de
+# 1 a n y pesos aleatorios entre 1 y 1000. Por ejemplo,
+#    >>> grafoCompleto(3)
+#    G ND ([1, 2, 3], [((1, 2), 244), ((1, 3), 607), ((2, 3), 558)])
+def grafoCompleto(n: int) -> Grafo:
+    r = Random(n)
+    return creaGrafo(Orientacion.ND,
+                     (1, n),
+                     [((x, y), r.randint(1, 1000))
+                      for x in range(1, n + 1)
+                      for y in range(x + 1, n + 1)])
+
+# La comparación, con la versión por escalada de Escalada_Prim.py, es
+#    >>> import src.Escalada_Prim as ep
+#    >>> g = grafoCompleto(100)
+#    >>> tiempo('prim1(g)')
+#    0.87 segundos
+#    >>> tiempo('ep.prim(g)')
+#    2.47 segundos
+#    >>> tiempo('prim(g)')
+#    0.00 segundos
+#    >>> g = grafoCompleto(200)
+#    >>> tiempo('prim1(g)')
+#    11.40 segundos
+#    >>> tiempo('ep.prim(g)')
+#    31.36 segundos
+#    >>> tiempo('prim(g)')
+#    0.02 segundos
+#    >>> g = grafoCompleto(1000)
+#    >>> tiempo('prim(g)')
+#    0.49 segundos
+#
+#    >>> g = grafoConexo(300, 600)
+#    >>> tiempo('prim1(g)')
+#    1.06 segundos
+#    >>> tiempo('ep.prim(g)')
+#    2.45 segundos
+#    >>> tiempo('prim(g)')
+#    0.00 segundos
+#    >>> g = grafoConexo(1000, 2000)
+#    >>> tiempo('prim1(g)')
+#    RecursionError: maximum recursion depth exceeded in comparison
+#    >>> g = grafoConexo(10**5, 4*10**5)
+#    >>> tiempo('prim(g)')
+#    2.65 segundos
+
 # Verificación
 # ============
 
@@ -0,0 +1,837 @@
+# Anchura_minima_y_ciclos_hamiltonianos.py
+# Anchura mínima y ciclos hamiltonianos mediante ramificación y poda.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# ----------------------------------------------------------------------
+# Introducción                                                        --
+# ----------------------------------------------------------------------
+
+# En Ejercicios_sobre_grafos.py se define la anchura de un grafo para
+# la numeración dada de sus vértices y la lista de todos los recorridos
+# de un grafo completo (con las permutaciones de sus vértices). A
+# partir de ellas, la anchura mínima de un grafo (la menor anchura que
+# se obtiene al renumerar sus vértices) y la existencia de un ciclo
+# hamiltoniano (un ciclo que pasa una vez por cada vértice) se pueden
+# calcular recorriendo todas las permutaciones de los vértices, lo que
+# sólo es posible con grafos de unos 10 vértices.
+#
+# En esta relación se calculan mediante búsqueda en profundidad con
+# ramificación y poda, con las siguientes mejoras:
+#    + los conjuntos de vértices se representan mediante máscaras de
+#      bits (como en Reinas_con_mascaras_de_bits.py),
+#    + se descartan los estados parciales que no pueden completarse
+#      (usando los plazos de colocación de los vértices, para la
+#      anchura, y los grados y la conexión de los vértices libres, para
+#      los ciclos) y
+#    + se memorizan los estados parciales que ya se han descartado, ya
+#      que a ellos se llega por muchos caminos distintos.
+# Con ellas, se pueden tratar grafos de unos 30 vértices.
+
+# ----------------------------------------------------------------------
+# Librerías auxiliares                                                --
+# ----------------------------------------------------------------------
+
+from collections import deque
+from itertools import permutations
+from timeit import Timer, default_timer
+from typing import Any, Optional
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from hypothesis.strategies import composite
+
+from src.Ejercicios_sobre_grafos import recorridos
+from src.Generadores_de_grafos import erdosRenyi, rejilla
+from src.Problemas_basicos_de_grafos import completo, gen_aristas, grafoCiclo
+from src.TAD.Grafo import (Grafo, Orientacion, Vertice, adyacentes, aristaEn,
+                           aristas, creaGrafo_, nodos)
+
+# ----------------------------------------------------------------------
+# Representación mediante máscaras de bits                           --
+# ----------------------------------------------------------------------
+
+# En las máscaras, el bit i corresponde al vértice i-ésimo de nodos(g)
+# (empezando en 0). Por ejemplo,
+#    >>> g = creaGrafo_(Orientacion.D, (1,4), [(1,2),(2,3),(3,1),(4,4)])
+#    >>> sucesores(g)
+#    [2, 4, 1, 0]
+#    >>> predecesores(g)
+#    [4, 1, 2, 0]
+#    >>> vecinos(g)
+#    [6, 5, 3, 0]
+
+# sucesores(g) es la lista de las máscaras de los adyacentes de cada
+# vértice de g (sin contar los lazos).
+def sucesores(g: Grafo) -> list[int]:
+    vs = nodos(g)
+    i = {v: k for (k, v) in enumerate(vs)}
+    return [sum(1 << i[w] for w in adyacentes(g, v) if w != v and w in i)
+            for v in vs]
+
+# predecesores(g) es la lista de las máscaras de los vértices de los
+# que es adyacente cada vértice de g (sin contar los lazos).
+def predecesores(g: Grafo) -> list[int]:
+    suc = sucesores(g)
+    pre = [0] * len(suc)
+    for (k, m) in enumerate(suc):
+        while m:
+            b = m & -m
+            m ^= b
+            pre[b.bit_length() - 1] |= 1 << k
+    return pre
+
+# vecinos(g) es la lista de las máscaras de los vértices unidos a cada
+# vértice de g por una arista en algún sentido.
+def vecinos(g: Grafo) -> list[int]:
+    return [s | p for (s, p) in zip(sucesores(g), predecesores(g))]
+
+# elementos(m) es la lista de los índices de los bits de la máscara m.
+# Por ejemplo,
+#    >>> elementos(0b10110)
+#    [1, 2, 4]
+def elementos(m: int) -> list[int]:
+    xs = []
+    while m:
+        b = m & -m
+        m ^= b
+        xs.append(b.bit_length() - 1)
+    return xs
+
+# ---------------------------------------------------------------------
+# Ejercicio 1. La anchura de un grafo g con respecto a una ordenación
+# vs de sus vértices es la anchura del grafo que se obtiene numerando
+# sus vértices según su posición en vs.
+#
+# Definir la función
+#    anchuraOrden : (Grafo, list[Vertice]) -> int
+# tal que anchuraOrden(g, vs) es la anchura del grafo g con respecto a
+# la ordenación vs. Por ejemplo,
+#    >>> anchuraOrden(grafoCiclo(6), [1, 2, 3, 4, 5, 6])
+#    5
+#    >>> anchuraOrden(grafoCiclo(6), [1, 2, 6, 3, 5, 4])
+#    2
+# ---------------------------------------------------------------------
+
+def anchuraOrden(g: Grafo, vs: list[Vertice]) -> int:
+    posicion = {v: k for (k, v) in enumerate(vs)}
+    return max([0] + [abs(posicion[x] - posicion[y])
+                      for ((x, y), _) in aristas(g)])
+
+# Verificación
+# ============
+
+def test_anchuraOrden() -> None:
+    assert anchuraOrden(grafoCiclo(6), [1, 2, 3, 4, 5, 6]) == 5
+    assert anchuraOrden(grafoCiclo(6), [1, 2, 6, 3, 5, 4]) == 2
+    print("Verificado")
+
+# La verificación es
+#    >>> test_anchuraOrden()
+#    Verificado
+
+# ---------------------------------------------------------------------
+# Ejercicio 2. La anchura mínima de un grafo es la menor de sus anchuras
+# con respecto a las ordenaciones de sus vértices.
+#
+# Definir la función
+#    anchuraMinima : (Grafo) -> int
+# tal que anchuraMinima(g) es la anchura mínima del grafo g. Por
+# ejemplo,
+#    >>> anchuraMinima(grafoCiclo(6))
+#    2
+#    >>> anchuraMinima(completo(5))
+#    4
+#    >>> anchuraMinima(creaGrafo_(Orientacion.ND, (1,7),
+#    ...                          [(1,2),(1,3),(1,4),(1,5),(1,6),(1,7)]))
+#    3
+# ---------------------------------------------------------------------
+
+# 1ª solución
+# ===========
+
+def anchuraMinima1(g: Grafo) -> int:
+    return min(anchuraOrden(g, list(vs)) for vs in permutations(nodos(g)))
+
+# 2ª solución
+# ===========
+
+# La búsqueda se hace por separado en cada componente conexa del grafo
+# (ya que la anchura mínima del grafo es la mayor de las de sus
+# componentes, que se colocan una tras otra) y, en cada una, en tres
+# pasos:
+#
+# 1. Se calcula una cota superior de la anchura mínima con la
+#    ordenación de Cuthill-McKee: se recorre en anchura cada componente
+#    del grafo, empezando por un vértice de grado mínimo y visitando
+#    los adyacentes de cada vértice en orden creciente de grado. Por
+#    ejemplo,
+#       >>> cuthillMcKee(grafoCiclo(6))
+#       [1, 2, 6, 3, 5, 4]
+#
+# 2. Se calcula una cota inferior con los conjuntos de nivel: si los
+#    vértices a distancia como mucho d de un vértice v son m, entonces
+#    en cualquier ordenación hay uno de ellos a distancia al menos
+#    (m-1)/2 de v en la ordenación y unido a v por un camino de d
+#    aristas, por lo que alguna de esas aristas tiene anchura al menos
+#    (m-1)/(2d). Por ejemplo,
+#       >>> cotaInferior(vecinos(grafoCiclo(6)))
+#       1
+#       >>> cotaInferior(vecinos(completo(5)))
+#       2
+#
+# 3. Para cada k desde la cota inferior hasta la superior, se busca una
+#    ordenación de anchura como mucho k (ver ordenConAnchura), y la
+#    primera k para la que existe es la anchura mínima.
+#
+# En las funciones auxiliares, los grafos se representan por la lista
+# ns de las máscaras de los vecinos de cada vértice y las ordenaciones
+# por listas de índices de vértices.
+
+# componentes(ns) es la lista de las componentes conexas del grafo
+# cuyas máscaras de vecinos son ns. Por ejemplo,
+#    >>> componentes([2, 1, 0, 16, 8])
+#    [[0, 1], [2], [3, 4]]
+def componentes(ns: list[int]) -> list[list[int]]:
+    libres = (1 << len(ns)) - 1
+    cs = []
+    while libres:
+        alcanzados = libres & -libres
+        frontera = alcanzados
+        while frontera:
+            nuevos = 0
+            for x in elementos(frontera):
+                nuevos |= ns[x]
+            frontera = nuevos & ~alcanzados
+            alcanzados |= frontera
+        libres &= ~alcanzados
+        cs.append(elementos(alcanzados))
+    return cs
+
+# restriccion(ns, xs) es la lista de las máscaras de vecinos del
+# subgrafo formado por los vértices xs, renumerados según su posición
+# en xs. Por ejemplo,
+#    >>> restriccion([2, 1, 0, 16, 8], [3, 4])
+#    [2, 1]
+def restriccion(ns: list[int], xs: list[int]) -> list[int]:
+    i = {x: k for (k, x) in enumerate(xs)}
+    return [sum(1 << i[y] for y in elementos(ns[x]) if y in i) for x in xs]
+
+# anchuraIndices(ns, orden) es la anchura con respecto a la ordenación
+# orden del grafo cuyas máscaras de vecinos son ns.
+def anchuraIndices(ns: list[int], orden: list[int]) -> int:
+    posicion = {x: k for (k, x) in enumerate(orden)}
+    return max([0] + [abs(posicion[x] - posicion[y])
+                      for x in orden for y in elementos(ns[x])])
+
+def ordenCuthillMcKee(ns: list[int]) -> list[int]:
+    vecinos_ = [elementos(m) for m in ns]
+    grados = [len(xs) for xs in vecinos_]
+    visitados = [False] * len(ns)
+    orden: list[int] = []
+    for i in sorted(range(len(ns)), key=lambda i: grados[i]):
+        if visitados[i]:
+            continue
+        visitados[i] = True
+        cola = deque([i])
+        while cola:
+            x = cola.popleft()
+            orden.append(x)
+            for y in sorted(vecinos_[x], key=lambda y: grados[y]):
+                if not visitados[y]:
+                    visitados[y] = True
+                    cola.append(y)
+    return orden
+
+def cuthillMcKee(g: Grafo) -> list[Vertice]:
+    vs = nodos(g)
+    return [vs[i] for i in ordenCuthillMcKee(vecinos(g))]
+
+def cotaInferior(ns: list[int]) -> int:
+    cota = 0
+    for v in range(len(ns)):
+        alcanzados = 1 << v
+        frontera = alcanzados
+        d = 0
+        while True:
+            nuevos = 0
+            for x in elementos(frontera):
+                nuevos |= ns[x]
+            nuevos &= ~alcanzados
+            if not nuevos:
+                break
+            d += 1
+            alcanzados |= nuevos
+            frontera = nuevos
+            m = alcanzados.bit_count()
+            cota = max(cota, -(-(m - 1) // (2 * d)))
+    return cota
+
+# ordenConAnchura(ns, k) es una ordenación de anchura como mucho k del
+# grafo conexo cuyas máscaras de vecinos son ns, o None si no existe.
+# Por ejemplo,
+#    >>> ordenConAnchura(vecinos(grafoCiclo(6)), 2)
+#    [0, 1, 5, 2, 4, 3]
+#    >>> ordenConAnchura(vecinos(grafoCiclo(6)), 1)
+#
+# Los vértices se colocan de izquierda a derecha. Si un vértice ya
+# colocado en la posición q tiene vecinos sin colocar, todos ellos
+# tienen que colocarse, como mucho, en la posición q+k (su plazo) y, en
+# general, los vértices sin colocar a distancia d de él (por caminos de
+# vértices sin colocar) tienen que colocarse, como mucho, en la posición
+# q+d*k. Un estado se descarta si, para algún t, hay más vértices con
+# plazo menor o igual que t que posiciones libres hasta t. Además, si
+# para algún t hay exactamente tantos, el siguiente vértice tiene que
+# ser uno de ellos.
+#
+# Además,
+#    + como la inversa de una ordenación de anchura k también lo es,
+#      sólo se buscan las ordenaciones cuyo último vértice es mayor que
+#      el primero; es decir, los vértices menores que el primero tienen
+#      plazo n-2 (en lugar de n-1) y
+#    + antes de colocar un candidato w en la posición p, se comprueba si
+#      el estado al que se llega se descartaría: en él los vecinos de w
+#      sin colocar tienen plazo p+k y los plazos de los demás vértices,
+#      hasta p+2k-1, no cambian, por lo que basta contar los vértices
+#      con plazo hasta cada t. Sin esa comprobación, la mayoría de los
+#      estados que se visitan se descartan nada más llegar a ellos.
+#
+# Los plazos sólo dependen de los vértices colocados, del primero y de
+# los plazos de los vecinos de los colocados (los iniciales), que es lo
+# que se memoriza de los estados descartados.
+def ordenConAnchura(ns: list[int], k: int) -> Optional[list[int]]:
+    n = len(ns)
+    todos = (1 << n) - 1
+    orden: list[int] = []
+    descartados: set[tuple[int, int, tuple[int, ...]]] = set()
+
+    # iniciales(colocados) es la lista de las máscaras de los vecinos sin
+    # colocar de los vértices colocados cuyo plazo es p, p+1, ..., p+k-1
+    # (siendo p el número de vértices colocados).
+    def iniciales(colocados: int) -> tuple[int, ...]:
+        p = len(orden)
+        ultimo = n - 1 - p
+        ms = [0] * min(k, ultimo + 1)
+        alcanzados = colocados
+        for q in range(max(0, p - k), p):
+            m = ns[orden[q]] & ~alcanzados
+            ms[min(q + k - p, ultimo)] |= m
+            alcanzados |= m
+        return tuple(ms)
+
+    # plazos(colocados, ms0) es la lista de las máscaras de los vértices
+    # sin colocar cuyo plazo es p, p+1, ..., n-1, siendo ms0 la de los
+    # plazos iniciales (los plazos mayores que n-1 se reducen a n-1 y los
+    # vértices sin plazo lo tienen n-1). Como los plazos iniciales están
+    # entre p y p+k-1, al recorrer el grafo en anchura en orden creciente
+    # de plazo, cada vértice recibe su menor plazo la primera vez que se
+    # alcanza.
+    def plazos(colocados: int, ms0: tuple[int, ...]) -> list[int]:
+        p = len(orden)
+        ultimo = n - 1 - p
+        ms = list(ms0) + [0] * (ultimo + 1 - len(ms0))
+        alcanzados = colocados
+        for m in ms0:
+            alcanzados |= m
+        for i in range(ultimo):
+            if ms[i]:
+                m = 0
+                for x in elementos(ms[i]):
+                    m |= ns[x]
+                m &= ~alcanzados
+                ms[min(i + k, ultimo)] |= m
+                alcanzados |= m
+        ms[ultimo] |= todos & ~alcanzados
+        if p and ultimo:
+            menores = ms[ultimo] & ((1 << orden[0]) - 1)
+            ms[ultimo] ^= menores
+            ms[ultimo - 1] |= menores
+        return ms
+
+    def busca(colocados: int) -> bool:
+        p = len(orden)
+        if colocados == todos:
+            return True
+        ms0 = iniciales(colocados)
+        clave = (colocados, orden[0] if orden else -1, ms0)
+        if clave in descartados:
+            return False
+        ms = plazos(colocados, ms0)
+        # hasta[i] es la máscara de los vértices con plazo hasta p+i y
+        # ajustado el primer i tal que son i+1.
+        hasta = []
+        acumulado = 0
+        for m in ms:
+            acumulado |= m
+            hasta.append(acumulado)
+        ajustado = -1
+        for (i, m) in enumerate(hasta):
+            c = m.bit_count()
+            if c > i + 1:
+                break
+            if c == i + 1 and ajustado < 0:
+                ajustado = i
+        else:
+            libres = todos & ~colocados
+            for i in range(ajustado + 1):
+                for w in elementos(ms[i]):
+                    b = 1 << w
+                    vs = ns[w] & libres
+                    if any(((hasta[t] | vs) & ~b).bit_count() > t
+                           for t in range(k, min(2 * k, len(ms)))):
+                        continue
+                    orden.append(w)
+                    if busca(colocados | b):
+                        return True
+                    orden.pop()
+        descartados.add(clave)
+        return False
+
+    return orden if busca(0) else None
+
+# ordenDeAnchuraMinima(g) es una ordenación de los vértices de g con la
+# anchura mínima. Por ejemplo,
+#    >>> ordenDeAnchuraMinima(grafoCiclo(6))
+#    [1, 2, 6, 3, 5, 4]
+def ordenDeAnchuraMinima(g: Grafo) -> list[Vertice]:
+    vs = nodos(g)
+    ns = vecinos(g)
+    orden: list[int] = []
+    anchura = 0
+    for xs in componentes(ns):
+        ms = restriccion(ns, xs)
+        mejor = ordenCuthillMcKee(ms)
+        superior = anchuraIndices(ms, mejor)
+        for k in range(max(anchura, cotaInferior(ms)), superior):
+            o = ordenConAnchura(ms, k)
+            if o is not None:
+                mejor = o
+                break
+        anchura = max(anchura, anchuraIndices(ms, mejor))
+        orden.extend(xs[i] for i in mejor)
+    return [vs[i] for i in orden]
+
+def anchuraMinima(g: Grafo) -> int:
+    return anchuraOrden(g, ordenDeAnchuraMinima(g))
+
+# Verificación
+# ============
+
+def test_anchuraMinima() -> None:
+    estrella = creaGrafo_(Orientacion.ND, (1,7),
+                          [(1,2),(1,3),(1,4),(1,5),(1,6),(1,7)])
+    for anchuraMinima_ in [anchuraMinima1, anchuraMinima]:
+        assert anchuraMinima_(grafoCiclo(6)) == 2
+        assert anchuraMinima_(completo(5)) == 4
+        assert anchuraMinima_(estrella) == 3
+    assert anchuraMinima(rejilla(5, 6)) == 5
+    assert anchuraMinima(grafoCiclo(30)) == 2
+    assert anchuraMinima(erdosRenyi(30, 0.3, semilla=510)) == 15
+    print("Verificado")
+
+# La verificación es
+#    >>> test_anchuraMinima()
+#    Verificado
+
+# ---------------------------------------------------------------------
+# Ejercicio 3. Un ciclo hamiltoniano de un grafo es un recorrido (como
+# los del ejercicio 1 de Ejercicios_sobre_grafos.py) tal que cada par
+# de vértices consecutivos es una arista del grafo.
+#
+# Definir la función
+#    cicloHamiltoniano : (Grafo) -> Optional[list[Vertice]]
+# tal que cicloHamiltoniano(g) es un ciclo hamiltoniano del grafo g, si
+# lo tiene, y None en caso contrario. Por ejemplo,
+#    >>> cicloHamiltoniano(rejilla(2, 3))
+#    [1, 4, 5, 6, 3, 2, 1]
+#    >>> cicloHamiltoniano(rejilla(3, 3))
+#    >>> cicloHamiltoniano(petersen)
+# donde petersen es el grafo de Petersen, definido más abajo.
+# ---------------------------------------------------------------------
+
+# 1ª solución
+# ===========
+
+def cicloHamiltoniano1(g: Grafo) -> Optional[list[Vertice]]:
+    for r in recorridos(nodos(g)):
+        if all(aristaEn(g, (x, y)) for (x, y) in zip(r, r[1:])):
+            return r
+    return None
+
+# 2ª solución
+# ===========
+
+# biconexo(ws, m) se verifica si el subgrafo formado por los vértices
+# de la máscara m es conexo y no tiene puntos de articulación (es
+# decir, vértices cuya eliminación lo desconecta), siendo ws[v] la
+# máscara de los vecinos de v. Se calcula con el algoritmo de Tarjan:
+# en un recorrido en profundidad, bajo[v] es el menor orden de visita
+# alcanzable desde los descendientes de v con una arista de retroceso y
+# un vértice u distinto de la raíz es de articulación si tiene un hijo
+# v con bajo[v] >= orden[u]. Por ejemplo,
+#    >>> biconexo(vecinos(grafoCiclo(5)), 0b11111)
+#    True
+#    >>> biconexo(vecinos(rejilla(1, 3)), 0b111)
+#    False
+def biconexo(ws: list[int], m: int) -> bool:
+    r = (m & -m).bit_length() - 1
+    orden = [-1] * len(ws)
+    bajo = [0] * len(ws)
+    orden[r] = 0
+    visitados = 1
+    hijosRaiz = 0
+    pila = [(r, -1, ws[r] & m)]
+    while pila:
+        (v, padre, pendientes) = pila[-1]
+        if pendientes:
+            b = pendientes & -pendientes
+            pila[-1] = (v, padre, pendientes ^ b)
+            w = b.bit_length() - 1
+            if orden[w] >= 0:
+                if w != padre:
+                    bajo[v] = min(bajo[v], orden[w])
+            else:
+                orden[w] = bajo[w] = visitados
+                visitados += 1
+                pila.append((w, v, ws[w] & m))
+                if v == r:
+                    hijosRaiz += 1
+        else:
+            pila.pop()
+            if padre >= 0:
+                bajo[padre] = min(bajo[padre], bajo[v])
+                if padre != r and bajo[v] >= orden[padre]:
+                    return False
+    return visitados == m.bit_count() and hijosRaiz <= 1
+
+# Se construye el ciclo desde el primer vértice, añadiendo en cada paso
+# un adyacente libre del último vértice (primero los que tienen menos
+# adyacentes libres). En cada estado, determinado por el conjunto de los
+# vértices visitados y el último vértice, el resto del ciclo es un
+# camino desde el último hasta el primero que pasa por todos los
+# vértices libres, por lo que en cada vértice libre entra una arista
+# desde un libre o el último y sale otra hacia un libre o el primero.
+# Los posibles extremos de esas aristas determinan las que son
+# obligatorias:
+#    + si el grafo es simétrico (por ejemplo, no dirigido), un vértice
+#      libre que sólo tiene dos posibles vecinos tiene que estar unido a
+#      ambos en el ciclo y
+#    + si no lo es, un vértice libre con un único posible predecesor (o
+#      sucesor) tiene que estar unido a él.
+# El estado se descarta si
+#    + algún vértice libre no tiene posibles vecinos suficientes,
+#    + algún vértice tiene más aristas obligatorias que las que le
+#      quedan en el ciclo,
+#    + las aristas obligatorias forman un ciclo o unen el último vértice
+#      con el primero sin pasar por todos los libres o
+#    + los vértices libres no están conectados entre sí (en el grafo
+#      simétrico) o no son alcanzables desde el último o no alcanzan al
+#      primero (en el no simétrico) o
+#    + en el grafo simétrico, el subgrafo formado por los libres, el
+#      último y el primero, añadiéndole la arista entre estos dos, no es
+#      biconexo (ya que el resto del ciclo con esa arista es un ciclo
+#      hamiltoniano suyo).
+# Si alguna arista obligatoria sale del último vértice, es el único
+# paso posible. Los estados descartados se memorizan.
+def cicloHamiltoniano(g: Grafo) -> Optional[list[Vertice]]:
+    vs = nodos(g)
+    n = len(vs)
+    if n <= 1:
+        return [vs[0], vs[0]] if n == 1 and aristaEn(g, (vs[0], vs[0])) \
+            else None
+    suc = sucesores(g)
+    pre = predecesores(g)
+    simetrico = suc == pre
+    todos = (1 << n) - 1
+    ciclo = [0]
+    descartados: set[tuple[int, int]] = set()
+
+    # alcanzables(ws, x, libres) es la máscara de los vértices libres
+    # alcanzables desde x pasando sólo por libres, siendo ws[y] la
+    # máscara de los adyacentes de y.
+    def alcanzables(ws: list[int], x: int, libres: int) -> int:
+        alcanzados = ws[x] & libres
+        frontera = alcanzados
+        while frontera:
+            nuevos = 0
+            for y in elementos(frontera):
+                nuevos |= ws[y]
+            frontera = nuevos & libres & ~alcanzados
+            alcanzados |= frontera
+        return alcanzados
+
+    # obligatorias(libres, x) es el conjunto de las aristas obligatorias
+    # (como pares (u, v), con u < v si el grafo es simétrico) o None, si
+    # algún vértice libre no tiene posibles vecinos suficientes.
+    def obligatorias(libres: int,
+                     x: int) -> Optional[set[tuple[int, int]]]:
+        aristas: set[tuple[int, int]] = set()
+        for w in elementos(libres):
+            ps = pre[w] & (libres | 1 << x)
+            ss = suc[w] & (libres | 1)
+            if simetrico:
+                ws = ps | ss
+                k = ws.bit_count()
+                if k < 2 and (n > 2 or k == 0):
+                    return None
+                if k == 2:
+                    aristas.update((min(u, w), max(u, w))
+                                   for u in elementos(ws))
+            else:
+                if not ps or not ss or (n > 2 and ps == ss
+                                        and ps.bit_count() == 1):
+                    return None
+                if ps.bit_count() == 1:
+                    aristas.add((ps.bit_length() - 1, w))
+                if ss.bit_count() == 1:
+                    aristas.add((w, ss.bit_length() - 1))
+        return aristas
+
+    # admisibles(libres, x, aristas) se verifica si las aristas
+    # obligatorias caben en el ciclo y no forman ciclos ni unen el
+    # último con el primero antes de tiempo.
+    def admisibles(libres: int,
+                   x: int,
+                   aristas: set[tuple[int, int]]) -> bool:
+        entradas = [0] * n
+        salidas = [0] * n
+        for (u, v) in aristas:
+            salidas[u] += 1
+            entradas[v] += 1
+        for w in elementos(libres | 1 << x | 1):
+            huecos = 1 if w in (0, x) and x != 0 else 2
+            if simetrico:
+                if entradas[w] + salidas[w] > huecos:
+                    return False
+            elif entradas[w] > 1 or salidas[w] > 1:
+                return False
+        if x == 0:
+            return True
+        padre = list(range(n))
+        tamaño = [1] * n
+
+        def raiz(u: int) -> int:
+            while padre[u] != u:
+                padre[u] = padre[padre[u]]
+                u = padre[u]
+            return u
+
+        for (u, v) in aristas:
+            (ru, rv) = (raiz(u), raiz(v))
+            if ru == rv:
+                return False
+            if tamaño[ru] < tamaño[rv]:
+                (ru, rv) = (rv, ru)
+            padre[rv] = ru
+            tamaño[ru] += tamaño[rv]
+        r = raiz(x)
+        return r != raiz(0) or tamaño[r] == libres.bit_count() + 2
+
+    # siguientes(visitados, x) es la máscara de los posibles siguientes
+    # vértices del ciclo desde el estado (visitados, x); es 0 si el
+    # estado se descarta.
+    def siguientes(visitados: int, x: int) -> int:
+        libres = todos & ~visitados
+        aristas = obligatorias(libres, x)
+        if aristas is None or not admisibles(libres, x, aristas):
+            return 0
+        if simetrico:
+            v = (libres & -libres).bit_length() - 1
+            if alcanzables(suc, v, libres) | 1 << v != libres:
+                return 0
+            ws = suc.copy()
+            if x != 0:
+                ws[x] |= 1
+                ws[0] |= 1 << x
+            if not biconexo(ws, libres | 1 << x | 1):
+                return 0
+        elif alcanzables(suc, x, libres) != libres \
+                or alcanzables(pre, 0, libres) != libres:
+            return 0
+        if x != 0:
+            for (u, v) in aristas:
+                if u == x:
+                    return 1 << v
+                if simetrico and v == x:
+                    return 1 << u
+        return suc[x] & libres
+
+    def busca(visitados: int, x: int) -> bool:
+        if visitados == todos:
+            return suc[x] & 1 == 1
+        if (visitados, x) in descartados:
+            return False
+        libres = todos & ~visitados
+        for y in sorted(elementos(siguientes(visitados, x)),
+                        key=lambda y: (suc[y] & libres).bit_count()):
+            ciclo.append(y)
+            if busca(visitados | 1 << y, y):
+                return True
+            ciclo.pop()
+        descartados.add((visitados, x))
+        return False
+
+    if busca(1, 0):
+        return [vs[i] for i in ciclo] + [vs[0]]
+    return None
+
+# Verificación
+# ============
+
+def test_cicloHamiltoniano() -> None:
+    assert cicloHamiltoniano1(rejilla(2, 3)) == [1, 2, 3, 6, 5, 4, 1]
+    assert cicloHamiltoniano(rejilla(2, 3)) == [1, 4, 5, 6, 3, 2, 1]
+    for cicloHamiltoniano_ in [cicloHamiltoniano1, cicloHamiltoniano]:
+        assert cicloHamiltoniano_(rejilla(3, 3)) is None
+        assert cicloHamiltoniano_(grafoCiclo(5)) is not None
+    assert cicloHamiltoniano(petersen) is None
+    assert cicloHamiltoniano(rejilla(5, 6)) is not None
+    assert cicloHamiltoniano(rejilla(5, 5)) is None
+    assert cicloHamiltoniano(erdosRenyi(30, 0.2, semilla=2)) is None
+    g = erdosRenyi(30, 0.25, semilla=36)
+    c = cicloHamiltoniano(g)
+    assert c is not None and esHamiltoniano(g, c)
+    print("Verificado")
+
+# La verificación es
+#    >>> test_cicloHamiltoniano()
+#    Verificado
+
+# ---------------------------------------------------------------------
+# Ejercicio 4. Comprobar con Hypothesis que las dos definiciones de
+# anchuraMinima son equivalentes, que las dos definiciones de
+# cicloHamiltoniano encuentran ciclo en los mismos grafos y que los
+# ciclos que encuentra la segunda son hamiltonianos.
+# ---------------------------------------------------------------------
+
+# esHamiltoniano(g, c) se verifica si c es un ciclo hamiltoniano de g.
+def esHamiltoniano(g: Grafo, c: list[Vertice]) -> bool:
+    return sorted(c[1:]) == nodos(g) \
+        and c[0] == c[-1] \
+        and all(aristaEn(g, (x, y)) for (x, y) in zip(c, c[1:]))
+
+# Como la primera definición recorre todas las permutaciones de los
+# vértices, se usan grafos de hasta 7 vértices. Por ejemplo,
+#    >>> gen_grafoPequeño().example()
+#    G ND ([1, 2, 3, 4], [(1, 2), (2, 4), (3, 3)])
+@composite
+def gen_grafoPequeño(draw: Any) -> Grafo:
+    o = draw(st.sampled_from([Orientacion.D, Orientacion.ND]))
+    n = draw(st.integers(1, 7))
+    as_ = draw(gen_aristas(n))
+    if o == Orientacion.ND:
+        as_ = [(x, y) for (x, y) in as_ if x <= y]
+    return creaGrafo_(o, (1, n), as_)
+
+# La propiedad es
+@settings(deadline=None)
+@given(gen_grafoPequeño())
+def test_anchuraMinima_equiv(g: Grafo) -> None:
+    assert anchuraMinima(g) == anchuraMinima1(g)
+    c = cicloHamiltoniano(g)
+    assert (c is None) == (cicloHamiltoniano1(g) is None)
+    assert c is None or esHamiltoniano(g, c)
+
+# La comprobación es
+#    >>> test_anchuraMinima_equiv()
+#    >>>
+
+# ---------------------------------------------------------------------
+# Grafo de Petersen                                                  --
+# ---------------------------------------------------------------------
+
+# petersen es el grafo de Petersen, que no tiene ciclos hamiltonianos.
+petersen: Grafo = creaGrafo_(Orientacion.ND,
+                             (1, 10),
+                             [(1,2),(2,3),(3,4),(4,5),(5,1),
+                              (1,6),(2,7),(3,8),(4,9),(5,10),
+                              (6,8),(8,10),(10,7),(7,9),(9,6)])
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('anchuraMinima1(rejilla(3, 3))')
+#    4.38 segundos
+#    >>> tiempo('anchuraMinima(rejilla(3, 3))')
+#    0.00 segundos
+#
+#    >>> tiempo('anchuraMinima1(grafoCiclo(10))')
+#    42.63 segundos
+#    >>> tiempo('anchuraMinima(grafoCiclo(10))')
+#    0.00 segundos
+#
+#    >>> tiempo('anchuraMinima(grafoCiclo(30))')
+#    0.01 segundos
+#    >>> tiempo('anchuraMinima(rejilla(5, 6))')
+#    0.01 segundos
+#    >>> tiempo('anchuraMinima(completo(30))')
+#    0.02 segundos
+#
+#    >>> tiempo('cicloHamiltoniano1(petersen)')
+#    18.08 segundos
+#    >>> tiempo('cicloHamiltoniano(petersen)')
+#    0.00 segundos
+#
+#    >>> tiempo('cicloHamiltoniano1(rejilla(3, 3))')
+#    1.77 segundos
+#    >>> tiempo('cicloHamiltoniano(rejilla(3, 3))')
+#    0.00 segundos
+#
+#    >>> tiempo('cicloHamiltoniano(rejilla(5, 6))')
+#    0.01 segundos
+#    >>> tiempo('cicloHamiltoniano(rejilla(5, 5))')
+#    0.03 segundos
+#
+#    >>> tiempo('anchuraMinima(erdosRenyi(30, 0.1))')
+#    0.00 segundos
+#    >>> tiempo('anchuraMinima(erdosRenyi(30, 0.3))')
+#    0.17 segundos
+#    >>> tiempo('cicloHamiltoniano(erdosRenyi(30, 0.15))')
+#    0.00 segundos
+#
+# El tiempo de anchuraMinima depende mucho del grafo. Sin la búsqueda de
+# sólo una de cada par de ordenaciones inversas, sin la comprobación de
+# los candidatos antes de colocarlos y memorizando los k últimos
+# vértices colocados (en lugar de los plazos iniciales), el primero de
+# los siguientes grafos tardaba 60.89 segundos, el segundo 45.44 y el
+# tercero 10.74. Con ellas,
+#    >>> tiempo('anchuraMinima(erdosRenyi(30, 0.25, semilla=17))')
+#    7.15 segundos
+#    >>> tiempo('anchuraMinima(erdosRenyi(30, 0.3, semilla=510))')
+#    1.55 segundos
+#    >>> tiempo('anchuraMinima(erdosRenyi(30, 0.15, semilla=35))')
+#    2.18 segundos
+# En 200 grafos aleatorios de 30 vértices (con las semillas de 0 a 39 y
+# probabilidades 0.1, 0.15, 0.2, 0.25 y 0.3) el tiempo total ha pasado
+# de 310.1 a 47.7 segundos y el mayor (el del primer grafo anterior), de
+# 60.89 a 9.41 segundos (los tiempos de un mismo grafo varían de una
+# ejecución a otra); en los 20 grafos con probabilidad 0.3 y
+# semillas de 500 a 519, el total ha pasado de 123.18 a 6.70 segundos y
+# el mayor (el del segundo), de 45.44 a 1.55 segundos. En la mayoría de
+# los grafos difíciles, el tiempo se emplea en comprobar que no hay
+# ordenaciones de anchura una unidad menor que la mínima; en el primero,
+# en encontrar una de anchura mínima.
+#
+# Los siguientes grafos son difíciles si sólo se comprueba que los
+# vértices libres tienen algún predecesor y algún sucesor y que son
+# alcanzables desde el último: el primero (que no tiene ciclos
+# hamiltonianos porque tiene un vértice de grado 1) no terminaba en 300
+# segundos y el segundo tardaba 19.37 segundos. Con las aristas
+# obligatorias y la comprobación de que no hay puntos de articulación,
+#    >>> tiempo('cicloHamiltoniano(erdosRenyi(30, 0.2, semilla=2))')
+#    0.00 segundos
+#    >>> tiempo('cicloHamiltoniano(erdosRenyi(30, 0.25, semilla=36))')
+#    0.00 segundos
+#    >>> tiempo('cicloHamiltoniano(erdosRenyi(30, 0.15, Orientacion.D, semilla=27))')
+#    0.08 segundos
+#    >>> tiempo('cicloHamiltoniano(erdosRenyi(60, 0.1, semilla=1))')
+#    0.01 segundos
+# En 480 grafos aleatorios de 30 vértices (dirigidos y no dirigidos, con
+# probabilidades entre 0.1 y 0.3) el mayor tiempo ha sido 0.09 segundos.
@@ -48,8 +48,11 @@
 
 from enum import Enum
 from functools import partial
+from timeit import Timer, default_timer
 from typing import Callable, Optional
 
+from src.BusquedaAEstrella import buscaAEstrella
+from src.BusquedaConVisitados import Busqueda1, buscaCamino
 from src.BusquedaEnAnchura import buscaAnchura1
 from src.BusquedaEnEscalada import buscaEscalada
 from src.BusquedaEnProfundidad import buscaProfundidad1
@@ -260,6 +263,184 @@ def fichas(b: Busqueda, m: int, n: int) -> Optional[list[Tablero]]:
         return None
     return [list(reversed(es)) for es in r]
 
+# ---------------------------------------------------------------------
+# Ejercicio 14. En la definición anterior, cada estado contiene el
+# camino recorrido y, para calcular los sucesores, se comprueba que los
+# nuevos tableros no están en el camino.
+#
+# Definir, usando la función buscaCamino de BusquedaConVisitados.py,
+# la función
+#    fichas2 : (Busqueda1[Estado2], int, int) -> Optional[list[Tablero]]
+# tal que fichas2(b, m, n) es el camino desde el tablero inicial hasta
+# el final del problema de las fichas de orden (m,n) obtenido mediante
+# el procedimiento de búsqueda b, en el que los estados son los
+# tableros (de la clase Estado2, ordenados por la heurística) y no se
+# repiten tableros. Por ejemplo,
+#    >>> fichas2(buscaAnchura1, 2, 2)
+#    [[B,B,H,V,V],[H,B,B,V,V],[V,B,B,H,V],[V,H,B,B,V],[V,V,B,B,H],
+#     [V,V,H,B,B]]
+#    >>> fichas2(buscaPM, 2, 2)
+#    [[B,B,H,V,V],[B,H,B,V,V],[B,V,B,H,V],[H,V,B,B,V],[V,H,B,B,V],
+#     [V,V,B,B,H],[V,V,H,B,B]]
+#    >>> fichas2(buscaEscalada, 1, 2)
+#    [[B,H,V,V],[H,B,V,V],[V,B,H,V],[V,H,B,V],[V,V,B,H],[V,V,H,B]]
+#
+# Nótese que, en la búsqueda en escalada, no volver a los tableros ya
+# visitados puede hacer que no se encuentre la solución. Por ejemplo,
+#    >>> fichas2(buscaEscalada, 2, 2)
+#    None
+# ---------------------------------------------------------------------
+
+class Estado2(list[Ficha]):
+    def __lt__(self, e: list[Ficha]) -> bool:
+        return heuristicaT(self) < heuristicaT(e)
+
+def inicial2(m: int, n: int) -> Estado2:
+    return Estado2(tableroInicial(m, n))
+
+def esFinal2(m: int, n: int, e: Estado2) -> bool:
+    return e == tableroFinal(m, n)
+
+def sucesores2(e: Estado2) -> list[Estado2]:
+    return [Estado2(t) for t in tablerosSucesores(e)]
+
+def clave2(e: Estado2) -> tuple[Ficha, ...]:
+    return tuple(e)
+
+def fichas2(b: Busqueda1[Estado2], m: int, n: int) -> Optional[list[Tablero]]:
+    r = buscaCamino(b,
+                    sucesores2,
+                    lambda e: esFinal2(m, n, e),
+                    inicial2(m, n),
+                    clave2)
+    if r is None:
+        return None
+    return [list(e) for e in r]
+
+# ---------------------------------------------------------------------
+# Ejercicio 15. Si cada movimiento tiene coste 1, la heurística
+# heuristicaT no es admisible, ya que un movimiento puede disminuirla en
+# 2 (cuando la ficha salta sobre otras dos).
+#
+# Definir la función
+#    heuristicaA : (Tablero) -> int
+# tal que heuristicaA(t) es la menor cantidad de movimientos
+# necesarios para disminuir heuristicaT(t) hasta 0; es decir, la mitad
+# (redondeada por exceso) de heuristicaT(t). Por ejemplo,
+#    >>> heuristicaA([B,V,B,H,V,V,B])
+#    3
+# ---------------------------------------------------------------------
+
+def heuristicaA(t: Tablero) -> int:
+    return (heuristicaT(t) + 1) // 2
+
+# ---------------------------------------------------------------------
+# Ejercicio 16. Usando el procedimiento de búsqueda A* (de
+# BusquedaAEstrella.py) con la heurística heuristicaA, definir la
+# función
+#    fichas3 : (int, int) -> Optional[list[Tablero]]
+# tal que fichas3(m, n) es una de las soluciones con menor número de
+# movimientos del problema de las fichas de orden (m,n). Por ejemplo,
+#    >>> fichas3(2, 2)
+#    [[B,B,H,V,V],[H,B,B,V,V],[V,B,B,H,V],[V,H,B,B,V],[V,V,B,B,H],
+#     [V,V,H,B,B]]
+#    >>> len(fichas3(4, 4))
+#    17
+# ---------------------------------------------------------------------
+
+def sucesores3(t: Tablero) -> list[tuple[Tablero, int]]:
+    return [(t1, 1) for t1 in tablerosSucesores(t)]
+
+def fichas3(m: int, n: int) -> Optional[list[Tablero]]:
+    final = tableroFinal(m, n)
+    return buscaAEstrella(sucesores3,
+                          lambda t: t == final,
+                          heuristicaA,
+                          tableroInicial(m, n),
+                          tuple)
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#
+#    +-------+-------------------+-------------------+-------------------+
+#    | (m,n) | buscaProfundidad1 | buscaAnchura1     | buscaPM           |
+#    |       | fichas   fichas2  | fichas   fichas2  | fichas   fichas2  |
+#    +-------+-------------------+-------------------+-------------------+
+#    | (3,3) |   0.00      0.00  |   0.97      0.00  |   0.00      0.00  |
+#    | (4,4) | > 200       0.00  | > 200       0.01  |   0.00      0.00  |
+#    | (6,6) |             0.03  |             0.13  |   0.02      0.01  |
+#    +-------+-------------------+-------------------+-------------------+
+#
+# donde las casillas vacías corresponden a los casos que no se han
+# calculado por ser mayores que los anteriores.
+#
+# Por ejemplo,
+#    >>> tiempo('fichas(buscaAnchura1, 3, 3)')
+#    0.97 segundos
+#    >>> tiempo('fichas2(buscaAnchura1, 3, 3)')
+#    0.00 segundos
+
+# nodos(b, m, n) es el número de estados expandidos (es decir, de los
+# que se calculan los sucesores) al calcular fichas2(b, m, n) y
+# nodosAEstrella(m, n) es el correspondiente al calcular fichas3(m,
+# n). Por ejemplo,
+#    >>> nodos(buscaPM, 4, 4)
+#    25
+#    >>> nodosAEstrella(4, 4)
+#    603
+def nodos(b: Busqueda1[Estado2], m: int, n: int) -> int:
+    k = 0
+    def sucesoresContados(e: Estado2) -> list[Estado2]:
+        nonlocal k
+        k += 1
+        return sucesores2(e)
+    buscaCamino(b,
+                sucesoresContados,
+                lambda e: esFinal2(m, n, e),
+                inicial2(m, n),
+                clave2)
+    return k
+
+def nodosAEstrella(m: int, n: int) -> int:
+    k = 0
+    def sucesoresContados(t: Tablero) -> list[tuple[Tablero, int]]:
+        nonlocal k
+        k += 1
+        return sucesores3(t)
+    final = tableroFinal(m, n)
+    buscaAEstrella(sucesoresContados,
+                   lambda t: t == final,
+                   heuristicaA,
+                   tableroInicial(m, n),
+                   tuple)
+    return k
+
+# La comparación de las búsquedas en anchura, por primero el mejor y A*
+# es
+#
+#    +-------+----------------------+----------------------+----------------------+
+#    | (m,n) | Anchura              | Primero el mejor     | A*                   |
+#    |       | Long. Nodos  Tiempo  | Long. Nodos  Tiempo  | Long. Nodos  Tiempo  |
+#    +-------+----------------------+----------------------+----------------------+
+#    | (3,3) |   11    137  0.00 s. |   13     13  0.00 s. |   11    129  0.00 s. |
+#    | (4,4) |   17    625  0.01 s. |   21     25  0.00 s. |   17    603  0.01 s. |
+#    | (5,5) |   25   2765  0.03 s. |   31     38  0.00 s. |   25   2749  0.07 s. |
+#    | (6,6) |   34  12003  0.14 s. |   48     58  0.01 s. |   34  11979  0.39 s. |
+#    +-------+----------------------+----------------------+----------------------+
+#
+# Por tanto, la búsqueda por primero el mejor es la más rápida, pero
+# no encuentra las soluciones más cortas. La búsqueda A* las encuentra
+# pero, con esta heurística tan débil, apenas expande menos nodos que
+# la búsqueda en anchura y cada expansión es más costosa por el cálculo
+# de la heurística.
+
 # Verificación
 # ============
 
@@ -274,6 +455,15 @@ def test_fichas() -> None:
     assert fichas(buscaEscalada, 1, 2) == \
         [[B, H, V, V], [H, B, V, V], [V, B, H, V], [V, H, B, V],
          [V, V, B, H], [V, V, H, B]]
+    assert fichas2(buscaAnchura1, 2, 2) == \
+        [[B, B, H, V, V], [H, B, B, V, V], [V, B, B, H, V], [V, H, B, B, V],
+         [V, V, B, B, H], [V, V, H, B, B]]
+    assert fichas2(buscaPM, 2, 2) == \
+        [[B, B, H, V, V], [B, H, B, V, V], [B, V, B, H, V], [H, V, B, B, V],
+         [V, H, B, B, V], [V, V, B, B, H], [V, V, H, B, B]]
+    assert fichas2(buscaEscalada, 2, 2) is None
+    assert fichas3(2, 2) == fichas2(buscaAnchura1, 2, 2)
+    assert [len(fichas3(m, m) or []) for m in range(1, 5)] == [4, 6, 11, 17]
     print("Verificado")
 
 # La verificación es
@@ -24,7 +24,7 @@
 # Importaciones
 # ---------------------------------------------------------------------
 
-from src.BusquedaEnAnchura import buscaAnchura
+from src.BusquedaEnAnchura import buscaAnchura, iterAnchura
 
 # ---------------------------------------------------------------------
 # Ejercicio 1. Las posiciones de las reinas en el tablero se representan
@@ -121,7 +121,9 @@ def solucionesNR(n: int) -> list[SolNR]:
 # ---------------------------------------------------------------------
 
 def primeraSolucionNR(n: int) -> SolNR:
-    return solucionesNR(n)[0]
+    nInicial: NodoNR = (1,n,[])
+    (_, _, e) = next(iterAnchura(sucesoresNR, esFinalNR, nInicial))
+    return e
 
 # ---------------------------------------------------------------------
 # Ejercicio 8. Definir la función
@@ -144,6 +146,7 @@ def test_nReinas() -> None:
          [(1,1),(2,4),(3,2),(4,5),(5,3)],
          [(1,2),(2,4),(3,1),(4,3),(5,5)]]
     assert nSolucionesNR(5) == 10
+    assert primeraSolucionNR(5) == [(1,1),(2,3),(3,5),(4,2),(5,4)]
     print("Verificado")
 
 # La verificación es
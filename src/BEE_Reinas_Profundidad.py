@@ -20,7 +20,9 @@
 # Importaciones
 # ---------------------------------------------------------------------
 
-from src.BusquedaEnProfundidad import buscaProfundidad
+from timeit import Timer, default_timer
+
+from src.BusquedaEnProfundidad import buscaProfundidad, iterProfundidad
 
 # ---------------------------------------------------------------------
 # Ejercicio 1. Las posiciones de las reinas en el tablero se representan
@@ -118,9 +120,50 @@ def solucionesNR(n: int) -> list[SolNR]:
 #    [(1, 8), (2, 4), (3, 1), (4, 3), (5, 6), (6, 2), (7, 7), (8, 5)]
 # ---------------------------------------------------------------------
 
-def primeraSolucionNR(n: int) -> SolNR:
+# 1ª solución
+# ===========
+
+def primeraSolucionNR1(n: int) -> SolNR:
     return solucionesNR(n)[0]
 
+# 2ª solución
+# ===========
+
+# La búsqueda se detiene en cuanto se encuentra la primera solución, en
+# lugar de calcularlas todas.
+def primeraSolucionNR(n: int) -> SolNR:
+    nInicial: NodoNR = (1,n,[])
+    (_, _, e) = next(iterProfundidad(sucesoresNR, esFinalNR, nInicial))
+    return e
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('primeraSolucionNR1(10)')
+#    0.69 segundos
+#    >>> tiempo('primeraSolucionNR(10)')
+#    0.00 segundos
+#
+# El tiempo hasta la primera solución, para distintos valores de n, es
+#
+#    +----+--------------------+-------------------+
+#    | n  | primeraSolucionNR1 | primeraSolucionNR |
+#    +----+--------------------+-------------------+
+#    |  8 |         0.03 seg.  |        0.00 seg.  |
+#    |  9 |         0.13 seg.  |        0.00 seg.  |
+#    | 10 |         0.69 seg.  |        0.00 seg.  |
+#    | 11 |         4.67 seg.  |        0.00 seg.  |
+#    | 12 |        29.10 seg.  |        0.01 seg.  |
+#    | 13 |       256.16 seg.  |        0.00 seg.  |
+#    | 14 |       769.80 seg.  |        0.08 seg.  |
+#    +----+--------------------+-------------------+
+
 # ---------------------------------------------------------------------
 # Ejercicio 8. Definir la función
 #    nSolucionesNR : (int) -> int
@@ -142,6 +185,8 @@ def test_nReinas() -> None:
          [(1,8),(2,3),(3,1),(4,6),(5,2),(6,5),(7,7),(8,4)],
          [(1,8),(2,2),(3,5),(4,3),(5,1),(6,7),(7,4),(8,6)]]
     assert nSolucionesNR(8) == 92
+    for n in range(4, 9):
+        assert primeraSolucionNR(n) == primeraSolucionNR1(n)
     print("Verificado")
 
 # La verificación es
@@ -32,8 +32,11 @@
 # ---------------------------------------------------------------------
 
 from copy import deepcopy
+from timeit import Timer, default_timer
 from typing import Optional
 
+from src.BusquedaAEstrella import buscaAEstrella
+from src.BusquedaConVisitados import buscaCamino
 from src.BusquedaPrimeroElMejor import buscaPM
 
 # ---------------------------------------------------------------------
@@ -301,6 +304,207 @@ def solucion_8puzzle(t: Tablero) -> Optional[list[Tablero]]:
     ts.reverse()
     return ts
 
+# ---------------------------------------------------------------------
+# Ejercicio 16. En la definición anterior cada estado contiene el
+# camino recorrido desde el tablero inicial y, para calcular los
+# sucesores, se comprueba que los nuevos tableros no están en el
+# camino.
+#
+# Definir, usando la función buscaCamino de BusquedaConVisitados.py,
+# la función
+#    solucion_8puzzle2 : (Tablero) -> Tablero
+# tal que solucion_8puzzle2(t) es una solución del problema del 8
+# puzzle a partir del tablero t en la que los estados son ternas
+# formadas por la heurística, el número de pasos y el tablero (sin el
+# camino recorrido) y no se repiten tableros. Por ejemplo,
+#    >>> solucion_8puzzle2([[8,1,3],[0,2,4],[7,6,5]])
+#    [[[8, 1, 3],
+#      [0, 2, 4],
+#      [7, 6, 5]],
+#     [[0, 1, 3],
+#      [8, 2, 4],
+#      [7, 6, 5]],
+#     [[1, 0, 3],
+#      [8, 2, 4],
+#      [7, 6, 5]],
+#     [[1, 2, 3],
+#      [8, 0, 4],
+#      [7, 6, 5]]]
+#    >>> len(solucion_8puzzle2([[2,6,3],[5,0,4],[1,7,8]]))
+#    21
+# ---------------------------------------------------------------------
+
+Estado2 = tuple[int, int, Tablero]
+
+def inicial2(t: Tablero) -> Estado2:
+    return (heuristica(t), 1, t)
+
+def esFinal2(e: Estado2) -> bool:
+    (_, _, t) = e
+    return t == tableroFinal
+
+def sucesores2(e: Estado2) -> list[Estado2]:
+    (_, n, t) = e
+    return [(heuristica(t1), n+1, t1) for t1 in tablerosSucesores(t)]
+
+def clave2(e: Estado2) -> tuple[int, ...]:
+    (_, _, t) = e
+    return tuple(x for fila in t for x in fila)
+
+def solucion_8puzzle2(t: Tablero) -> Optional[list[Tablero]]:
+    r = buscaCamino(buscaPM, sucesores2, esFinal2, inicial2(t), clave2)
+    if r is None:
+        return None
+    return [t1 for (_, _, t1) in r]
+
+# ---------------------------------------------------------------------
+# Ejercicio 17. La búsqueda por primero el mejor no garantiza que la
+# solución encontrada sea la más corta. Para obtenerla, se usará la
+# búsqueda A* con una heurística admisible. La función heuristica no lo
+# es, ya que también cuenta la distancia del hueco a su posición final.
+#
+# Definir la función
+#    manhattan : (Tablero) -> int
+# tal que manhattan(t) es la suma de las distancias de Manhattan de
+# cada pieza (sin contar el hueco) desde su posición en el tablero t a
+# su posición en el tablero final. Por ejemplo,
+#    >>> manhattan([[2,1,3],[8,0,4],[7,6,5]])
+#    2
+#    >>> manhattan([[1,3,0],[8,2,4],[7,6,5]])
+#    2
+#    >>> heuristica([[1,3,0],[8,2,4],[7,6,5]])
+#    4
+# ---------------------------------------------------------------------
+
+def manhattan(t: Tablero) -> int:
+    return sum((distancia(posicionElemento(t, i),
+                          posicionElemento(tableroFinal, i))
+                for i in range(1, 9)))
+
+# ---------------------------------------------------------------------
+# Ejercicio 18. Usando el procedimiento de búsqueda A* (de
+# BusquedaAEstrella.py) con la heurística manhattan, definir la función
+#    solucion_8puzzle3 : (Tablero) -> Tablero
+# tal que solucion_8puzzle3(t) es una de las soluciones más cortas del
+# problema del 8 puzzle a partir del tablero t. Por ejemplo,
+#    >>> solucion_8puzzle3([[8,1,3],[0,2,4],[7,6,5]])
+#    [[[8, 1, 3],
+#      [0, 2, 4],
+#      [7, 6, 5]],
+#     [[0, 1, 3],
+#      [8, 2, 4],
+#      [7, 6, 5]],
+#     [[1, 0, 3],
+#      [8, 2, 4],
+#      [7, 6, 5]],
+#     [[1, 2, 3],
+#      [8, 0, 4],
+#      [7, 6, 5]]]
+#    >>> len(solucion_8puzzle3([[2,6,3],[5,0,4],[1,7,8]]))
+#    17
+# ---------------------------------------------------------------------
+
+def sucesores3(t: Tablero) -> list[tuple[Tablero, int]]:
+    return [(t1, 1) for t1 in tablerosSucesores(t)]
+
+def clave3(t: Tablero) -> tuple[int, ...]:
+    return tuple(x for fila in t for x in fila)
+
+def solucion_8puzzle3(t: Tablero) -> Optional[list[Tablero]]:
+    return buscaAEstrella(sucesores3,
+                          lambda t1: t1 == tableroFinal,
+                          manhattan,
+                          t,
+                          clave3)
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación de solucion_8puzzle según la implementación de las
+# colas de prioridad elegida en src/TAD/ColaDePrioridad.py es
+#
+#    +---------------------------+----------+--------------+------------+
+#    | Tablero                   | Longitud | Con listas   | Con        |
+#    |                           |          |              | montículos |
+#    +---------------------------+----------+--------------+------------+
+#    | [[2,6,3],[5,0,4],[1,7,8]] |       21 |   4.97 seg.  | 0.01 seg.  |
+#    | [[5,6,7],[4,0,8],[3,2,1]] |       55 | 118.78 seg.  | 0.05 seg.  |
+#    | [[8,7,6],[1,0,5],[2,3,4]] |       51 | > 900 seg.   | 0.91 seg.  |
+#    +---------------------------+----------+--------------+------------+
+#
+# Por ejemplo, con los montículos,
+#    >>> tiempo('solucion_8puzzle([[5,6,7],[4,0,8],[3,2,1]])')
+#    0.05 segundos
+#
+# La comparación de las dos definiciones (con los montículos) es
+#
+#    +---------------------------+----------+-------------------+--------------------+
+#    | Tablero                   | Longitud | solucion_8puzzle  | solucion_8puzzle2  |
+#    +---------------------------+----------+-------------------+--------------------+
+#    | [[2,6,3],[5,0,4],[1,7,8]] |       21 |        0.01 seg.  |         0.00 seg.  |
+#    | [[5,6,7],[4,0,8],[3,2,1]] |       55 |        0.02 seg.  |         0.02 seg.  |
+#    | [[8,7,6],[1,0,5],[2,3,4]] |       51 |        0.51 seg.  |         0.02 seg.  |
+#    | [[0,8,7],[6,5,4],[3,2,1]] | sin sol. |     > 1200 seg.   |        10.28 seg.  |
+#    +---------------------------+----------+-------------------+--------------------+
+#
+# En los tres primeros casos las dos definiciones obtienen la misma
+# solución. El último tablero no tiene solución; con la primera
+# definición se exploran indefinidamente caminos distintos que pasan
+# por los mismos tableros, mientras que con la segunda se termina
+# después de visitar todos los tableros alcanzables.
+
+# nodosPM(t) es el número de estados expandidos (es decir, de los que
+# se calculan los sucesores) al buscar la solución a partir de t con
+# solucion_8puzzle2 y nodosAEstrella(t) es el correspondiente con
+# solucion_8puzzle3. Por ejemplo,
+#    >>> nodosPM([[2,6,3],[5,0,4],[1,7,8]])
+#    96
+#    >>> nodosAEstrella([[2,6,3],[5,0,4],[1,7,8]])
+#    67
+def nodosPM(t: Tablero) -> int:
+    n = 0
+    def sucesoresContados(e: Estado2) -> list[Estado2]:
+        nonlocal n
+        n += 1
+        return sucesores2(e)
+    buscaCamino(buscaPM, sucesoresContados, esFinal2, inicial2(t), clave2)
+    return n
+
+def nodosAEstrella(t: Tablero) -> int:
+    n = 0
+    def sucesoresContados(t1: Tablero) -> list[tuple[Tablero, int]]:
+        nonlocal n
+        n += 1
+        return sucesores3(t1)
+    buscaAEstrella(sucesoresContados,
+                   lambda t1: t1 == tableroFinal,
+                   manhattan,
+                   t,
+                   clave3)
+    return n
+
+# La comparación de la búsqueda por primero el mejor y la búsqueda A*
+# es
+#
+#    +---------------------------+----------------------+----------------------+
+#    | Tablero                   | Primero el mejor     | A*                   |
+#    |                           | Long. Nodos  Tiempo  | Long. Nodos  Tiempo  |
+#    +---------------------------+----------------------+----------------------+
+#    | [[2,6,3],[5,0,4],[1,7,8]] |   21     96  0.00 s. |   17     67  0.00 s. |
+#    | [[5,6,7],[4,0,8],[3,2,1]] |   55    319  0.02 s. |   31   2263  0.08 s. |
+#    | [[8,7,6],[1,0,5],[2,3,4]] |   51    419  0.02 s. |   29   6816  0.26 s. |
+#    +---------------------------+----------------------+----------------------+
+#
+# Es decir, la búsqueda A* encuentra las soluciones más cortas, pero en
+# los casos difíciles tiene que expandir más nodos que la búsqueda por
+# primero el mejor, que se dirige directamente hacia una solución
+# (aunque no sea la óptima).
+
 # Verificación
 # ============
 
@@ -310,6 +514,14 @@ def test_8puzzle() -> None:
          [[0, 1, 3], [8, 2, 4], [7, 6, 5]],
          [[1, 0, 3], [8, 2, 4], [7, 6, 5]],
          [[1, 2, 3], [8, 0, 4], [7, 6, 5]]]
+    assert solucion_8puzzle2([[8,1,3],[0,2,4],[7,6,5]]) == \
+        solucion_8puzzle([[8,1,3],[0,2,4],[7,6,5]])
+    assert solucion_8puzzle3([[8,1,3],[0,2,4],[7,6,5]]) == \
+        solucion_8puzzle([[8,1,3],[0,2,4],[7,6,5]])
+    assert manhattan([[1,3,0],[8,2,4],[7,6,5]]) == 2
+    assert [len(solucion_8puzzle3(t) or [])
+            for t in [[[2,6,3],[5,0,4],[1,7,8]],
+                      [[5,6,7],[4,0,8],[3,2,1]]]] == [17, 31]
     print("Verificado")
 
 # La verificación es
@@ -0,0 +1,104 @@
+# BusquedaAEstrella.py
+# Búsqueda A*.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# En la búsqueda por primero el mejor (BusquedaPrimeroElMejor.py) los
+# estados se ordenan sólo por la heurística, por lo que la solución
+# encontrada no tiene que ser la de menor coste.
+#
+# En la búsqueda A* cada paso tiene un coste y los estados se ordenan
+# por f(e) = g(e) + h(e), donde g(e) es el coste del camino desde el
+# estado inicial hasta e y h(e) es la heurística de e (una estimación
+# del coste desde e hasta un estado final). Si la heurística es
+# admisible (es decir, nunca supera el coste real), la primera solución
+# encontrada es óptima.
+#
+# Definir la función
+#    buscaAEstrella(Callable[[A], list[tuple[A, int]]],
+#                   Callable[[A], bool],
+#                   Callable[[A], int],
+#                   A,
+#                   Optional[Callable[[A], Hashable]]) -> Optional[list[A]]
+# tal que buscaAEstrella(s, o, h, e, k) es el camino desde el estado
+# inicial e hasta la primera solución del problema de espacio de
+# estados definido por la función sucesores s (que a cada estado le
+# asigna la lista de los pares formados por sus sucesores y el coste
+# de pasar a cada uno de ellos), el objetivo o y la heurística h,
+# obtenida mediante búsqueda A*. Los estados se identifican por su
+# clave k (por defecto, el propio estado). Por ejemplo,
+#    >>> buscaAEstrella(lambda x: [(x+1, 1), (2*x, 3)], lambda x: x == 10, lambda x: 0, 1)
+#    [1, 2, 3, 4, 5, 10]
+#    >>> buscaAEstrella(lambda x: [(x+1, 1), (2*x, 1)], lambda x: x == 10, lambda x: 0, 1)
+#    [1, 2, 4, 5, 10]
+#    >>> buscaAEstrella(lambda x: [(x+1, 1)] if x < 5 else [], lambda x: x == 10, lambda x: 0, 1)
+#    None
+#
+# Para cada estado se guarda el menor coste conocido y su padre. Cuando
+# se encuentra un camino mejor hasta un estado, se inserta de nuevo en
+# la cola de prioridad y la entrada anterior se descarta al sacarla
+# (borrado perezoso).
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from src.TAD.ColaDePrioridad import (CPrioridad, esVacia, inserta, primero,
+                                     resto, vacia)
+
+A = TypeVar('A')
+
+class _Nodo(Generic[A]):
+    __slots__ = ('f', 'h', 'g', 'estado')
+
+    def __init__(self, g: int, h: int, estado: A) -> None:
+        self.f = g + h
+        self.h = h
+        self.g = g
+        self.estado = estado
+
+    def __lt__(self, otro: _Nodo[A]) -> bool:
+        """
+        Se ordenan por f y, en caso de empate, por la heurística (para
+        expandir antes los más cercanos a una solución).
+        """
+        return (self.f, self.h) < (otro.f, otro.h)
+
+def buscaAEstrella(sucesores: Callable[[A], list[tuple[A, int]]],
+                   esFinal: Callable[[A], bool],
+                   heuristica: Callable[[A], int],
+                   inicial: A,
+                   clave: Optional[Callable[[A], Hashable]] = None
+                   ) -> Optional[list[A]]:
+    k: Callable[[A], Hashable] = clave if clave is not None else lambda x: x
+    costes: dict[Hashable, int] = {k(inicial): 0}
+    padres: dict[Hashable, Optional[A]] = {k(inicial): None}
+    c: CPrioridad[_Nodo[A]] = inserta(_Nodo(0, heuristica(inicial), inicial),
+                                      vacia())
+
+    while not esVacia(c):
+        nd = primero(c)
+        c = resto(c)
+        x = nd.estado
+        if nd.g > costes[k(x)]:
+            continue
+        if esFinal(x):
+            camino = []
+            y: Optional[A] = x
+            while y is not None:
+                camino.append(y)
+                y = padres[k(y)]
+            camino.reverse()
+            return camino
+        for (y1, coste) in sucesores(x):
+            g = nd.g + coste
+            k1 = k(y1)
+            if k1 not in costes or g < costes[k1]:
+                costes[k1] = g
+                padres[k1] = x
+                c = inserta(_Nodo(g, heuristica(y1), y1), c)
+
+    return None
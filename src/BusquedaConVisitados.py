@@ -0,0 +1,114 @@
+# BusquedaConVisitados.py
+# Búsqueda con conjunto de estados visitados.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# ---------------------------------------------------------------------
+# En los problemas de espacios de estados en los que se pueden repetir
+# los estados (por ejemplo, el 8-puzzle, el de las jarras o el de las
+# fichas), se suele guardar en cada estado el camino recorrido desde el
+# estado inicial y comprobar que los sucesores no están en él. Cada
+# comprobación tiene un coste lineal en la longitud del camino y, además,
+# se vuelven a explorar los estados a los que se llega por caminos
+# distintos.
+#
+# Una alternativa es guardar en un diccionario los estados visitados
+# (identificados por una clave) junto con el estado desde el que se
+# llegó a cada uno (su padre). De esta forma, la comprobación de si un
+# estado ya se ha visitado tiene coste constante y el camino hasta un
+# estado se reconstruye al final siguiendo los padres.
+#
+# Se define la clase Visitados con los siguientes métodos:
+#    + sucesores(s) es la función que a cada estado x le asigna la lista
+#      de sus sucesores (según s) que no se han visitado; además, los
+#      marca como visitados con padre x.
+#    + camino(x) es el camino desde el estado inicial hasta x.
+#
+# Además, se definen las funciones
+#    buscaCamino(Busqueda1, Callable[[A], list[A]], Callable[[A], bool], A,
+#                Callable[[A], Hashable]) -> Optional[list[A]]
+#    buscaCaminos(Busqueda, Callable[[A], list[A]], Callable[[A], bool], A,
+#                 Callable[[A], Hashable]) -> list[list[A]]
+# tales que
+# + buscaCamino(b, s, o, e, k) es el camino hasta la solución del
+#   problema de espacio de estado definido por la función sucesores s,
+#   el objetivo o y estado inicial e obtenida con el procedimiento de
+#   búsqueda b (por ejemplo, buscaAnchura1 o buscaPM) sin repetir
+#   estados, identificados por la clave k.
+# + buscaCaminos(b, s, o, e, k) es la lista de caminos hasta las
+#   soluciones del problema obtenidas con el procedimiento de búsqueda
+#   b (por ejemplo, buscaAnchura o buscaProfundidad) sin repetir
+#   estados.
+# Por ejemplo,
+#    >>> from src.BusquedaEnAnchura import buscaAnchura, buscaAnchura1
+#    >>> buscaCamino(buscaAnchura1, lambda x: [x+1, 2*x], lambda x: x == 10, 1, lambda x: x)
+#    [1, 2, 4, 5, 10]
+#    >>> buscaCaminos(buscaAnchura, lambda x: [x+1, 2*x] if x < 10 else [], lambda x: x >= 9, 1, lambda x: x)
+#    [[1, 2, 3, 6, 12], [1, 2, 4, 5, 10], [1, 2, 4, 8, 9], [1, 2, 4, 8, 16],
+#     [1, 2, 3, 6, 7, 14]]
+# ---------------------------------------------------------------------
+
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+A = TypeVar('A')
+
+class Visitados(Generic[A]):
+    def __init__(self, clave: Callable[[A], Hashable], inicial: A) -> None:
+        self.clave = clave
+        self.padres: dict[Hashable, Optional[A]] = {clave(inicial): None}
+
+    def sucesores(self,
+                  sucesores: Callable[[A], list[A]]) -> Callable[[A], list[A]]:
+        """
+        Devuelve la función que a cada estado x le asigna la lista de
+        sus sucesores no visitados, marcándolos como visitados con
+        padre x.
+        """
+        def nuevos(x: A) -> list[A]:
+            ys = []
+            for y in sucesores(x):
+                k = self.clave(y)
+                if k not in self.padres:
+                    self.padres[k] = x
+                    ys.append(y)
+            return ys
+        return nuevos
+
+    def camino(self, x: A) -> list[A]:
+        """
+        Devuelve el camino desde el estado inicial hasta el estado x.
+        """
+        xs = []
+        y: Optional[A] = x
+        while y is not None:
+            xs.append(y)
+            y = self.padres[self.clave(y)]
+        xs.reverse()
+        return xs
+
+Busqueda1 = Callable[[Callable[[A], list[A]], Callable[[A], bool], A],
+                     Optional[A]]
+
+Busqueda = Callable[[Callable[[A], list[A]], Callable[[A], bool], A],
+                    list[A]]
+
+def buscaCamino(busca: Busqueda1[A],
+                sucesores: Callable[[A], list[A]],
+                esFinal: Callable[[A], bool],
+                inicial: A,
+                clave: Callable[[A], Hashable]) -> Optional[list[A]]:
+    v = Visitados(clave, inicial)
+    x = busca(v.sucesores(sucesores), esFinal, inicial)
+    if x is None:
+        return None
+    return v.camino(x)
+
+def buscaCaminos(busca: Busqueda[A],
+                 sucesores: Callable[[A], list[A]],
+                 esFinal: Callable[[A], bool],
+                 inicial: A,
+                 clave: Callable[[A], Hashable]) -> list[list[A]]:
+    v = Visitados(clave, inicial)
+    return [v.camino(x)
+            for x in busca(v.sucesores(sucesores), esFinal, inicial)]
@@ -15,9 +15,15 @@
 # + un nodo objetivo que es la solución.
 #
 # Definir las funciones
+#    iterAnchura(Callable[[A], list[A]], Callable[[A], bool], A) -> Iterator[A]
 #    buscaAnchura(Callable[[A], list[A]], Callable[[A], bool], A) -> list[A]
 #    buscaAnchura1(Callable[[A], list[A]], Callable[[A], bool], A) -> Optional[A]
 # tales que
+# + iterAnchura(s, o, e) es el generador de las soluciones del
+#   problema de espacio de estado definido por la función sucesores s,
+#   el objetivo o y estado inicial e obtenidas mediante búsqueda en
+#   anchura. Las soluciones se generan a medida que se encuentran, por
+#   lo que se puede dejar de buscar en cualquier momento.
 # + buscaAnchura(s, o, e) es la lista de soluciones del
 #   problema de espacio de estado definido por la función sucesores s,
 #   el objetivo o y estado inicial e obtenidas mediante búsqueda en
@@ -26,43 +32,45 @@
 #   problema de espacio de estado definido por la función sucesores s,
 #   el objetivo o y estado inicial e obtenidas mediante búsqueda en
 #   anchura.
+#
+# Las funciones tienen un argumento opcional, clave, que es una función que
+# asigna a cada estado un valor hashable. Si se indica, se guarda el
+# conjunto de las claves de los estados visitados y no se vuelven a
+# explorar los estados ya visitados (ver BusquedaConVisitados.py).
 # ---------------------------------------------------------------------
 
 from functools import reduce
-from sys import setrecursionlimit
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Hashable, Iterator, Optional, TypeVar
 
+from src.BusquedaConVisitados import Visitados
 from src.TAD.cola import Cola, esVacia, inserta, primero, resto, vacia
 
 A = TypeVar('A')
 
-setrecursionlimit(10**6)
-
-def buscaAnchura(sucesores: Callable[[A], list[A]],
-                 esFinal: Callable[[A], bool],
-                 inicial: A) -> list[A]:
-    def aux(p: Cola[A]) -> list[A]:
-        if esVacia(p):
-            return []
-        if esFinal(primero(p)):
-            return [primero(p)] + aux(resto(p))
-        return aux(reduce(lambda x, y: inserta(y, x),
-                          sucesores(primero(p)),
-                          resto(p)))
-
-    return aux(inserta(inicial, vacia()))
-
-def buscaAnchura1(sucesores: Callable[[A], list[A]],
-                  esFinal: Callable[[A], bool],
-                  inicial: A) -> Optional[A]:
+def iterAnchura(sucesores: Callable[[A], list[A]],
+                esFinal: Callable[[A], bool],
+                inicial: A,
+                clave: Optional[Callable[[A], Hashable]] = None) -> Iterator[A]:
+    if clave is not None:
+        sucesores = Visitados(clave, inicial).sucesores(sucesores)
     c: Cola[A] = inserta(inicial, vacia())
 
     while not esVacia(c):
         pc = primero(c)
+        c = resto(c)
         if esFinal(pc):
-            return pc
+            yield pc
+        else:
+            c = reduce(lambda x, y: inserta(y, x), sucesores(pc), c)
 
-        es = sucesores(pc)
-        c = reduce(lambda x, y: inserta(y, x), es, resto(c))
+def buscaAnchura(sucesores: Callable[[A], list[A]],
+                 esFinal: Callable[[A], bool],
+                 inicial: A,
+                 clave: Optional[Callable[[A], Hashable]] = None) -> list[A]:
+    return list(iterAnchura(sucesores, esFinal, inicial, clave))
 
-    return None
+def buscaAnchura1(sucesores: Callable[[A], list[A]],
+                  esFinal: Callable[[A], bool],
+                  inicial: A,
+                  clave: Optional[Callable[[A], Hashable]] = None) -> Optional[A]:
+    return next(iterAnchura(sucesores, esFinal, inicial, clave), None)
@@ -15,9 +15,15 @@
 # + un nodo objetivo que es la solución.
 #
 # Definir las funciones
+#    iterProfundidad(Callable[[A], list[A]], Callable[[A], bool], A) -> Iterator[A]
 #    buscaProfundidad(Callable[[A], list[A]], Callable[[A], bool], A) -> list[A]
 #    buscaProfundidad1(Callable[[A], list[A]], Callable[[A], bool], A) -> Optional[A]
 # tales que
+# + iterProfundidad(s, o, e) es el generador de las soluciones del
+#   problema de espacio de estado definido por la función sucesores s,
+#   el objetivo o y estado inicial e obtenidas mediante búsqueda en
+#   profundidad. Las soluciones se generan a medida que se encuentran,
+#   por lo que se puede dejar de buscar en cualquier momento.
 # + buscaProfundidad(s, o, e) es la lista de soluciones del
 #   problema de espacio de estado definido por la función sucesores s,
 #   el objetivo o y estado inicial e obtenidas mediante búsqueda en
@@ -26,43 +32,45 @@
 #   problema de espacio de estado definido por la función sucesores s,
 #   el objetivo o y estado inicial e obtenidas mediante búsqueda en
 #   profundidad.
+#
+# Las funciones tienen un argumento opcional, clave, que es una función que
+# asigna a cada estado un valor hashable. Si se indica, se guarda el
+# conjunto de las claves de los estados visitados y no se vuelven a
+# explorar los estados ya visitados (ver BusquedaConVisitados.py).
 # ---------------------------------------------------------------------
 
 from functools import reduce
-from sys import setrecursionlimit
-from typing import Callable, Optional, TypeVar
+from typing import Callable, Hashable, Iterator, Optional, TypeVar
 
+from src.BusquedaConVisitados import Visitados
 from src.TAD.pila import Pila, apila, cima, desapila, esVacia, vacia
 
 A = TypeVar('A')
 
-setrecursionlimit(10**6)
-
-def buscaProfundidad(sucesores: Callable[[A], list[A]],
-                     esFinal: Callable[[A], bool],
-                     inicial: A) -> list[A]:
-    def aux(p: Pila[A]) -> list[A]:
-        if esVacia(p):
-            return []
-        if esFinal(cima(p)):
-            return [cima(p)] + aux(desapila(p))
-        return aux(reduce(lambda x, y: apila(y, x),
-                          sucesores(cima(p)),
-                          desapila(p)))
-
-    return aux(apila(inicial, vacia()))
-
-def buscaProfundidad1(sucesores: Callable[[A], list[A]],
-                      esFinal: Callable[[A], bool],
-                      inicial: A) -> Optional[A]:
+def iterProfundidad(sucesores: Callable[[A], list[A]],
+                    esFinal: Callable[[A], bool],
+                    inicial: A,
+                    clave: Optional[Callable[[A], Hashable]] = None) -> Iterator[A]:
+    if clave is not None:
+        sucesores = Visitados(clave, inicial).sucesores(sucesores)
     p: Pila[A] = apila(inicial, vacia())
 
     while not esVacia(p):
         cp = cima(p)
+        p = desapila(p)
         if esFinal(cp):
-            return cp
+            yield cp
+        else:
+            p = reduce(lambda x, y: apila(y, x), sucesores(cp), p)
 
-        es = sucesores(cp)
-        p = reduce(lambda x, y: apila(y, x), es, desapila(p))
+def buscaProfundidad(sucesores: Callable[[A], list[A]],
+                     esFinal: Callable[[A], bool],
+                     inicial: A,
+                     clave: Optional[Callable[[A], Hashable]] = None) -> list[A]:
+    return list(iterProfundidad(sucesores, esFinal, inicial, clave))
 
-    return None
+def buscaProfundidad1(sucesores: Callable[[A], list[A]],
+                      esFinal: Callable[[A], bool],
+                      inicial: A,
+                      clave: Optional[Callable[[A], Hashable]] = None) -> Optional[A]:
+    return next(iterProfundidad(sucesores, esFinal, inicial, clave), None)
@@ -14,14 +14,20 @@
 # tal que buscaPM(s, o, e) es la primera de las soluciones del problema de
 # espacio de estado definido por la función sucesores s, el objetivo
 # o y estado inicial e, obtenidas buscando por primero el mejor.
+#
+# La función tiene un argumento opcional, clave, que es una función que
+# asigna a cada estado un valor hashable. Si se indica, se guarda el
+# conjunto de las claves de los estados visitados y no se vuelven a
+# explorar los estados ya visitados (ver BusquedaConVisitados.py).
 # ---------------------------------------------------------------------
 
 from __future__ import annotations
 
 from abc import abstractmethod
 from functools import reduce
-from typing import Callable, Optional, Protocol, TypeVar
+from typing import Callable, Hashable, Optional, Protocol, TypeVar
 
+from src.BusquedaConVisitados import Visitados
 from src.TAD.ColaDePrioridad import (CPrioridad, esVacia, inserta, primero,
                                      resto, vacia)
 
@@ -35,7 +41,10 @@ A = TypeVar('A', bound=Comparable)
 
 def buscaPM(sucesores: Callable[[A], list[A]],
             esFinal: Callable[[A], bool],
-            inicial: A) -> Optional[A]:
+            inicial: A,
+            clave: Optional[Callable[[A], Hashable]] = None) -> Optional[A]:
+    if clave is not None:
+        sucesores = Visitados(clave, inicial).sucesores(sucesores)
     c: CPrioridad[A] = inserta(inicial, vacia())
 
     while not esVacia(c):
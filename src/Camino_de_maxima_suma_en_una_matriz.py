@@ -41,8 +41,17 @@
 from collections import defaultdict
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given
+from hypothesis import strategies as st
 
 from src.Caminos_en_una_matriz import caminos1, caminos2
+from src.Maxima_suma_de_los_caminos_en_una_matriz import (
+    elementos, matrices, matrizSumable, siguienteFilaMaxSuma)
+from src.ProgramacionDinamica import AlmacenVentana, programacionDinamica
 
 setrecursionlimit(10**6)
 
@@ -116,6 +125,71 @@ def diccionarioCaminoMaxSuma(p: list[list[int]]) -> dict[tuple[int, int], tuple[
                 q[(i,j)] = (k2 + p[i-1][j-1], [p[i-1][j-1]] + ys)
     return q
 
+# 4ª definición de caminoMaxSuma (con programacionDinamica)
+# =========================================================
+
+# Se usa el procedimiento genérico de ProgramacionDinamica.py guardando
+# sólo dos filas de pares (suma, camino) como los de
+# diccionarioCaminoMaxSuma.
+def caminoMaxSuma4(p: list[list[int]]) -> list[int]:
+    def calcula(t: Callable[[tuple[int, int]], tuple[int, list[int]]],
+                q: tuple[int, int]) -> tuple[int, list[int]]:
+        (i, j) = q
+        x = p[i-1][j-1]
+        if (i, j) == (1, 1):
+            return (x, [x])
+        if i == 1:
+            (k, xs) = t((1, j-1))
+            return (k + x, [x] + xs)
+        if j == 1:
+            (k, xs) = t((i-1, 1))
+            return (k + x, [x] + xs)
+        (k1, xs) = t((i, j-1))
+        (k2, ys) = t((i-1, j))
+        if k1 > k2:
+            return (k1 + x, [x] + xs)
+        return (k2 + x, [x] + ys)
+
+    m = len(p)
+    n = len(p[0])
+    t = programacionDinamica(calcula, ((1, 1), (m, n)), AlmacenVentana)
+    return list(reversed(t((m, n))[1]))
+
+# 5ª definición de caminoMaxSuma (con numpy, por filas)
+# =====================================================
+
+# Se calculan las filas de las máximas sumas como en maximaSuma6 de
+# "Máxima suma de los caminos en una matriz" y, para cada fila, la
+# máscara de las posiciones a las que el camino de máxima suma llega
+# desde arriba (en lugar de desde la izquierda), con los mismos
+# desempates que diccionarioCaminoMaxSuma. Las máscaras se guardan
+# empaquetadas con np.packbits (un bit por posición), por lo que una
+# matriz de 10000x10000 sólo necesita 12.5 MB de direcciones. El camino
+# se reconstruye al final recorriendo las direcciones desde la última
+# posición.
+def caminoMaxSuma5(p: npt.NDArray[np.int_]) -> list[int]:
+    (a, tipo) = matrizSumable(p)
+    (m, n) = a.shape
+    direcciones = np.zeros((m, (n + 7) // 8), dtype=np.uint8)
+    q = np.cumsum(a[0], dtype=tipo)
+    for i in range(1, m):
+        r = siguienteFilaMaxSuma(q, a[i])
+        arriba = np.ones(n, dtype=bool)
+        arriba[1:] = q[1:] >= r[:-1]
+        direcciones[i] = np.packbits(arriba)
+        q = r
+    (i, j) = (m - 1, n - 1)
+    filas = [i]
+    columnas = [j]
+    while (i, j) != (0, 0):
+        if i > 0 and (direcciones[i, j >> 3] >> (7 - (j & 7))) & 1:
+            i -= 1
+        else:
+            j -= 1
+        filas.append(i)
+        columnas.append(j)
+    return a[filas[::-1], columnas[::-1]].tolist()  # type: ignore[no-any-return]
+
 # Comparación de eficiencia
 # =========================
 
@@ -131,6 +205,21 @@ def tiempo(e: str) -> None:
 #    0.65 segundos
 #    >>> tiempo('caminoMaxSuma3([list(range(11*n+1, 11*(n+1)+1)) for n in range(12)])')
 #    0.00 segundos
+#    >>> tiempo('caminoMaxSuma4([list(range(11*n+1, 11*(n+1)+1)) for n in range(12)])')
+#    0.00 segundos
+#
+#    >>> tiempo('caminoMaxSuma3([list(range(300*n+1, 300*(n+1)+1)) for n in range(300)])')
+#    0.47 segundos
+#    >>> tiempo('caminoMaxSuma4([list(range(300*n+1, 300*(n+1)+1)) for n in range(300)])')
+#    0.24 segundos
+#    >>> tiempo('caminoMaxSuma5([list(range(300*n+1, 300*(n+1)+1)) for n in range(300)])')
+#    0.01 segundos
+#
+#    >>> tiempo('caminoMaxSuma5(np.random.default_rng(0).integers(0, 100, (10**4, 10**4), dtype=np.int8))')
+#    2.54 segundos
+#
+# En el último ejemplo, la memoria usada por caminoMaxSuma5 (además de la
+# de la matriz) es de 13 MB.
 
 # Verificación
 # ============
@@ -142,8 +231,30 @@ def test_caminoMaxSuma() -> None:
         [1, 7, 12, 8, 4, 9]
     assert caminoMaxSuma3([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == \
         [1, 7, 12, 8, 4, 9]
+    assert caminoMaxSuma4([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == \
+        [1, 7, 12, 8, 4, 9]
+    assert caminoMaxSuma5([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == \
+        [1, 7, 12, 8, 4, 9]
+    assert caminoMaxSuma5([[1.5,2.5],[3.5,4.5]]) == [1.5, 3.5, 4.5]
+    assert caminoMaxSuma5([[2**62,2**62],[2**62,1]]) == [2**62, 2**62, 1]
+    assert caminoMaxSuma5([[10**20]]) == [10**20]
+    assert caminoMaxSuma5(np.array([[2**55+1,2],[3,2**55+1]],
+                                   dtype=np.uint64)) == [2**55+1, 3, 2**55+1]
     print("Verificado")
 
 # La verificación es
 #    >>> test_caminoMaxSuma()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+# Las matrices son las de la propiedad de maximaSuma6.
+@given(st.sampled_from(elementos).flatmap(matrices))
+def test_caminoMaxSuma_equiv(m: list[list[float]]) -> None:
+    assert caminoMaxSuma5(m) == caminoMaxSuma3(m)  # type: ignore[arg-type]
+
+# La comprobación es
+#    >>> test_caminoMaxSuma_equiv()
+#    >>>
@@ -45,8 +45,15 @@
 # ---------------------------------------------------------------------
 
 from collections import defaultdict
+from math import comb
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Callable, Iterator
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.ProgramacionDinamica import AlmacenVentana, programacionDinamica
 
 setrecursionlimit(10**6)
 
@@ -117,6 +124,121 @@ def diccionarioCaminos(p: list[list[int]]) -> dict[tuple[int, int], list[list[in
                 q[(i, j)] = [[p[i-1][j-1]] + cs for cs in q[(i-1, j)] + q[(i, j-1)]]
     return q
 
+# 3ª solución (con programacionDinamica)
+# ======================================
+
+# Se usa el procedimiento genérico de ProgramacionDinamica.py guardando
+# sólo dos filas de las listas de caminos de diccionarioCaminos.
+def caminos3(p: list[list[int]]) -> list[list[int]]:
+    def calcula(t: Callable[[tuple[int, int]], list[list[int]]],
+                q: tuple[int, int]) -> list[list[int]]:
+        (i, j) = q
+        if i == 1:
+            return [[p[0][z-1] for z in range(j, 0, -1)]]
+        if j == 1:
+            return [[p[z-1][0] for z in range(i, 0, -1)]]
+        return [[p[i-1][j-1]] + cs for cs in t((i-1, j)) + t((i, j-1))]
+
+    m = len(p)
+    n = len(p[0])
+    t = programacionDinamica(calcula, ((1, 1), (m, n)), AlmacenVentana)
+    return [list(reversed(xs)) for xs in t((m, n))]
+
+# ---------------------------------------------------------------------
+# Generación perezosa, numeración y número de caminos
+# ---------------------------------------------------------------------
+
+# Las definiciones anteriores construyen todos los caminos, que son
+# C(m+n-2, m-1) en una matriz de orden mxn (por ejemplo, 705432 en una
+# de 12x12). Para recorrerlos o elegir algunos de ellos, no hace falta
+# construirlos todos.
+#
+# Leídos desde el final, los caminos de caminos1 están ordenados
+# lexicográficamente eligiendo en cada paso hacia atrás primero la
+# casilla de arriba y luego la de la izquierda. Las definiciones
+# siguientes usan el mismo orden.
+
+# numeroDeCaminos(p) es el número de caminos en la matriz p. Por
+# ejemplo,
+#    >>> numeroDeCaminos([[1,6,11,2],[7,12,3,8],[3,8,4,9]])
+#    10
+#    >>> numeroDeCaminos([list(range(12*n+1, 12*(n+1)+1)) for n in range(12)])
+#    705432
+#    >>> len(str(numeroDeCaminos([[0]*1000]*1000)))
+#    600
+def numeroDeCaminos(p: list[list[int]]) -> int:
+    return numeroDeCaminosHasta(len(p), len(p[0]))
+
+# numeroDeCaminosHasta(i, j) es el número de caminos desde la posición
+# (1,1) hasta la (i,j).
+def numeroDeCaminosHasta(i: int, j: int) -> int:
+    return comb(i + j - 2, i - 1)
+
+# generadorCaminos(p) es un generador de los caminos de la matriz p, en
+# el mismo orden que caminos1(p). Por ejemplo,
+#    >>> g = generadorCaminos([[1,6,11,2],[7,12,3,8],[3,8,4,9]])
+#    >>> next(g)
+#    [1, 6, 11, 2, 8, 9]
+#    >>> next(g)
+#    [1, 6, 11, 3, 8, 9]
+#
+# No se usa recursión. Se guarda el camino que se está construyendo
+# (desde el final) y una pila con las posiciones pendientes; es decir,
+# aquellas desde las que el camino ha ido hacia arriba y falta ir hacia
+# la izquierda, cada una con la longitud del camino hasta ella. Desde
+# cada posición, el camino se completa yendo hacia arriba hasta la
+# primera fila y luego hacia la izquierda; para obtener el siguiente, se
+# saca la última posición pendiente, se recorta el camino hasta ella y
+# se continúa por la izquierda. Por tanto, la memoria es O(m+n) y el
+# coste de pasar de un camino al siguiente es proporcional a la parte
+# que cambia.
+def generadorCaminos(p: list[list[int]]) -> Iterator[list[int]]:
+    inverso: list[int] = []
+    pendientes: list[tuple[int, int, int]] = []
+    (i, j) = (len(p), len(p[0]))
+    while True:
+        inverso.append(p[i-1][j-1])
+        while i > 1:
+            if j > 1:
+                pendientes.append((i, j - 1, len(inverso)))
+            i -= 1
+            inverso.append(p[i-1][j-1])
+        inverso.extend(reversed(p[0][:j-1]))
+        yield list(reversed(inverso))
+        if not pendientes:
+            return
+        (i, j, k) = pendientes.pop()
+        del inverso[k:]
+
+# camino(p, k) es el camino k-ésimo (empezando a contar en 0) de la
+# matriz p, en el mismo orden que caminos1(p). Por ejemplo,
+#    >>> camino([[1,6,11,2],[7,12,3,8],[3,8,4,9]], 0)
+#    [1, 6, 11, 2, 8, 9]
+#    >>> camino([[1,6,11,2],[7,12,3,8],[3,8,4,9]], 8)
+#    [1, 7, 12, 8, 4, 9]
+#
+# Se construye desde el final: si en la posición (i,j) hay c caminos
+# que llegan desde arriba (los de numeroDeCaminosHasta(i-1, j)) y k < c,
+# el camino viene de arriba; y si no, viene de la izquierda y es el
+# (k-c)-ésimo de los que vienen de ella. Así, para elegir un camino al
+# azar basta hacer
+#    camino(p, randrange(numeroDeCaminos(p)))
+def camino(p: list[list[int]], k: int) -> list[int]:
+    i = len(p)
+    j = len(p[0])
+    if not 0 <= k < numeroDeCaminosHasta(i, j):
+        raise ValueError(f"No existe el camino {k}")
+    inverso = [p[i-1][j-1]]
+    while (i, j) != (1, 1):
+        c = numeroDeCaminosHasta(i - 1, j) if i > 1 else 0
+        if k < c:
+            i -= 1
+        else:
+            k -= c
+            j -= 1
+        inverso.append(p[i-1][j-1])
+    return list(reversed(inverso))
+
 # Comparación de eficiencia
 # =========================
 
@@ -130,6 +252,24 @@ def tiempo(e: str) -> None:
 #    2.20 segundos
 #    >>> tiempo('caminos2([list(range(11*n+1, 11*(n+1)+1)) for n in range(12)])')
 #    0.64 segundos
+#    >>> tiempo('caminos3([list(range(11*n+1, 11*(n+1)+1)) for n in range(12)])')
+#    0.55 segundos
+#
+#    >>> tiempo('len(caminos2([list(range(12*n+1, 12*(n+1)+1)) for n in range(12)]))')
+#    1.42 segundos
+#    >>> tiempo('sum(1 for _ in generadorCaminos([list(range(12*n+1, 12*(n+1)+1)) for n in range(12)]))')
+#    0.97 segundos
+#    >>> tiempo('numeroDeCaminos([list(range(12*n+1, 12*(n+1)+1)) for n in range(12)])')
+#    0.00 segundos
+#    >>> tiempo('camino([list(range(1000*n+1, 1000*(n+1)+1)) for n in range(1000)], 10**500)')
+#    0.14 segundos
+#
+# Recorrer los caminos con generadorCaminos es más rápido que
+# construirlos con caminos2 y la memoria máxima usada en el ejemplo
+# anterior es de menos de 0.01 MB, frente a los 638 MB de caminos2.
+# Además, como no usa recursión, sirve para matrices muy grandes:
+#    >>> tiempo('next(generadorCaminos([[0]*50000]*50000))')
+#    0.02 segundos
 
 # Verificación
 # ============
@@ -147,8 +287,31 @@ def test_caminos() -> None:
          [1, 7,  3, 8, 4, 9]]
     assert caminos1([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == r
     assert caminos2([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == r
+    assert caminos3([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == r
+    assert list(generadorCaminos([[1,6,11,2],[7,12,3,8],[3,8,4,9]])) == r
+    assert [camino([[1,6,11,2],[7,12,3,8],[3,8,4,9]], k)
+            for k in range(10)] == r
+    assert numeroDeCaminos([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 10
+    assert next(generadorCaminos([[0]*3000]*3000)) == [0] * 5999
     print("Verificado")
 
 # La verificación es
 #    >>> test_caminos()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(st.integers(min_value=1, max_value=6),
+       st.integers(min_value=1, max_value=6))
+def test_caminos_equiv(m: int, n: int) -> None:
+    p = [list(range(n*i + 1, n*(i+1) + 1)) for i in range(m)]
+    cs = caminos1(p)
+    assert numeroDeCaminos(p) == len(cs)
+    assert list(generadorCaminos(p)) == cs
+    assert [camino(p, k) for k in range(len(cs))] == cs
+
+# La comprobación es
+#    >>> test_caminos_equiv()
+#    >>>
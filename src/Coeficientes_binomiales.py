@@ -19,10 +19,13 @@
 
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Callable
 
 import numpy as np
 import numpy.typing as npt
 
+from src.ProgramacionDinamica import AlmacenVentana, programacionDinamica
+
 setrecursionlimit(10**6)
 
 # 1ª definición (por recursión)
@@ -88,6 +91,25 @@ def matrizBinomial3(n: int, k: int) -> npt.NDArray[np.int_]:
 
     return q
 
+# 4ª definición (con programacionDinamica)
+# ========================================
+
+# Se usa el procedimiento genérico de ProgramacionDinamica.py. Como cada
+# fila sólo depende de la anterior, basta guardar dos filas.
+def binomial4(n: int, k: int) -> int:
+    def calcula(t: Callable[[tuple[int, int]], int],
+                p: tuple[int, int]) -> int:
+        (i, j) = p
+        if j == 0 or i == j:
+            return 1
+        if j > i:
+            return 0
+        return t((i - 1, j - 1)) + t((i - 1, j))
+
+    return programacionDinamica(calcula,
+                                ((0, 0), (n, k)),
+                                AlmacenVentana)((n, k))
+
 # Comparación de eficiencia
 # =========================
 
@@ -108,6 +130,8 @@ def tiempo(e: str) -> None:
 # 0.18 segundos
 # >>> tiempo('binomial3(50000, 12)')
 # 0.26 segundos
+# >>> tiempo('binomial4(50000, 12)')
+# 0.76 segundos
 
 # Verificación
 # ============
@@ -122,6 +146,9 @@ def test_binomial() -> None:
     assert binomial3(6, 3) == 20
     assert binomial3(5, 2) == 10
     assert binomial3(5, 3) == 10
+    assert binomial4(6, 3) == 20
+    assert binomial4(5, 2) == 10
+    assert binomial4(5, 3) == 10
     print("Verificado")
 
 # La verificación es
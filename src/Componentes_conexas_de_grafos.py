@@ -0,0 +1,324 @@
+# Componentes_conexas_de_grafos.py
+# Índice de componentes conexas para consultas de conectividad.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# ----------------------------------------------------------------------
+# Introducción                                                        --
+# ----------------------------------------------------------------------
+
+# En Ejercicios_sobre_grafos.py, cada llamada a conectados(g, v1, v2)
+# recorre el grafo desde v1 y cada llamada a conexo(g) lo recorre
+# entero. Cuando se hacen muchas consultas sobre el mismo grafo es
+# mejor calcular una vez un índice con el que cada consulta se responde
+# sin recorrer el grafo:
+#    + en los grafos no dirigidos, las componentes conexas, calculadas
+#      con conjuntos disjuntos (ver TAD/ConjuntosDisjuntos.py), y
+#    + en los grafos dirigidos, las componentes fuertemente conexas
+#      (calculadas con el algoritmo de Tarjan) y, para cada una de
+#      ellas, el conjunto de las componentes alcanzables desde ella,
+#      representado por un entero en el que el bit i indica si la
+#      componente i es alcanzable.
+#
+# Los grafos del TAD no se modifican, por lo que el índice es válido
+# mientras se use con el grafo con el que se construyó; si se construye
+# un nuevo grafo, hay que construir su índice.
+
+# ----------------------------------------------------------------------
+# Librerías auxiliares                                                --
+# ----------------------------------------------------------------------
+
+from random import Random
+from timeit import Timer, default_timer
+from typing import Callable
+
+from hypothesis import given
+
+from src.Ejercicios_sobre_grafos import conectados as conectadosR
+from src.Ejercicios_sobre_grafos import conexo as conexoR
+from src.Problemas_basicos_de_grafos import gen_grafo
+from src.TAD.ConjuntosDisjuntos import ConjuntosDisjuntos
+from src.TAD.Grafo import (Grafo, Orientacion, Vertice, adyacentes, aristas,
+                           creaGrafo_, dirigido, nodos)
+
+# ---------------------------------------------------------------------
+# Ejercicio 1. Definir la función
+#    componentesFuertes : (Grafo) -> list[list[Vertice]]
+# tal que componentesFuertes(g) es la lista de las componentes
+# fuertemente conexas del grafo g (es decir, de los conjuntos maximales
+# de vértices tales que cada uno es alcanzable desde los otros),
+# ordenadas de forma que ninguna componente alcanza a las que le
+# siguen. Por ejemplo, si grafo1 es el grafo
+#
+#    1 ---> 2 ---> 3 ---> 4 <--- 6
+#    ^      |      ^      |
+#    |      v      |      v
+#    +----- 5      +----- 7
+#
+# definido por
+#    grafo1 = creaGrafo_(Orientacion.D,
+#                        (1,7),
+#                        [(1,2),(2,3),(2,5),(3,4),(4,7),(5,1),(6,4),(7,3)])
+# entonces
+#    >>> componentesFuertes(grafo1)
+#    [[3, 4, 7], [1, 2, 5], [6]]
+# ---------------------------------------------------------------------
+
+grafo1 = creaGrafo_(Orientacion.D,
+                    (1,7),
+                    [(1,2),(2,3),(2,5),(3,4),(4,7),(5,1),(6,4),(7,3)])
+
+# Se usa el algoritmo de Tarjan: se recorre el grafo en profundidad
+# asignando a cada vértice su orden de descubrimiento, indice[v], y
+# calculando bajo[v], el menor índice de un vértice de la pila
+# alcanzable desde v. Un vértice v con bajo[v] = indice[v] es la raíz
+# de una componente, formada por los vértices que están en la pila por
+# encima de v. Las componentes se obtienen en orden topológico inverso.
+#
+# Para no depender del límite de recursión, el recorrido se hace con
+# una pila explícita de ternas (v, ws, i), donde ws es la lista de los
+# adyacentes de v e i es la posición del siguiente a considerar.
+def componentesFuertes(g: Grafo) -> list[list[Vertice]]:
+    indice: dict[Vertice, int] = {}
+    bajo: dict[Vertice, int] = {}
+    pila: list[Vertice] = []
+    enPila: set[Vertice] = set()
+    cs: list[list[Vertice]] = []
+    for r in nodos(g) + [x for ((x, _), _) in aristas(g)]:
+        if r in indice:
+            continue
+        indice[r] = bajo[r] = len(indice)
+        pila.append(r)
+        enPila.add(r)
+        llamadas = [(r, adyacentes(g, r), 0)]
+        while llamadas:
+            (v, ws, i) = llamadas[-1]
+            if i < len(ws):
+                llamadas[-1] = (v, ws, i + 1)
+                w = ws[i]
+                if w not in indice:
+                    indice[w] = bajo[w] = len(indice)
+                    pila.append(w)
+                    enPila.add(w)
+                    llamadas.append((w, adyacentes(g, w), 0))
+                elif w in enPila:
+                    bajo[v] = min(bajo[v], indice[w])
+                continue
+            llamadas.pop()
+            if llamadas:
+                u = llamadas[-1][0]
+                bajo[u] = min(bajo[u], bajo[v])
+            if bajo[v] == indice[v]:
+                c = []
+                while True:
+                    w = pila.pop()
+                    enPila.discard(w)
+                    c.append(w)
+                    if w == v:
+                        break
+                cs.append(sorted(c))
+    return cs
+
+# Verificación
+# ============
+
+def test_componentesFuertes() -> None:
+    assert componentesFuertes(grafo1) == [[3, 4, 7], [1, 2, 5], [6]]
+    print("Verificado")
+
+# La verificación es
+#    >>> test_componentesFuertes()
+#    Verificado
+
+# ---------------------------------------------------------------------
+# Ejercicio 2. Definir la clase IndiceDeConectividad tal que
+# IndiceDeConectividad(g) es el índice de conectividad del grafo g, con
+# los métodos
+#    + componente(v), que es el número de la componente de v (conexa,
+#      si g es no dirigido, y fuertemente conexa, si es dirigido),
+#    + nComponentes(), que es el número de componentes,
+#    + conectados(v1, v2), que se verifica si v2 es alcanzable desde v1
+#      y
+#    + conexo(), que se verifica si todos los vértices son alcanzables
+#      desde el primero.
+# Por ejemplo, si grafo2 es el grafo no dirigido definido por
+#    grafo2 = creaGrafo_(Orientacion.ND, (1,6), [(1,2),(2,3),(4,5)])
+# entonces
+#    >>> i = IndiceDeConectividad(grafo2)
+#    >>> i.nComponentes()
+#    3
+#    >>> i.conectados(1, 3)
+#    True
+#    >>> i.conectados(3, 4)
+#    False
+#    >>> i.conexo()
+#    False
+#    >>> j = IndiceDeConectividad(grafo1)
+#    >>> j.nComponentes()
+#    3
+#    >>> j.conectados(1, 4)
+#    True
+#    >>> j.conectados(4, 1)
+#    False
+#    >>> j.conexo()
+#    False
+# ---------------------------------------------------------------------
+
+grafo2 = creaGrafo_(Orientacion.ND, (1,6), [(1,2),(2,3),(4,5)])
+
+# En los grafos dirigidos, las componentes se numeran en el orden en que
+# las devuelve componentesFuertes, por lo que las aristas entre
+# componentes van de una componente a otra de número menor y los
+# alcanzables de cada componente se pueden calcular en orden creciente
+# a partir de los de sus sucesores.
+#
+# La consulta conectados(v1, v2) consiste en comparar dos números (en
+# los grafos no dirigidos) o comprobar un bit (en los dirigidos), por
+# lo que su coste no depende del número de aristas.
+class IndiceDeConectividad:
+    def __init__(self, g: Grafo) -> None:
+        self._primero = nodos(g)[0]
+        self._dirigido = dirigido(g)
+        self._componente: dict[Vertice, int] = {}
+        self._alcanzables: list[int] = []
+        if not self._dirigido:
+            # Los vértices de las aristas pueden no estar entre los
+            # nodos de g (si están fuera de sus cotas).
+            vs = nodos(g) + [v for ((x, y), _) in aristas(g) for v in (x, y)]
+            posicion = {v: i for (i, v) in enumerate(dict.fromkeys(vs))}
+            c = ConjuntosDisjuntos(len(posicion))
+            for ((x, y), _) in aristas(g):
+                c.une(posicion[x], posicion[y])
+            numeros: dict[int, int] = {}
+            for (v, i) in posicion.items():
+                r = c.encuentra(i)
+                self._componente[v] = numeros.setdefault(r, len(numeros))
+            self._nComponentes = len(numeros)
+        else:
+            self._indexaDirigido(g)
+        self._conexo = all(self.conectados(self._primero, v)
+                           for v in nodos(g))
+
+    def _indexaDirigido(self, g: Grafo) -> None:
+        cs = componentesFuertes(g)
+        for (i, c) in enumerate(cs):
+            for v in c:
+                self._componente[v] = i
+        self._nComponentes = len(cs)
+        self._alcanzables = [1 << i for i in range(len(cs))]
+        for (i, c) in enumerate(cs):
+            for v in c:
+                for w in adyacentes(g, v):
+                    self._alcanzables[i] |= \
+                        self._alcanzables[self._componente[w]]
+
+    def componente(self, v: Vertice) -> int:
+        return self._componente[v]
+
+    def nComponentes(self) -> int:
+        return self._nComponentes
+
+    def conectados(self, v1: Vertice, v2: Vertice) -> bool:
+        if v1 not in self._componente or v2 not in self._componente:
+            return v1 == v2
+        c1 = self._componente[v1]
+        c2 = self._componente[v2]
+        if not self._dirigido:
+            return c1 == c2
+        return bool(self._alcanzables[c1] >> c2 & 1)
+
+    def conexo(self) -> bool:
+        return self._conexo
+
+# Verificación
+# ============
+
+def test_IndiceDeConectividad() -> None:
+    i = IndiceDeConectividad(grafo2)
+    assert i.nComponentes() == 3
+    assert i.conectados(1, 3)
+    assert not i.conectados(3, 4)
+    assert not i.conexo()
+    j = IndiceDeConectividad(grafo1)
+    assert j.nComponentes() == 3
+    assert j.conectados(1, 4)
+    assert not j.conectados(4, 1)
+    assert not j.conexo()
+    print("Verificado")
+
+# La verificación es
+#    >>> test_IndiceDeConectividad()
+#    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(gen_grafo())
+def test_IndiceDeConectividad_equiv(g: Grafo) -> None:
+    i = IndiceDeConectividad(g)
+    assert i.conexo() == conexoR(g)
+    for v1 in nodos(g):
+        for v2 in nodos(g):
+            assert i.conectados(v1, v2) == conectadosR(g, v1, v2)
+            assert (i.componente(v1) == i.componente(v2)) == \
+                (conectadosR(g, v1, v2) and conectadosR(g, v2, v1))
+
+# La comprobación es
+#    src> poetry run pytest -q Componentes_conexas_de_grafos.py
+#    3 passed in 1.21s
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# grafoAleatorio(o, n, m) es un grafo de orientación o con los vértices
+# de 1 a n y m aristas aleatorias. Por ejemplo,
+#    >>> grafoAleatorio(Orientacion.D, 4, 3)
+#    G D ([1, 2, 3, 4], [(1, 4), (2, 3), (4, 2)])
+def grafoAleatorio(o: Orientacion, n: int, m: int) -> Grafo:
+    r = Random(n)
+    return creaGrafo_(o, (1, n),
+                      [(r.randint(1, n), r.randint(1, n)) for _ in range(m)])
+
+# consultas(f, n, k) es el número de pares (v1, v2), con v1 y v2 entre
+# los k vértices 1, 1+n//k, 1+2·(n//k), ..., tales que f(v1, v2) se
+# verifica (es decir, hace k² consultas).
+def consultas(f: Callable[[Vertice, Vertice], bool], n: int, k: int) -> int:
+    vs = range(1, n + 1, n // k)
+    return sum(f(v1, v2) for v1 in vs for v2 in vs)
+
+# La comparación es
+#    >>> g = grafoAleatorio(Orientacion.ND, 10**4, 10**4)
+#    >>> tiempo('consultas(lambda v1, v2: conectadosR(g, v1, v2), 10**4, 30)')
+#    5.50 segundos
+#    >>> tiempo('i = IndiceDeConectividad(g)')
+#    0.03 segundos
+#    >>> i = IndiceDeConectividad(g)
+#    >>> tiempo('consultas(i.conectados, 10**4, 30)')
+#    0.00 segundos
+#    >>> tiempo('consultas(i.conectados, 10**4, 1000)')
+#    0.20 segundos
+#
+#    >>> g = grafoAleatorio(Orientacion.D, 10**4, 2*10**4)
+#    >>> tiempo('consultas(lambda v1, v2: conectadosR(g, v1, v2), 10**4, 30)')
+#    6.99 segundos
+#    >>> tiempo('i = IndiceDeConectividad(g)')
+#    0.07 segundos
+#    >>> i = IndiceDeConectividad(g)
+#    >>> tiempo('consultas(i.conectados, 10**4, 1000)')
+#    0.44 segundos
+#
+# Es decir, un millón de consultas con el índice tardan menos que 900
+# sin él. La construcción del índice tarda 8.34 segundos para
+# grafoAleatorio(Orientacion.ND, 10**6, 10**6) y 1.18 segundos para
+# grafoAleatorio(Orientacion.D, 10**5, 2*10**5) (que tiene 36182
+# componentes fuertemente conexas). En los grafos dirigidos, los
+# conjuntos de alcanzables ocupan hasta C² bits, donde C es el número de
+# componentes, por lo que el índice no es adecuado para grafos
+# dirigidos con millones de componentes.
@@ -17,9 +17,12 @@
 
 from enum import Enum
 from itertools import permutations
+from timeit import Timer, default_timer
 from typing import TypeVar
 
-from src.Algoritmos_sobre_grafos import recorridoEnAnchura
+from src.Algoritmos_sobre_grafos import (iterRecorridoEnAnchura,
+                                         iterRecorridoEnProfundidad,
+                                         recorridoEnAnchura)
 from src.Problemas_basicos_de_grafos import grafoCiclo, incidentes
 from src.TAD.Grafo import (Grafo, Orientacion, Vertice, adyacentes, aristas,
                            creaGrafo_, nodos)
@@ -136,12 +139,24 @@ def conjetura(n: int) -> bool:
 #    conexo (creaGrafo_(Orientacion.ND, (1,4), [(1,2),(3,4)]))       == False
 # ---------------------------------------------------------------------
 
-def conexo(g: Grafo) -> bool:
+# 1ª solución
+# ===========
+
+def conexo1(g: Grafo) -> bool:
     xs = nodos(g)
     i = xs[0]
     n = len(xs)
     return len(recorridoEnAnchura(i, g)) == n
 
+# 2ª solución
+# ===========
+
+# Con el recorrido iterativo (ver Algoritmos_sobre_grafos.py), que tiene
+# coste lineal y no usa recursión.
+def conexo(g: Grafo) -> bool:
+    xs = nodos(g)
+    return sum(1 for _ in iterRecorridoEnAnchura(xs[0], g)) == len(xs)
+
 # Verificación
 # ============
 
@@ -149,9 +164,10 @@ def test_conexo() -> None:
     g1 = creaGrafo_(Orientacion.ND, (1,3), [(1,2),(3,2)])
     g2 = creaGrafo_(Orientacion.ND, (1,4), [(1,2),(3,2),(4,1)])
     g3 = creaGrafo_(Orientacion.ND, (1,4), [(1,2),(3,4)])
-    assert conexo(g1)
-    assert conexo(g2)
-    assert not conexo(g3)
+    for conexo_ in [conexo1, conexo]:
+        assert conexo_(g1)
+        assert conexo_(g2)
+        assert not conexo_(g3)
     print("Verificado")
 
 # La verificación es
@@ -283,6 +299,9 @@ def test_aislados() -> None:
 #    conectados grafo8 3 1  ==  True
 # ----------------------------------------------------------------------------
 
+# 1ª solución
+# ===========
+
 def unionV(xs: list[Vertice], ys: list[Vertice]) -> list[Vertice]:
     return list(set(xs) | set(ys))
 
@@ -294,9 +313,17 @@ def conectadosAux(g: Grafo, vs: list[Vertice], ws: list[Vertice]) -> list[Vertic
         return conectadosAux(g, vs, ws)
     return conectadosAux(g, unionV([w], vs), unionV(ws, adyacentes(g, w)))
 
-def conectados(g: Grafo, v1: Vertice, v2: Vertice) -> bool:
+def conectados1(g: Grafo, v1: Vertice, v2: Vertice) -> bool:
     return v2 in conectadosAux(g, [], [v1])
 
+# 2ª solución
+# ===========
+
+# Se recorre el grafo en profundidad desde v1 de forma iterativa,
+# parando en cuanto se encuentra v2.
+def conectados(g: Grafo, v1: Vertice, v2: Vertice) -> bool:
+    return any(v == v2 for v in iterRecorridoEnProfundidad(v1, g))
+
 
 # Verificación
 # ============
@@ -310,20 +337,62 @@ def test_conectados() -> None:
                         (1,6),
                         [(1,3),(1,5),(3,5),(5,1),(5,50),
                          (2,4),(2,6),(4,6),(4,4),(6,4)])
-    assert conectados(grafo8, 1, 3)
-    assert not conectados(grafo8, 1, 4)
-    assert not conectados(grafo8, 6, 2)
-    assert conectados(grafo8, 3, 1)
-    assert conectados(grafo8b, 1, 3)
-    assert not conectados(grafo8b, 1, 4)
-    assert conectados(grafo8b, 6, 2)
-    assert conectados(grafo8b, 3, 1)
+    for conectados_ in [conectados1, conectados]:
+        assert conectados_(grafo8, 1, 3)
+        assert not conectados_(grafo8, 1, 4)
+        assert not conectados_(grafo8, 6, 2)
+        assert conectados_(grafo8, 3, 1)
+        assert conectados_(grafo8b, 1, 3)
+        assert not conectados_(grafo8b, 1, 4)
+        assert conectados_(grafo8b, 6, 2)
+        assert conectados_(grafo8b, 3, 1)
     print("Verificado")
 
 # La verificación es
 #    >>> test_conectados()
 #    Verificado
 
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# grafoCamino(n) es el grafo no dirigido formado por el camino
+# 1-2-...-n. Por ejemplo,
+#    >>> grafoCamino(4)
+#    G ND ([1, 2, 3, 4], [(1, 2), (2, 3), (3, 4)])
+def grafoCamino(n: int) -> Grafo:
+    return creaGrafo_(Orientacion.ND, (1, n), [(i, i + 1) for i in range(1, n)])
+
+# La comparación es
+#    >>> g = grafoCamino(300)
+#    >>> tiempo('conexo1(g)')
+#    0.00 segundos
+#    >>> tiempo('conectados1(g, 1, 300)')
+#    0.01 segundos
+#    >>> g = grafoCamino(1000)
+#    >>> tiempo('conexo1(g)')
+#    RecursionError: maximum recursion depth exceeded
+#    >>> tiempo('conectados1(g, 1, 1000)')
+#    RecursionError: maximum recursion depth exceeded
+#    >>> tiempo('conexo(g)')
+#    0.00 segundos
+#    >>> tiempo('conectados(g, 1, 1000)')
+#    0.00 segundos
+#    >>> g = grafoCamino(10**6)
+#    >>> tiempo('conexo(g)')
+#    0.94 segundos
+#    >>> tiempo('conectados(g, 1, 10**6)')
+#    1.80 segundos
+#
+# Los recorridos de Algoritmos_sobre_grafos.py se comportan igual:
+# recorridoEnProfundidad y recorridoEnAnchura fallan con 1000 vértices,
+# mientras que con 10^6 vértices recorridoEnProfundidad3 tarda 1.52
+# segundos y recorridoEnAnchura2 0.83 segundos.
+
 # Verificación
 # ============
 
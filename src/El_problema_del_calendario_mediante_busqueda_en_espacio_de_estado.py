@@ -43,7 +43,7 @@ from typing import Optional
 import numpy as np
 import numpy.typing as npt
 
-from src.BusquedaEnProfundidad import buscaProfundidad
+from src.BusquedaEnProfundidad import buscaProfundidad, iterProfundidad
 
 # ---------------------------------------------------------------------
 # Ejercicio 1. Definir el tipo Calendario como matrices de enteros.
@@ -189,6 +189,26 @@ def esFinal(c: Calendario) -> bool:
 def calendario(n: int) -> list[Calendario]:
     return buscaProfundidad(sucesores, esFinal, inicial(n))
 
+# ---------------------------------------------------------------------
+# Ejercicio 8. Definir la función
+#    calendario1 : (int) -> Optional[Calendario]
+# tal que calendario1(n) es la primera solución del problema del
+# calendario con n participantes, o None si no tiene solución. Por
+# ejemplo,
+#    >>> calendario1(6)
+#    array([[6, 5, 4, 3, 2],
+#           [5, 4, 3, 6, 1],
+#           [4, 6, 2, 1, 5],
+#           [3, 2, 1, 5, 6],
+#           [2, 1, 6, 4, 3],
+#           [1, 3, 5, 2, 4]])
+#    >>> calendario1(5)
+# ---------------------------------------------------------------------
+
+# La búsqueda se detiene en cuanto se encuentra la primera solución.
+def calendario1(n: int) -> Optional[Calendario]:
+    return next(iterProfundidad(sucesores, esFinal, inicial(n)), None)
+
 # Verificación
 # ============
 
@@ -205,4 +225,7 @@ def test_calendario() -> None:
          [1, 3, 5, 2, 4]]
     assert len(calendario(6)) == 720
     assert len(calendario(5)) == 0
+    c = calendario1(6)
+    assert c is not None and filas(c) == filas(calendario(6)[0])
+    assert calendario1(5) is None
     print("Verificado")
@@ -21,7 +21,9 @@
 # Importaciones
 # ---------------------------------------------------------------------
 
-from src.BusquedaEnProfundidad import buscaProfundidad
+from typing import Optional
+
+from src.BusquedaEnProfundidad import buscaProfundidad, iterProfundidad
 
 # ---------------------------------------------------------------------
 # Ejercicio 1. Las fichas son pares de números enteros.
@@ -142,6 +144,22 @@ def soluciones(p: Problema) -> list[Estado]:
 def domino(p: Problema) -> list[list[Ficha]]:
     return [s[1] for s in soluciones(p)]
 
+# ---------------------------------------------------------------------
+# Ejercicio 10. Definir la función
+#    domino1 : (Problema) -> Optional[list[Ficha]]
+# tal que domino1(fs) es la primera solución del problema del dominó
+# correspondiente a las fichas fs, o None si no tiene solución. Por
+# ejemplo,
+#    >>> domino1([(1,2),(2,3),(1,4)])
+#    [(3, 2), (2, 1), (1, 4)]
+#    >>> domino1([(1,2),(2,3),(5,4)])
+# ---------------------------------------------------------------------
+
+# La búsqueda se detiene en cuanto se encuentra la primera solución.
+def domino1(p: Problema) -> Optional[list[Ficha]]:
+    s = next(iterProfundidad(sucesores, esFinal, inicial(p)), None)
+    return None if s is None else s[1]
+
 # # Verificación
 # # ============
 
@@ -154,6 +172,8 @@ def test_domino() -> None:
         [[(4, 3), (3, 2), (2, 1)], [(1, 2), (2, 3), (3, 4)]]
     assert domino([(1,2),(2,3),(5,4)]) == \
         []
+    assert domino1([(1,2),(2,3),(1,4)]) == [(3, 2), (2, 1), (1, 4)]
+    assert domino1([(1,2),(2,3),(5,4)]) is None
     print("Verificado")
 
 # La verificación es
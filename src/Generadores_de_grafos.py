@@ -0,0 +1,541 @@
+# Generadores_de_grafos.py
+# Generadores de grafos aleatorios grandes.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# ----------------------------------------------------------------------
+# Introducción                                                        --
+# ----------------------------------------------------------------------
+
+# Los grafos de los ejercicios anteriores (completo, grafoCiclo y los
+# generadores de Hypothesis gen_grafoND y gen_grafoD) tienen a lo sumo
+# unas decenas de vértices. En esta relación se definen generadores de
+# grafos aleatorios de millones de aristas, para medir la eficiencia de
+# los algoritmos sobre grafos y para comprobar sus propiedades con
+# grafos grandes:
+#    + erdosRenyi(n, p): el grafo G(n,p) de Erdős–Rényi, en el que cada
+#      posible arista está con probabilidad p,
+#    + regularAleatorio(n, d): un grafo d-regular aleatorio,
+#    + rejilla(f, c): la rejilla de f filas y c columnas y
+#    + barabasiAlbert(n, k): un grafo libre de escala construido por
+#      conexión preferencial, en el que cada nuevo vértice se une a k
+#      de los anteriores con probabilidad proporcional a su grado.
+#
+# Todos los generadores tienen los siguientes argumentos opcionales:
+#    + pesos: el par (a, b) si las aristas tienen pesos aleatorios entre
+#      a y b (por defecto, no tienen pesos),
+#    + semilla: la semilla de los números aleatorios (con la misma
+#      semilla se obtiene el mismo grafo) y
+#    + m: el módulo de la implementación de los grafos que se usa para
+#      construirlo (por defecto, la del TAD). Las aristas se generan en
+#      vectores de NumPy, por lo que si m es GrafoConCSR el grafo se
+#      construye directamente a partir de ellos, sin crear una tupla por
+#      arista.
+
+# ----------------------------------------------------------------------
+# Librerías auxiliares                                                --
+# ----------------------------------------------------------------------
+
+from math import sqrt
+from random import Random
+from timeit import Timer, default_timer
+from typing import Any, Callable, Optional
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from hypothesis.strategies import composite
+
+import src.Algoritmos_sobre_grafos as ag
+import src.Ejercicios_sobre_grafos as eg
+import src.TAD.Grafo as tad
+import src.TAD.GrafoConCSR as gc
+import src.TAD.GrafoConDiccionarioDeAdyacencia as gd
+from src.Problemas_basicos_de_grafos import (grado, nAristas, nLazos,
+                                             regularidad)
+from src.TAD.Grafo import Grafo, Orientacion, aristas, nodos
+
+# ----------------------------------------------------------------------
+# Construcción de los grafos                                          --
+# ----------------------------------------------------------------------
+
+# construye(m, o, n, origenes, destinos, pesos, r) es el grafo, construido
+# con el módulo m, de orientación o, con los vértices de 1 a n y las
+# aristas de origenes[i] a destinos[i]. Si pesos es el par (a, b), los
+# pesos se eligen aleatoriamente entre a y b con el generador r.
+def construye(m: Any,
+              o: Orientacion,
+              n: int,
+              origenes: npt.NDArray[np.int64],
+              destinos: npt.NDArray[np.int64],
+              pesos: Optional[tuple[int, int]],
+              r: np.random.Generator) -> Any:
+    ps = None if pesos is None \
+        else r.integers(pesos[0], pesos[1] + 1, len(origenes))
+    if hasattr(m, 'desdeArrays'):
+        return m.desdeArrays(o, (1, n), origenes, destinos, ps)
+    as_ = zip(origenes.tolist(), destinos.tolist())
+    if ps is None:
+        return m.creaGrafo_(o, (1, n), list(as_))
+    return m.creaGrafo(o, (1, n), list(zip(as_, ps.tolist())))
+
+# ---------------------------------------------------------------------
+# Ejercicio 1. Definir la función
+#    erdosRenyi : (int, float, Orientacion, Optional[tuple[int, int]],
+#                  int, Any) -> Grafo
+# tal que erdosRenyi(n, p, o, pesos, semilla, m) es un grafo aleatorio
+# de orientación o con los vértices de 1 a n en el que cada arista (sin
+# contar los lazos) está con probabilidad p. Por ejemplo,
+#    >>> erdosRenyi(5, 0.4)
+#    G ND ([1, 2, 3, 4, 5], [(1, 3), (1, 4), (2, 3), (2, 4), (3, 5)])
+#    >>> erdosRenyi(5, 0.4, Orientacion.D, (1, 9))
+#    G D ([1, 2, 3, 4, 5], [((1, 3), 8), ((1, 4), 2), ((1, 5), 6),
+#     ((2, 1), 7), ((3, 1), 8), ((4, 2), 5), ((4, 5), 4), ((5, 3), 3)])
+# ---------------------------------------------------------------------
+
+# En lugar de decidir para cada una de las n(n-1)/2 posibles aristas si
+# está o no (lo que tiene un coste cuadrático), se numeran las posibles
+# aristas y se salta directamente de una elegida a la siguiente. El
+# número de posiciones entre dos elegidas sigue una distribución
+# geométrica de parámetro p, por lo que el coste es proporcional al
+# número de aristas generadas.
+
+# posicionesAleatorias(r, t, p) es el vector ordenado de las posiciones
+# entre 0 y t-1 elegidas, cada una con probabilidad p, con el generador
+# r. Por ejemplo,
+#    >>> posicionesAleatorias(np.random.default_rng(0), 20, 0.3)
+#    array([ 1,  4,  5,  6,  8, 13, 15, 18])
+def posicionesAleatorias(r: np.random.Generator,
+                         t: int,
+                         p: float) -> npt.NDArray[np.int64]:
+    if t <= 0 or p <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(t, dtype=np.int64)
+    media = t * p
+    k = int(media + 5 * sqrt(media) + 10)
+    trozos = []
+    ultima = -1
+    while ultima < t:
+        # Los saltos mayores que t + 1 se reducen a t + 1 (para que la
+        # suma no se desborde cuando p es muy pequeño). Así, un salto
+        # reducido, que empieza en una posición >= -1, siempre termina
+        # fuera de [0, t) y no elige ninguna posición.
+        ps = ultima + np.cumsum(np.minimum(r.geometric(p, k), t + 1))
+        trozos.append(ps[ps < t])
+        ultima = int(ps[-1])
+    return np.concatenate(trozos)
+
+# paresNoDirigidos(ps) es el par de vectores (xs, ys) tal que
+# (xs[i], ys[i]) es el par de vértices, con 1 <= xs[i] < ys[i], que
+# ocupa la posición ps[i] en la lista
+#    (1,2), (1,3), (2,3), (1,4), (2,4), (3,4), ...
+# Por ejemplo,
+#    >>> paresNoDirigidos(np.array([0, 1, 2, 5]))
+#    (array([1, 1, 2, 3]), array([2, 3, 3, 4]))
+def paresNoDirigidos(ps: npt.NDArray[np.int64]) -> tuple[npt.NDArray[np.int64],
+                                                         npt.NDArray[np.int64]]:
+    ys = ((1 + np.sqrt(1 + 8 * ps.astype(np.float64))) // 2).astype(np.int64)
+    # Se corrigen los errores de redondeo de la raíz cuadrada.
+    ys -= ys * (ys - 1) // 2 > ps
+    ys += (ys + 1) * ys // 2 <= ps
+    xs = ps - ys * (ys - 1) // 2
+    return (xs + 1, ys + 1)
+
+# paresDirigidos(n, ps) es el par de vectores (xs, ys) tal que
+# (xs[i], ys[i]) es el par de vértices distintos entre 1 y n que ocupa
+# la posición ps[i] en la lista
+#    (1,2), (1,3), ..., (1,n), (2,1), (2,3), ..., (n,n-1)
+# Por ejemplo,
+#    >>> paresDirigidos(3, np.array([0, 2, 5]))
+#    (array([1, 2, 3]), array([2, 1, 2]))
+def paresDirigidos(n: int,
+                   ps: npt.NDArray[np.int64]) -> tuple[npt.NDArray[np.int64],
+                                                        npt.NDArray[np.int64]]:
+    (xs, ys) = np.divmod(ps, n - 1)
+    ys += ys >= xs
+    return (xs + 1, ys + 1)
+
+def erdosRenyi(n: int,
+               p: float,
+               o: Orientacion = Orientacion.ND,
+               pesos: Optional[tuple[int, int]] = None,
+               semilla: int = 0,
+               m: Any = tad) -> Any:
+    r = np.random.default_rng(semilla)
+    if o == Orientacion.ND:
+        (xs, ys) = paresNoDirigidos(posicionesAleatorias(r, n * (n - 1) // 2, p))
+    else:
+        (xs, ys) = paresDirigidos(n, posicionesAleatorias(r, n * (n - 1), p))
+    return construye(m, o, n, xs, ys, pesos, r)
+
+# ---------------------------------------------------------------------
+# Ejercicio 2. Definir la función
+#    regularAleatorio : (int, int, Optional[tuple[int, int]], int,
+#                        Any) -> Grafo
+# tal que regularAleatorio(n, d, pesos, semilla, m) es un grafo no
+# dirigido d-regular aleatorio (sin lazos ni aristas repetidas) con los
+# vértices de 1 a n. Por ejemplo,
+#    >>> regularAleatorio(6, 3)
+#    G ND ([1, 2, 3, 4, 5, 6], [(1, 3), (1, 4), (1, 6), (2, 3), (2, 4),
+#     (2, 6), (3, 5), (4, 5), (5, 6)])
+#    >>> regularAleatorio(5, 3)
+#    ValueError: No existe ningún grafo 3-regular con 5 vértices
+# ---------------------------------------------------------------------
+
+# Se usa el modelo de configuración: cada vértice se repite d veces, se
+# barajan las n*d repeticiones y se emparejan consecutivamente. Los
+# pares que son lazos o que repiten una arista anterior se reparan
+# intercambiando extremos con otra arista elegida al azar: si (a,b) es
+# un par erróneo y (c,e) una arista, se sustituye (c,e) por (a,c) y
+# (b,e), lo que conserva los grados. El número de pares erróneos no
+# depende de n (es aproximadamente (d²-1)/4), por lo que la reparación
+# apenas tiene coste. Si no se consigue reparar (lo que sólo ocurre con
+# grafos pequeños), se vuelve a empezar con otra permutación.
+
+def clave(x: int, y: int) -> tuple[int, int]:
+    return (x, y) if x <= y else (y, x)
+
+# emparejamiento(n, d, r, aleatorio) es la lista de las aristas de un
+# grafo d-regular con los vértices de 1 a n obtenido con el modelo de
+# configuración, o None si no se consigue reparar en un número
+# razonable de intentos.
+def emparejamiento(n: int,
+                   d: int,
+                   r: np.random.Generator,
+                   aleatorio: Random) -> Optional[list[tuple[int, int]]]:
+    vs = r.permutation(np.repeat(np.arange(1, n + 1), d)).tolist()
+    lista: list[tuple[int, int]] = []
+    conjunto: set[tuple[int, int]] = set()
+    erroneos: list[tuple[int, int]] = []
+    for i in range(0, len(vs), 2):
+        a = clave(vs[i], vs[i + 1])
+        if a[0] == a[1] or a in conjunto:
+            erroneos.append(a)
+        else:
+            lista.append(a)
+            conjunto.add(a)
+    intentos = 100 * (len(erroneos) + d)
+    while erroneos:
+        if not lista or intentos == 0:
+            return None
+        intentos -= 1
+        (a, b) = erroneos[-1]
+        j = aleatorio.randrange(len(lista))
+        (c, e) = lista[j]
+        if aleatorio.random() < 0.5:
+            (c, e) = (e, c)
+        (ac, be) = (clave(a, c), clave(b, e))
+        if a == c or b == e or ac == be or ac in conjunto or be in conjunto:
+            continue
+        erroneos.pop()
+        conjunto.remove(lista[j])
+        lista[j] = ac
+        lista.append(be)
+        conjunto.update((ac, be))
+    return lista
+
+# Si d es mayor que (n-1)/2, es más fácil (y más rápido) construir un
+# grafo (n-1-d)-regular y quedarse con las aristas que no tiene.
+def regularAleatorio(n: int,
+                     d: int,
+                     pesos: Optional[tuple[int, int]] = None,
+                     semilla: int = 0,
+                     m: Any = tad) -> Any:
+    if (n * d) % 2 == 1 or d >= n or d < 0:
+        raise ValueError(f"No existe ningún grafo {d}-regular con {n} vértices")
+    r = np.random.default_rng(semilla)
+    aleatorio = Random(semilla)
+    k = min(d, n - 1 - d)
+    lista = emparejamiento(n, k, r, aleatorio)
+    while lista is None:
+        lista = emparejamiento(n, k, r, aleatorio)
+    if k < d:
+        conjunto = set(lista)
+        lista = [(x, y)
+                 for x in range(1, n + 1)
+                 for y in range(x + 1, n + 1)
+                 if (x, y) not in conjunto]
+    (xs, ys) = np.array(lista, dtype=np.int64).reshape(-1, 2).T
+    return construye(m, Orientacion.ND, n, xs, ys, pesos, r)
+
+# ---------------------------------------------------------------------
+# Ejercicio 3. Definir la función
+#    rejilla : (int, int, Optional[tuple[int, int]], int, Any) -> Grafo
+# tal que rejilla(f, c, pesos, semilla, m) es el grafo no dirigido cuyos
+# vértices son las casillas de una rejilla de f filas y c columnas,
+# numeradas por filas de 1 a f*c, y sus aristas unen las casillas
+# vecinas (horizontal o verticalmente). Por ejemplo,
+#    >>> rejilla(2, 3)
+#    G ND ([1, 2, 3, 4, 5, 6], [(1, 2), (1, 4), (2, 3), (2, 5), (3, 6),
+#     (4, 5), (5, 6)])
+# ---------------------------------------------------------------------
+
+def rejilla(f: int,
+            c: int,
+            pesos: Optional[tuple[int, int]] = None,
+            semilla: int = 0,
+            m: Any = tad) -> Any:
+    r = np.random.default_rng(semilla)
+    vs = np.arange(1, f * c + 1, dtype=np.int64).reshape(f, c)
+    xs = np.concatenate((vs[:, :-1].ravel(), vs[:-1, :].ravel()))
+    ys = np.concatenate((vs[:, 1:].ravel(), vs[1:, :].ravel()))
+    return construye(m, Orientacion.ND, f * c, xs, ys, pesos, r)
+
+# ---------------------------------------------------------------------
+# Ejercicio 4. Definir la función
+#    barabasiAlbert : (int, int, Optional[tuple[int, int]], int,
+#                      Any) -> Grafo
+# tal que barabasiAlbert(n, k, pesos, semilla, m) es el grafo no
+# dirigido con los vértices de 1 a n construido por conexión
+# preferencial: el vértice k+1 se une a los k primeros y cada uno de
+# los siguientes se une a k vértices anteriores distintos, elegidos con
+# probabilidad proporcional a su grado. Por ejemplo,
+#    >>> barabasiAlbert(6, 2)
+#    G ND ([1, 2, 3, 4, 5, 6], [(1, 3), (1, 4), (1, 5), (1, 6), (2, 3),
+#     (3, 4), (4, 5), (4, 6)])
+# ---------------------------------------------------------------------
+
+# Para elegir un vértice con probabilidad proporcional a su grado, se
+# guarda la lista de los extremos de todas las aristas (en la que cada
+# vértice aparece tantas veces como su grado) y se elige un elemento
+# suyo al azar.
+
+def barabasiAlbert(n: int,
+                   k: int,
+                   pesos: Optional[tuple[int, int]] = None,
+                   semilla: int = 0,
+                   m: Any = tad) -> Any:
+    if not 1 <= k < n:
+        raise ValueError(f"Hay que unir cada vértice a entre 1 y {n - 1} vértices")
+    r = np.random.default_rng(semilla)
+    aleatorio = Random(semilla)
+    xs: list[int] = []
+    ys: list[int] = []
+    extremos: list[int] = []
+    destinos = list(range(1, k + 1))
+    for v in range(k + 1, n + 1):
+        xs.extend(destinos)
+        ys.extend([v] * k)
+        extremos.extend(destinos)
+        extremos.extend([v] * k)
+        elegidos: set[int] = set()
+        while len(elegidos) < k:
+            elegidos.add(aleatorio.choice(extremos))
+        destinos = sorted(elegidos)
+    return construye(m, Orientacion.ND, n,
+                     np.array(xs, dtype=np.int64),
+                     np.array(ys, dtype=np.int64),
+                     pesos, r)
+
+# Verificación
+# ============
+
+def test_generadores() -> None:
+    assert str(erdosRenyi(5, 0.4)) == \
+        "G ND ([1, 2, 3, 4, 5], [(1, 3), (1, 4), (2, 3), (2, 4), (3, 5)])"
+    assert str(erdosRenyi(30, 0.2, semilla=7)) == \
+        str(erdosRenyi(30, 0.2, semilla=7))
+    assert not aristas(erdosRenyi(10, 0))
+    assert nAristas(erdosRenyi(10, 1)) == 45
+    assert nAristas(erdosRenyi(10, 1, Orientacion.D)) == 90
+    assert str(rejilla(2, 3)) == \
+        "G ND ([1, 2, 3, 4, 5, 6], [(1, 2), (1, 4), (2, 3), (2, 5), " \
+        "(3, 6), (4, 5), (5, 6)])"
+    assert str(regularAleatorio(6, 3)) == \
+        "G ND ([1, 2, 3, 4, 5, 6], [(1, 3), (1, 4), (1, 6), (2, 3), (2, 4), " \
+        "(2, 6), (3, 5), (4, 5), (5, 6)])"
+    for m in [gd, gc]:
+        assert str(regularAleatorio(6, 3, m=m)) == str(regularAleatorio(6, 3))
+    assert regularidad(regularAleatorio(6, 3)) == 3
+    assert regularidad(regularAleatorio(10, 9)) == 9
+    assert str(barabasiAlbert(6, 2)) == \
+        "G ND ([1, 2, 3, 4, 5, 6], [(1, 3), (1, 4), (1, 5), (1, 6), (2, 3), " \
+        "(3, 4), (4, 5), (4, 6)])"
+    assert nAristas(barabasiAlbert(6, 2)) == 8
+    r = np.random.default_rng(0)
+    frecuencias = np.zeros(10, dtype=int)
+    for _ in range(20000):
+        frecuencias[posicionesAleatorias(r, 10, 1e-3)] += 1
+    assert frecuencias.max() < 40
+    try:
+        regularAleatorio(5, 3)
+        assert False
+    except ValueError:
+        pass
+    print("Verificado")
+
+# La verificación es
+#    >>> test_generadores()
+#    Verificado
+
+# ---------------------------------------------------------------------
+# Ejercicio 5. Definir un generador de grafos grandes para comprobar
+# propiedades de grafos con Hypothesis y comprobar con él las
+# propiedades de los generadores.
+# ---------------------------------------------------------------------
+
+# Generador de grafos grandes. Por ejemplo,
+#    >>> gen_grafoGrande().example()
+#    ('rejilla', G ND ([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, ...
+@composite
+def gen_grafoGrande(draw: Any) -> tuple[str, Grafo]:
+    tipo = draw(st.sampled_from(['erdosRenyiND', 'erdosRenyiD', 'regular',
+                                 'rejilla', 'barabasiAlbert']))
+    semilla = draw(st.integers(0, 10**6))
+    pesos = draw(st.sampled_from([None, (1, 100)]))
+    if tipo == 'erdosRenyiND':
+        return (tipo, erdosRenyi(draw(st.integers(1, 500)),
+                                 draw(st.floats(0, 0.05)),
+                                 Orientacion.ND, pesos, semilla))
+    if tipo == 'erdosRenyiD':
+        return (tipo, erdosRenyi(draw(st.integers(2, 500)),
+                                 draw(st.floats(0, 0.05)),
+                                 Orientacion.D, pesos, semilla))
+    if tipo == 'regular':
+        d = draw(st.integers(0, 6))
+        n = 2 * draw(st.integers(4, 250))
+        return (tipo, regularAleatorio(n, d, pesos, semilla))
+    if tipo == 'rejilla':
+        return (tipo, rejilla(draw(st.integers(1, 30)),
+                              draw(st.integers(1, 30)),
+                              pesos, semilla))
+    n = draw(st.integers(2, 500))
+    k = draw(st.integers(1, min(5, n - 1)))
+    return (tipo, barabasiAlbert(n, k, pesos, semilla))
+
+# La propiedad es
+@settings(deadline=None)
+@given(gen_grafoGrande())
+def test_gen_grafoGrande(tg: tuple[str, Grafo]) -> None:
+    (tipo, g) = tg
+    as_ = [a for (a, _) in aristas(g)]
+    assert len(as_) == len(set(as_))
+    assert nLazos(g) == 0
+    assert sum(grado(g, v) for v in nodos(g)) == 2 * nAristas(g)
+    if tipo == 'rejilla':
+        assert eg.conexo(g)
+    if tipo == 'barabasiAlbert':
+        assert eg.conexo(g)
+        assert len(ag.kruskal(g)) == len(nodos(g)) - 1
+
+# La comprobación es
+#    >>> test_gen_grafoGrande()
+#    >>>
+
+# ---------------------------------------------------------------------
+# Comparación de eficiencia                                          --
+# ---------------------------------------------------------------------
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# Para comparar la eficiencia de los algoritmos de las relaciones
+# Algoritmos_sobre_grafos y Ejercicios_sobre_grafos se usan las
+# rejillas cuadradas con pesos, que son grafos conexos y bipartitos (por
+# lo que se pueden colorear con dos colores alternados).
+
+# coloracion(g, c) es la coloración con dos colores de la rejilla g de
+# c columnas.
+def coloracion(g: Grafo, c: int) -> list[tuple[int, eg.Color]]:
+    return [(v, eg.Color.A if ((v - 1) // c + (v - 1) % c) % 2 == 0
+             else eg.Color.B)
+            for v in nodos(g)]
+
+# algoritmos es la lista de los algoritmos a comparar. Cada uno está
+# representado por su nombre, una función que lo aplica a la rejilla g
+# de c columnas y el mayor número de vértices con el que se aplica (ya
+# que los algoritmos exponenciales o cuadráticos sólo se pueden aplicar
+# a grafos pequeños).
+algoritmos: list[tuple[str, Callable[[Grafo, int], Any], int]] = [
+    ('recorridoEnProfundidad1',
+     lambda g, _: ag.recorridoEnProfundidad1(1, g), 10**4),
+    ('recorridoEnProfundidad',
+     lambda g, _: ag.recorridoEnProfundidad(1, g), 10**4),
+    ('recorridoEnProfundidad3',
+     lambda g, _: ag.recorridoEnProfundidad3(1, g), 10**6),
+    ('recorridoEnAnchura',
+     lambda g, _: ag.recorridoEnAnchura(1, g), 10**4),
+    ('recorridoEnAnchura2',
+     lambda g, _: ag.recorridoEnAnchura2(1, g), 10**6),
+    ('kruskal1', lambda g, _: ag.kruskal1(g), 10**4),
+    ('kruskal', lambda g, _: ag.kruskal(g), 10**6),
+    ('prim1', lambda g, _: ag.prim1(g), 900),
+    ('prim', lambda g, _: ag.prim(g), 10**6),
+    ('anchura', lambda g, _: eg.anchura(g), 9),
+    ('anchura2', lambda g, _: eg.anchura2(g), 9),
+    ('conexo1', lambda g, _: eg.conexo1(g), 10**4),
+    ('conexo', lambda g, _: eg.conexo(g), 10**6),
+    ('correcta', lambda g, c: eg.correcta(coloracion(g, c), g), 10**4),
+    ('aislados', lambda g, _: eg.aislados(g), 10**6),
+    ('conectados1',
+     lambda g, _: eg.conectados1(g, 1, len(nodos(g))), 10**4),
+    ('conectados',
+     lambda g, _: eg.conectados(g, 1, len(nodos(g))), 10**6),
+]
+
+# comparaAlgoritmos(lados) escribe la tabla de los tiempos (en segundos)
+# de los algoritmos sobre las rejillas con pesos de lado l, para cada l
+# de la lista lados. Se escribe un guión si el algoritmo no se aplica a
+# grafos de ese tamaño y "recursión" si se supera el límite de llamadas
+# recursivas de Python. Por ejemplo,
+#    >>> comparaAlgoritmos([3, 10])
+#    vértices                         9       100
+#    recorridoEnProfundidad1       0.00      0.00
+#    ...
+#    anchura                       0.02         -
+#    ...
+def comparaAlgoritmos(lados: list[int]) -> None:
+    gs = [(l * l, l, rejilla(l, l, (1, 1000))) for l in lados]
+    print(f"{'vértices':24}" + "".join(f"{n:>11}" for (n, _, _) in gs))
+    for (nombre, f, maximo) in algoritmos:
+        fila = f"{nombre:24}"
+        for (n, c, g) in gs:
+            if n > maximo:
+                fila += f"{'-':>11}"
+                continue
+            t = default_timer()
+            try:
+                f(g, c)
+                fila += f"{default_timer() - t:11.2f}"
+            except RecursionError:
+                fila += f"{'recursión':>11}"
+        print(fila, flush=True)
+
+# La comparación es
+#    >>> comparaAlgoritmos([3, 10, 30, 100, 300, 1000])
+#    vértices                          9        100        900      10000      90000    1000000
+#    recorridoEnProfundidad1        0.00       0.00  recursión  recursión          -          -
+#    recorridoEnProfundidad         0.00       0.00  recursión  recursión          -          -
+#    recorridoEnProfundidad3        0.00       0.00       0.00       0.02       0.18       2.00
+#    recorridoEnAnchura             0.00       0.00  recursión  recursión          -          -
+#    recorridoEnAnchura2            0.00       0.00       0.01       0.03       0.27       3.49
+#    kruskal1                       0.00       0.00  recursión  recursión          -          -
+#    kruskal                        0.00       0.00       0.00       0.05       0.57       7.22
+#    prim1                          0.00       0.03      17.14          -          -          -
+#    prim                           0.00       0.00       0.00       0.06       0.69       9.44
+#    anchura                        0.00          -          -          -          -          -
+#    anchura2                       0.00          -          -          -          -          -
+#    conexo1                        0.00       0.00  recursión  recursión          -          -
+#    conexo                         0.00       0.00       0.00       0.01       0.10       1.24
+#    correcta                       0.00       0.00       0.14      14.32          -          -
+#    aislados                       0.00       0.00       0.00       0.02       0.38       5.98
+#    conectados1                    0.00       0.00  recursión  recursión          -          -
+#    conectados                     0.00       0.00       0.00       0.02       0.15       1.82
+#
+# Los tiempos de construcción de grafos grandes con GrafoConCSR son
+#    >>> tiempo('erdosRenyi(10**6, 10**-5, m=gc)')
+#    4.53 segundos
+#    >>> tiempo('regularAleatorio(10**6, 4, m=gc)')
+#    4.46 segundos
+#    >>> tiempo('rejilla(1000, 1000, m=gc)')
+#    0.24 segundos
+#    >>> tiempo('barabasiAlbert(10**6, 3, m=gc)')
+#    6.60 segundos
+# En el primer caso (con 5 millones de aristas), la generación de las
+# aristas tarda 0.61 segundos y el resto es la ordenación de las
+# aristas al construir la representación CSR.
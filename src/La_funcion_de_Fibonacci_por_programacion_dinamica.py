@@ -18,8 +18,13 @@
 # Comparar la eficiencia de las dos definiciones.
 # ---------------------------------------------------------------------
 
+from functools import cache
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Optional
+
+from hypothesis import given
+from hypothesis import strategies as st
 
 import numpy as np
 import numpy.typing as npt
@@ -63,15 +68,151 @@ def fib3(n: int) -> int:
 # (vectorFib3 n) es el vector con índices de 0 a n tal que el valor
 # de la posición i es el i-ésimo número de Finonacci. Por ejemplo,
 #    >>> vectorFib3(7)
-#    array([ 0,  1,  1,  2,  3,  5,  8, 13])
-def vectorFib3(n: int) -> npt.NDArray[np.int_]:
-    v = np.zeros(n + 1, dtype=int)
+#    array([0, 1, 1, 2, 3, 5, 8, 13], dtype=object)
+# Los elementos son enteros de Python (dtype=object), ya que con
+# dtype=int se desbordan a partir de fib(93).
+def vectorFib3(n: int) -> npt.NDArray[np.object_]:
+    v = np.zeros(n + 1, dtype=object)
     v[0] = 0
     v[1] = 1
     for i in range(2, n + 1):
         v[i] = v[i - 1] + v[i - 2]
     return v
 
+# 4ª definición (por duplicación)
+# ===============================
+
+# Se usan las fórmulas
+#    fib(2k)   = fib(k) * (2*fib(k+1) - fib(k))
+#    fib(2k+1) = fib(k)^2 + fib(k+1)^2
+# recorriendo los bits de n desde el más significativo, de forma que
+# tras procesar los primeros bits, (a, b) = (fib(k), fib(k+1)), siendo
+# k el número formado por dichos bits. El número de pasos es el número
+# de bits de n.
+def fib4(n: int) -> int:
+    (a, b) = (0, 1)
+    for c in bin(n)[2:]:
+        (a, b) = (a * (2 * b - a), a * a + b * b)
+        if c == "1":
+            (a, b) = (b, a + b)
+    return a
+
+# 5ª definición (con potencias de matrices)
+# =========================================
+
+# Se usa que
+#    ( 1 1 )^n = ( fib(n+1) fib(n)   )
+#    ( 1 0 )     ( fib(n)   fib(n-1) )
+# calculando la potencia por cuadrados sucesivos. Las matrices se
+# representan por tuplas (a, b, c, d) de enteros de Python, para
+# evitar los desbordamientos de numpy.
+
+Matriz = tuple[int, int, int, int]
+
+# producto(p, q) es el producto de las matrices 2x2 p y q. Por ejemplo,
+#    >>> producto((1, 1, 1, 0), (1, 1, 1, 0))
+#    (2, 1, 1, 1)
+def producto(p: Matriz, q: Matriz) -> Matriz:
+    (a, b, c, d) = p
+    (e, f, g, h) = q
+    return (a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h)
+
+# potencia(p, n) es la potencia n-ésima de la matriz p. Por ejemplo,
+#    >>> potencia((1, 1, 1, 0), 7)
+#    (21, 13, 13, 8)
+def potencia(p: Matriz, n: int) -> Matriz:
+    r = (1, 0, 0, 1)
+    while n > 0:
+        if n & 1:
+            r = producto(r, p)
+        p = producto(p, p)
+        n >>= 1
+    return r
+
+def fib5(n: int) -> int:
+    return potencia((1, 1, 1, 0), n)[1]
+
+# Definición principal
+# ====================
+
+# fib(n, m) es el n-ésimo número de Fibonacci, si m es None, y su resto
+# módulo m, en caso contrario. Se calcula por duplicación, como fib4,
+# reduciendo módulo m en cada paso en el segundo caso, por lo que vale
+# para n enormes. Por ejemplo,
+#    >>> fib(6)
+#    8
+#    >>> fib(10**18, 10**9 + 7)
+#    209783453
+def fib(n: int, m: Optional[int] = None) -> int:
+    if m is None:
+        return fib4(n)
+    (a, b) = (0, 1 % m)
+    for c in bin(n)[2:]:
+        (a, b) = (a * (2 * b - a) % m, (a * a + b * b) % m)
+        if c == "1":
+            (a, b) = (b, (a + b) % m)
+    return a
+
+# La sucesión de los restos de los números de Fibonacci módulo m es
+# periódica; su periodo es el periodo de Pisano de m. Por tanto,
+# fib(n, m) = fib(n % periodoPisano(m), m). No se usa en fib, ya que
+# calcular el periodo requiere recorrer la sucesión (que tiene hasta
+# 6m términos), mientras que fib(n, m) sólo necesita un número de pasos
+# igual al número de bits de n; pero es útil cuando se calculan muchos
+# términos módulo un mismo m pequeño. Los periodos calculados se
+# guardan en una caché.
+#
+# periodoPisano(m) es el periodo de Pisano de m. Por ejemplo,
+#    >>> periodoPisano(10)
+#    60
+#    >>> [periodoPisano(m) for m in range(1, 11)]
+#    [1, 3, 8, 6, 20, 24, 16, 12, 24, 60]
+@cache
+def periodoPisano(m: int) -> int:
+    if m == 1:
+        return 1
+    (a, b) = (0, 1)
+    k = 0
+    while True:
+        (a, b) = (b, (a + b) % m)
+        k += 1
+        if (a, b) == (0, 1):
+            return k
+
+# fibs(ns) es la lista de los números de Fibonacci de índices ns. Por
+# ejemplo,
+#    >>> fibs([6, 7, 12, 100])
+#    [8, 13, 144, 354224848179261915075]
+#
+# Los índices se recorren en orden creciente. Si un índice está cerca
+# del anterior (a menos distancia que su número de bits), se llega a él
+# con sumas desde el par (fib(k), fib(k+1)) del anterior. En otro caso,
+# se usa la duplicación de forma recursiva: el par de k se obtiene del
+# de k // 2, guardando los pares calculados en un diccionario común a
+# todos los índices, por lo que los que tienen los mismos bits iniciales
+# comparten parte del cálculo.
+def fibs(ns: list[int]) -> list[int]:
+    memo: dict[int, tuple[int, int]] = {0: (0, 1)}
+
+    def par(k: int) -> tuple[int, int]:
+        if k not in memo:
+            (a, b) = par(k // 2)
+            (c, d) = (a * (2 * b - a), a * a + b * b)
+            memo[k] = (d, c + d) if k % 2 else (c, d)
+        return memo[k]
+
+    valores: dict[int, int] = {}
+    (k, a, b) = (0, 0, 1)
+    for n in sorted(set(ns)):
+        if n - k < n.bit_length():
+            for _ in range(n - k):
+                (a, b) = (b, a + b)
+        else:
+            (a, b) = par(n)
+        k = n
+        valores[n] = a
+    return [valores[n] for n in ns]
+
 # Comparación de eficiencia
 # =========================
 
@@ -92,6 +233,46 @@ def tiempo(e: str) -> None:
 #    0.37 segundos
 #    >>> tiempo('fib3(100000)')
 #    0.08 segundos
+#
+# Tras cambiar vectorFib3 para que use enteros de Python (dtype=object)
+# y no se desborde, fib3 es tan lenta como fib2 (el tiempo anterior de
+# fib3 corresponde a sumas de enteros de 64 bits desbordadas). En una
+# medición posterior, en otra máquina,
+#    >>> tiempo('fib2(100000)')
+#    0.50 segundos
+#    >>> tiempo('fib3(100000)')
+#    0.55 segundos
+#
+#    >>> tiempo('fib4(100000)')
+#    0.00 segundos
+#    >>> tiempo('fib5(100000)')
+#    0.02 segundos
+#
+#    >>> tiempo('fib4(10**6)')
+#    0.10 segundos
+#    >>> tiempo('fib5(10**6)')
+#    0.64 segundos
+#
+#    >>> tiempo('fib4(10**7)')
+#    3.84 segundos
+#    >>> tiempo('fib5(10**7)')
+#    33.81 segundos
+#
+#    >>> tiempo('[fib4(n) for n in range(10**7, 10**7 + 100)]')
+#    (más de 5 minutos)
+#    >>> tiempo('fibs(list(range(10**7, 10**7 + 100)))')
+#    3.98 segundos
+#
+#    >>> tiempo('fib(10**100, 10**9 + 7)')
+#    0.00 segundos
+#    >>> tiempo('periodoPisano(10**6)')
+#    0.28 segundos
+#
+# No se compara fib2(10**7), ya que vectorFib2 guarda todos los términos
+# y necesitaría decenas de GB de memoria. fib5 hace unas 8 veces más
+# multiplicaciones que fib4, ya que calcula las cuatro entradas de la
+# matriz. En fibs, el coste de los 100 términos es prácticamente el de
+# fib4(10**7), ya que los 99 siguientes se obtienen sumando.
 
 # Verificación
 # ============
@@ -100,8 +281,36 @@ def test_fib() -> None:
     assert fib1(6) == 8
     assert fib2(6) == 8
     assert fib3(6) == 8
+    assert fib3(100) == 354224848179261915075
+    assert fib4(6) == 8
+    assert fib5(6) == 8
+    assert fib(6) == 8
+    assert fib(10**18, 10**9 + 7) == 209783453
+    assert [periodoPisano(m) for m in range(1, 11)] == \
+        [1, 3, 8, 6, 20, 24, 16, 12, 24, 60]
+    assert fibs([6, 7, 12, 100]) == [8, 13, 144, 354224848179261915075]
     print("Verificado")
 
 # La verificación es
 #    >>> test_fib()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(st.integers(min_value=0, max_value=1000),
+       st.integers(min_value=1, max_value=100))
+def test_fib_equiv(n: int, m: int) -> None:
+    r = vectorFib2(max(n, 1))[n]
+    assert fib4(n) == r
+    assert fib5(n) == r
+    assert fib(n) == r
+    assert fib(n, m) == r % m
+    assert fib(n, m) == fib(n % periodoPisano(m), m)
+    assert fibs([n, n + 1, n // 2, n]) == \
+        [r, fib4(n + 1), fib4(n // 2), r]
+
+# La comprobación es
+#    >>> test_fib_equiv()
+#    >>>
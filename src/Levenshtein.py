@@ -33,6 +33,12 @@
 
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Callable, Optional
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.ProgramacionDinamica import AlmacenVentana, programacionDinamica
 
 setrecursionlimit(10**6)
 
@@ -93,6 +99,196 @@ def levenshtein2(xs: str, ys: str) -> int:
     n = len(ys)
     return matrizLevenshtein(xs, ys)[m][n]
 
+# 3ª definición (con dos filas)
+# =============================
+
+# Cada fila de matrizLevenshtein sólo depende de la anterior, por lo que
+# basta guardar dos filas. Tomando como filas las de la cadena más
+# corta, la memoria es O(min(n,m)) en lugar de O(n*m).
+def levenshtein3(xs: str, ys: str) -> int:
+    if len(xs) < len(ys):
+        xs, ys = ys, xs
+    anterior = list(range(len(ys) + 1))
+    for (i, x) in enumerate(xs, 1):
+        actual = [i]
+        for (j, y) in enumerate(ys, 1):
+            if x == y:
+                actual.append(anterior[j - 1])
+            else:
+                actual.append(1 + min(anterior[j], actual[j - 1],
+                                      anterior[j - 1]))
+        anterior = actual
+    return anterior[-1]
+
+# 4ª definición (paralela a nivel de bits)
+# ========================================
+
+# Se usa el algoritmo de Myers (en la versión de Hyyrö para la distancia
+# de Levenshtein). Se recorre ys por columnas de la matriz de
+# Levenshtein, pero en lugar de guardar la columna se guardan las
+# diferencias entre cada elemento y el anterior (que sólo pueden ser -1,
+# 0 ó 1) como dos máscaras de bits: pv con las posiciones donde la
+# diferencia es 1 y mv con las posiciones donde es -1. Cada columna se
+# calcula a partir de la anterior con un número fijo de operaciones
+# sobre enteros de m bits (siendo m la longitud de xs) y, como los
+# enteros de Python no tienen límite de tamaño, no hay límite para la
+# longitud de las cadenas.
+
+# patron(xs) es el diccionario que asigna a cada carácter de xs la
+# máscara de las posiciones en las que aparece. Por ejemplo,
+#    >>> patron("casa")
+#    {'c': 1, 'a': 10, 's': 4}
+def patron(xs: str) -> dict[str, int]:
+    p: dict[str, int] = {}
+    for (i, x) in enumerate(xs):
+        p[x] = p.get(x, 0) | 1 << i
+    return p
+
+# levenshteinBits(p, m, ys) es la distancia de Levenshtein entre ys y la
+# cadena de longitud m cuyo patrón es p. Por ejemplo,
+#    >>> levenshteinBits(patron("casa"), 4, "calle")
+#    3
+def levenshteinBits(p: dict[str, int], m: int, ys: str) -> int:
+    if m == 0:
+        return len(ys)
+    todos = (1 << m) - 1
+    ultimo = 1 << (m - 1)
+    pv = todos
+    mv = 0
+    d = m
+    for y in ys:
+        eq = p.get(y, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & todos
+        mh = pv & xh
+        if ph & ultimo:
+            d += 1
+        elif mh & ultimo:
+            d -= 1
+        ph = ((ph << 1) | 1) & todos
+        mh = (mh << 1) & todos
+        pv = (mh | ~(xv | ph)) & todos
+        mv = ph & xv
+    return d
+
+def levenshtein4(xs: str, ys: str) -> int:
+    if len(xs) > len(ys):
+        xs, ys = ys, xs
+    return levenshteinBits(patron(xs), len(xs), ys)
+
+# 5ª definición (con cota)
+# ========================
+
+# levenshteinAcotada(xs, ys, k) es la distancia de Levenshtein entre xs
+# e ys, si es menor o igual que k, y k+1 en caso contrario (si k es
+# negativo, da un error). Por ejemplo,
+#    >>> levenshteinAcotada("casa", "calle", 3)
+#    3
+#    >>> levenshteinAcotada("casa", "calle", 2)
+#    3
+#    >>> levenshteinAcotada("agua", "manantial", 2)
+#    3
+#
+# Los elementos (i,j) de la matriz de Levenshtein son, al menos,
+# |i-j|, por lo que sólo se calculan los de la banda |i-j| <= k (los de
+# fuera se consideran iguales a k+1) y se termina en cuanto todos los
+# de una fila son mayores que k. De cada fila i sólo se guarda la banda,
+# en la que el elemento (i,j) está en la posición j-i+k. Como la
+# distancia es, a lo sumo, la mayor de las longitudes, la anchura de la
+# banda se calcula con k reducida a dicha longitud.
+def levenshteinAcotada(xs: str, ys: str, k: int) -> int:
+    if k < 0:
+        raise ValueError(f"La cota {k} es negativa")
+    if len(xs) < len(ys):
+        xs, ys = ys, xs
+    n = len(xs)
+    m = len(ys)
+    if n - m > k:
+        return k + 1
+    cota = k + 1
+    k = min(k, n)
+    fuera = k + 1
+    anterior = [j - k if 0 <= j - k <= m else fuera
+                for j in range(2 * k + 1)]
+    for i in range(1, n + 1):
+        x = xs[i - 1]
+        actual = [fuera] * (2 * k + 1)
+        for t in range(max(0, k - i), min(2 * k, m - i + k) + 1):
+            j = i + t - k
+            if j == 0:
+                actual[t] = i
+            elif x == ys[j - 1]:
+                actual[t] = anterior[t]
+            else:
+                actual[t] = 1 + min(anterior[t],
+                                    anterior[t + 1] if t < 2 * k else fuera,
+                                    actual[t - 1] if t > 0 else fuera)
+        if min(actual) > k:
+            return cota
+        anterior = actual
+    d = anterior[m - n + k]
+    return d if d < fuera else cota
+
+# 6ª definición (con programacionDinamica)
+# ========================================
+
+# Se usa el procedimiento genérico de ProgramacionDinamica.py guardando
+# sólo dos filas, como en levenshtein3.
+def levenshtein6(xs: str, ys: str) -> int:
+    def calcula(t: Callable[[tuple[int, int]], int],
+                p: tuple[int, int]) -> int:
+        (i, j) = p
+        if i == 0:
+            return j
+        if j == 0:
+            return i
+        if xs[i - 1] == ys[j - 1]:
+            return t((i - 1, j - 1))
+        return 1 + min(t((i - 1, j)), t((i, j - 1)), t((i - 1, j - 1)))
+
+    n = len(xs)
+    m = len(ys)
+    return programacionDinamica(calcula,
+                                ((0, 0), (n, m)),
+                                AlmacenVentana)((n, m))
+
+# Definición principal
+# ====================
+
+# levenshtein(xs, ys, max_dist) es la distancia de Levenshtein entre xs
+# e ys, si max_dist es None; y si no, la distancia acotada por max_dist
+# (como en levenshteinAcotada).
+def levenshtein(xs: str, ys: str, max_dist: Optional[int] = None) -> int:
+    if max_dist is None:
+        return levenshtein4(xs, ys)
+    return levenshteinAcotada(xs, ys, max_dist)
+
+# levenshteins(xs, yss, max_dist) es la lista de las distancias de xs a
+# cada una de las cadenas de yss (acotadas por max_dist, si no es None).
+# Por ejemplo,
+#    >>> levenshteins("casa", ["calle", "casa", "cosas", "manantial"])
+#    [3, 0, 2, 7]
+#    >>> levenshteins("casa", ["calle", "casa", "cosas", "manantial"], 1)
+#    [2, 0, 2, 2]
+#
+# El patrón de xs se calcula una sola vez para todas las cadenas. Con
+# cota, se descartan sin calcular las cadenas cuya longitud difiere de
+# la de xs en más de max_dist.
+def levenshteins(xs: str,
+                 yss: list[str],
+                 max_dist: Optional[int] = None) -> list[int]:
+    p = patron(xs)
+    m = len(xs)
+    if max_dist is None:
+        return [levenshteinBits(p, m, ys) for ys in yss]
+    if max_dist < 0:
+        raise ValueError(f"La cota {max_dist} es negativa")
+    fuera = max_dist + 1
+    return [fuera if abs(len(ys) - m) > max_dist
+            else min(levenshteinBits(p, m, ys), fuera)
+            for ys in yss]
+
 # Comparación de eficiencia
 # =========================
 
@@ -106,6 +302,36 @@ def tiempo(e: str) -> None:
 #    13.78 segundos
 #    >>> tiempo('levenshtein2(str(2**33), str(3**33))')
 #    0.00 segundos
+#
+#    >>> tiempo('levenshtein2("casa"*500, "calle"*400)')
+#    2.53 segundos
+#    >>> tiempo('levenshtein3("casa"*500, "calle"*400)')
+#    1.28 segundos
+#    >>> tiempo('levenshtein4("casa"*500, "calle"*400)')
+#    0.01 segundos
+#    >>> tiempo('levenshtein6("casa"*500, "calle"*400)')
+#    7.33 segundos
+#    >>> tiempo('levenshtein("casa"*500, "calle"*400, max_dist=20)')
+#    0.00 segundos
+#
+#    >>> tiempo('levenshtein4("casa"*12500, "calle"*10000)')
+#    1.44 segundos
+#    >>> tiempo('levenshtein("casa"*12500, "casas"*10000, max_dist=100)')
+#    0.03 segundos
+#    >>> tiempo('levenshtein("casa"*12500, "casa"*12490 + "calle"*8, max_dist=100)')
+#    3.77 segundos
+#
+#    >>> tiempo('[levenshtein2("casa"*50, ys) for ys in ["calle"*40]*100]')
+#    1.88 segundos
+#    >>> tiempo('levenshteins("casa"*50, ["calle"*40]*100)')
+#    0.02 segundos
+#
+# Con cadenas de 50000 caracteres, levenshtein2 necesitaría una matriz
+# de 2500 millones de elementos; levenshtein4 sólo guarda dos enteros
+# de 50000 bits. La versión acotada es la más rápida cuando la cota es
+# pequeña o las cadenas se alejan pronto de la banda (y termina
+# anticipadamente), pero si las cadenas son muy parecidas recorre la
+# banda completa y puede ser más lenta que levenshtein4.
 
 # Verificación
 # ============
@@ -121,4 +347,52 @@ def test_levenshtein() -> None:
     assert levenshtein2("casa",  "casa")      ==  0
     assert levenshtein2("ana",   "maria")     ==  3
     assert levenshtein2("agua",  "manantial") ==  7
+    for levenshtein_ in [levenshtein3, levenshtein4, levenshtein6,
+                         levenshtein]:
+        assert levenshtein_("casa",  "calle")     ==  3
+        assert levenshtein_("calle", "casa")      ==  3
+        assert levenshtein_("casa",  "casa")      ==  0
+        assert levenshtein_("ana",   "maria")     ==  3
+        assert levenshtein_("agua",  "manantial") ==  7
+    assert levenshtein("casa", "calle", max_dist=3) == 3
+    assert levenshtein("casa", "calle", max_dist=2) == 3
+    assert levenshtein("agua", "manantial", max_dist=2) == 3
+    assert levenshtein("casa", "calle", max_dist=10**9) == 3
+    assert levenshtein("", "", max_dist=5) == 0
+    for f in [lambda: levenshtein("casa", "casa", max_dist=-1),
+              lambda: levenshteins("casa", ["casa"], -1)]:
+        try:
+            f()
+            assert False
+        except ValueError:
+            pass
+    assert levenshteins("casa", ["calle", "casa", "cosas", "manantial"]) == \
+        [3, 0, 2, 7]
+    assert levenshteins("casa", ["calle", "casa", "cosas", "manantial"], 1) == \
+        [2, 0, 2, 2]
     print("Verificado")
+
+# La verificación es
+#    >>> test_levenshtein()
+#    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(st.text(alphabet="abc", max_size=10),
+       st.text(alphabet="abc", max_size=10),
+       st.integers(min_value=0, max_value=12))
+def test_levenshtein_equiv(xs: str, ys: str, k: int) -> None:
+    d = levenshtein2(xs, ys)
+    assert levenshtein3(xs, ys) == d
+    assert levenshtein4(xs, ys) == d
+    assert levenshtein6(xs, ys) == d
+    assert levenshtein(xs, ys) == d
+    assert levenshtein(xs, ys, max_dist=k) == min(d, k + 1)
+    assert levenshteins(xs, [ys, xs]) == [d, 0]
+    assert levenshteins(xs, [ys], k) == [min(d, k + 1)]
+
+# La comprobación es
+#    >>> test_levenshtein_equiv()
+#    >>>
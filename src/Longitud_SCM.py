@@ -35,7 +35,14 @@
 #    longitudSCM("aaa", "bbbb")           == 0
 # ---------------------------------------------------------------------
 
+from itertools import accumulate
 from timeit import Timer, default_timer
+from typing import Callable
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.ProgramacionDinamica import AlmacenVentana, programacionDinamica
 
 # 1ª definición (por recursión)
 # =============================
@@ -92,6 +99,96 @@ def longitudSCM2(xs: str, ys: str) -> int:
     m = len(ys)
     return matrizLongitudSCM2(xs, ys)[n][m]
 
+# 3ª definición (con dos filas)
+# =============================
+
+# Cada fila de matrizLongitudSCM2 sólo depende de la anterior, por lo
+# que basta guardar dos filas de la cadena más corta.
+def longitudSCM3(xs: str, ys: str) -> int:
+    if len(xs) < len(ys):
+        xs, ys = ys, xs
+    anterior = [0] * (len(ys) + 1)
+    for x in xs:
+        actual = [0]
+        for (j, y) in enumerate(ys, 1):
+            if x == y:
+                actual.append(1 + anterior[j - 1])
+            else:
+                actual.append(max(anterior[j], actual[j - 1]))
+        anterior = actual
+    return anterior[-1]
+
+# 4ª definición (paralela a nivel de bits)
+# ========================================
+
+# Se usa el algoritmo de Allison-Dix (en la versión de Hyyrö). Se
+# recorre ys por columnas de matrizLongitudSCM2, pero cada columna se
+# representa por la máscara v de las posiciones en las que no aumenta
+# con respecto al elemento anterior de la columna (cuyos elementos
+# aumentan de 0 en 0 o de 1 en 1). Cada columna se calcula a partir de
+# la anterior con cuatro operaciones sobre enteros de n bits (siendo n
+# la longitud de xs).
+
+# patron(xs) es el diccionario que asigna a cada elemento de xs la
+# máscara de las posiciones en las que aparece. Por ejemplo,
+#    >>> patron("amapola")
+#    {'a': 69, 'm': 2, 'p': 8, 'o': 16, 'l': 32}
+def patron(xs: str) -> dict[str, int]:
+    p: dict[str, int] = {}
+    for (i, x) in enumerate(xs):
+        p[x] = p.get(x, 0) | 1 << i
+    return p
+
+# columnaSCM(xs, ys) es la máscara de la última columna de
+# matrizLongitudSCM2(xs, ys). Por ejemplo,
+#    >>> bin(columnaSCM("amapola", "matamoscas"))
+#    '0b111000'
+def columnaSCM(xs: str, ys: str) -> int:
+    p = patron(xs)
+    todos = (1 << len(xs)) - 1
+    v = todos
+    for y in ys:
+        u = v & p.get(y, 0)
+        v = ((v + u) | (v - u)) & todos
+    return v
+
+# filaLongitudSCM(xs, ys) es la lista de las longitudes de las SCM de
+# los i primeros elementos de xs e ys (es decir, la última columna de
+# matrizLongitudSCM2(xs, ys)). Por ejemplo,
+#    >>> filaLongitudSCM("amapola", "matamoscas")
+#    [0, 1, 2, 3, 3, 3, 3, 4]
+# Para no perder los ceros iniciales de la máscara, se le añade un 1 a
+# la izquierda antes de pasarla a binario.
+def filaLongitudSCM(xs: str, ys: str) -> list[int]:
+    bits = bin(columnaSCM(xs, ys) | 1 << len(xs))[3:][::-1]
+    return list(accumulate((b == "0" for b in bits), initial=0))
+
+def longitudSCM4(xs: str, ys: str) -> int:
+    if len(xs) > len(ys):
+        xs, ys = ys, xs
+    return len(xs) - columnaSCM(xs, ys).bit_count()
+
+# 5ª definición (con programacionDinamica)
+# ========================================
+
+# Se usa el procedimiento genérico de ProgramacionDinamica.py guardando
+# sólo dos filas, como en longitudSCM3.
+def longitudSCM5(xs: str, ys: str) -> int:
+    def calcula(t: Callable[[tuple[int, int]], int],
+                p: tuple[int, int]) -> int:
+        (i, j) = p
+        if i == 0 or j == 0:
+            return 0
+        if xs[i - 1] == ys[j - 1]:
+            return 1 + t((i - 1, j - 1))
+        return max(t((i - 1, j)), t((i, j - 1)))
+
+    n = len(xs)
+    m = len(ys)
+    return programacionDinamica(calcula,
+                                ((0, 0), (n, m)),
+                                AlmacenVentana)((n, m))
+
 # Comparación de eficiencia
 # =========================
 
@@ -105,6 +202,20 @@ def tiempo(e: str) -> None:
 #    8.04 segundos
 #    >>> tiempo('longitudSCM2([1,3]*9, [2,3]*9)')
 #    0.00 segundos
+#
+#    >>> tiempo('longitudSCM2("amapola"*300, "matamoscas"*200)')
+#    2.01 segundos
+#    >>> tiempo('longitudSCM3("amapola"*300, "matamoscas"*200)')
+#    1.29 segundos
+#    >>> tiempo('longitudSCM4("amapola"*300, "matamoscas"*200)')
+#    0.00 segundos
+#    >>> tiempo('longitudSCM5("amapola"*300, "matamoscas"*200)')
+#    6.36 segundos
+#
+#    >>> tiempo('longitudSCM4("amapola"*3000, "matamoscas"*2000)')
+#    0.07 segundos
+#    >>> tiempo('longitudSCM4("amapola"*15000, "matamoscas"*10000)')
+#    1.39 segundos
 
 # Verificación
 # ============
@@ -116,8 +227,29 @@ def test_longitudSCM() -> None:
     assert longitudSCM2("amapola", "matamoscas") == 4
     assert longitudSCM2("atamos", "matamoscas")  == 6
     assert longitudSCM2("aaa", "bbbb")           == 0
+    for longitudSCM_ in [longitudSCM3, longitudSCM4, longitudSCM5]:
+        assert longitudSCM_("amapola", "matamoscas") == 4
+        assert longitudSCM_("atamos", "matamoscas")  == 6
+        assert longitudSCM_("aaa", "bbbb")           == 0
     print("Verificado")
 
 # La verificación es
 #    >>> test_longitudSCM()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es
+@given(st.text(alphabet="abc", max_size=12),
+       st.text(alphabet="abc", max_size=12))
+def test_longitudSCM_equiv(xs: str, ys: str) -> None:
+    q = matrizLongitudSCM2(xs, ys)
+    assert longitudSCM3(xs, ys) == q[len(xs)][len(ys)]
+    assert longitudSCM4(xs, ys) == q[len(xs)][len(ys)]
+    assert longitudSCM5(xs, ys) == q[len(xs)][len(ys)]
+    assert filaLongitudSCM(xs, ys) == [r[len(ys)] for r in q]
+
+# La comprobación es
+#    >>> test_longitudSCM_equiv()
+#    >>>
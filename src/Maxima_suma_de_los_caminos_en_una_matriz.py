@@ -41,8 +41,15 @@
 from collections import defaultdict
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Any, Callable
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given
+from hypothesis import strategies as st
 
 from src.Caminos_en_una_matriz import caminos1, caminos2
+from src.ProgramacionDinamica import AlmacenVentana, programacionDinamica
 
 setrecursionlimit(10**6)
 
@@ -123,6 +130,94 @@ def diccionarioMaxSuma(p: list[list[int]]) -> dict[tuple[int, int], int]:
                 q[(i, j)] = max(q[(i,j-1)], q[(i-1,j)]) + p[i-1][j-1]
     return q
 
+# 5ª solución (con programacionDinamica)
+# ======================================
+
+# Se usa el procedimiento genérico de ProgramacionDinamica.py. Como
+# cada fila sólo depende de la anterior, basta guardar dos filas.
+def maximaSuma5(p: list[list[int]]) -> int:
+    def calcula(t: Callable[[tuple[int, int]], int],
+                q: tuple[int, int]) -> int:
+        (i, j) = q
+        if (i, j) == (1, 1):
+            return p[0][0]
+        if i == 1:
+            return t((1, j-1)) + p[0][j-1]
+        if j == 1:
+            return t((i-1, 1)) + p[i-1][0]
+        return max(t((i, j-1)), t((i-1, j))) + p[i-1][j-1]
+
+    m = len(p)
+    n = len(p[0])
+    return programacionDinamica(calcula,
+                                ((1, 1), (m, n)),
+                                AlmacenVentana)((m, n))
+
+# 6ª solución (con numpy, por filas)
+# ==================================
+
+# Se calcula la matriz de diccionarioMaxSuma por filas, cada una a partir
+# de la anterior con operaciones vectoriales de numpy, por lo que sólo
+# hay un bucle de Python sobre las filas y sólo se guardan dos filas.
+# La matriz puede ser una lista de listas o un array de numpy.
+def maximaSuma6(p: npt.NDArray[np.int_]) -> int:
+    (a, tipo) = matrizSumable(p)
+    q = np.cumsum(a[0], dtype=tipo)
+    for fila in a[1:]:
+        q = siguienteFilaMaxSuma(q, fila)
+    return q[-1:].tolist()[0]  # type: ignore[no-any-return]
+
+# matrizSumable(p) es el par (a, t) donde a es el array de la matriz p,
+# convertido al tipo t, y t el tipo de numpy con el que se pueden calcular las sumas de sus
+# caminos sin desbordamientos:
+# + si los elementos son enteros y las sumas (acotadas por el número de
+#   elementos de un camino y una fila por el máximo valor absoluto)
+#   caben en int64, int64;
+# + si son enteros mayores, object (es decir, enteros de Python) y
+# + en otro caso, el tipo de a promocionado al menos a int64 (por
+#   ejemplo, float64 para los reales).
+# Por ejemplo,
+#    >>> matrizSumable([[1, 2], [3, 4]])[1]
+#    <class 'numpy.int64'>
+#    >>> matrizSumable([[1.5, 2], [3, 4]])[1]
+#    dtype('float64')
+#    >>> matrizSumable([[2**62, 2**62], [2**62, 1]])[1]
+#    <class 'object'>
+#    >>> matrizSumable([[10**20]])[1]
+#    <class 'object'>
+def matrizSumable(p: npt.NDArray[np.int_]) -> tuple[npt.NDArray[Any], Any]:
+    a = np.asarray(p)
+    if a.dtype.kind == "f" and not isinstance(p, np.ndarray) \
+       and any(isinstance(x, int) and not -2**63 <= x < 2**63
+               for fila in p for x in fila):
+        a = np.array(p, dtype=object)
+    if a.dtype.kind in "biu":
+        (m, n) = a.shape
+        cota = (m + 2 * n + 1) * max(abs(int(a.min())), abs(int(a.max())))
+        if cota < 2**63:
+            return (a.astype(np.int64, copy=False), np.int64)
+        return (a.astype(object), object)
+    if a.dtype.kind == "O":
+        return (a, object)
+    return (a, np.result_type(a.dtype, np.int64))
+
+# siguienteFilaMaxSuma(q, xs) es la fila de las máximas sumas de los
+# caminos hasta los elementos de la fila xs, siendo q la fila de las
+# máximas sumas de los caminos hasta la fila anterior. Por ejemplo,
+#    >>> siguienteFilaMaxSuma(np.array([1, 7, 18, 20]), np.array([7, 12, 3, 8]))
+#    array([ 8, 20, 23, 31])
+#
+# El camino hasta la posición j de xs llega a la fila por una posición
+# k <= j y sigue por ella hasta j, por lo que su suma máxima es
+#    max(q[k] + xs[k] + ... + xs[j] | k <= j)
+# que, siendo s la lista de las sumas acumuladas de xs, es
+#    s[j] + max(q[k] - (s[k] - xs[k]) | k <= j)
+# y los máximos para todos los j se obtienen con np.maximum.accumulate.
+def siguienteFilaMaxSuma(q: npt.NDArray[np.int_],
+                         xs: npt.NDArray[np.int_]) -> npt.NDArray[np.int_]:
+    s = np.cumsum(xs, dtype=q.dtype)
+    return s + np.maximum.accumulate(q - (s - xs))
+
 # Comparación de eficiencia
 # =========================
 
@@ -140,6 +235,18 @@ def tiempo(e: str) -> None:
 #    0.85 segundos
 #    >>> tiempo('maximaSuma4([list(range(12*n+1, 12*(n+1)+1)) for n in range(12)])')
 #    0.00 segundos
+#    >>> tiempo('maximaSuma5([list(range(12*n+1, 12*(n+1)+1)) for n in range(12)])')
+#    0.00 segundos
+#
+#    >>> tiempo('maximaSuma4([list(range(800*n+1, 800*(n+1)+1)) for n in range(800)])')
+#    1.01 segundos
+#    >>> tiempo('maximaSuma5([list(range(800*n+1, 800*(n+1)+1)) for n in range(800)])')
+#    1.06 segundos
+#    >>> tiempo('maximaSuma6([list(range(800*n+1, 800*(n+1)+1)) for n in range(800)])')
+#    0.07 segundos
+#
+#    >>> tiempo('maximaSuma6(np.arange(1, 10**8+1).reshape(10**4, 10**4))')
+#    1.21 segundos
 
 # Verificación
 # ============
@@ -149,8 +256,44 @@ def test_maximaSuma() -> None:
     assert maximaSuma2([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
     assert maximaSuma3([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
     assert maximaSuma4([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
+    assert maximaSuma5([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
+    assert maximaSuma6([[1,6,11,2],[7,12,3,8],[3,8,4,9]]) == 41
+    assert maximaSuma6(np.array([[1,6,11,2],[7,12,3,8],[3,8,4,9]])) == 41
+    assert maximaSuma6([[1.5,2.5],[3.5,4.5]]) == 9.5
+    assert maximaSuma6([[2**62,2**62],[2**62,1]]) == 2**63 + 1
+    assert maximaSuma6([[10**20]]) == 10**20
+    assert maximaSuma6(np.array([[1,2],[3,4]], dtype=np.uint64)) == 8
+    assert type(maximaSuma6(np.array([[1,2],[3,4]], dtype=np.uint64))) is int
+    assert maximaSuma6(np.array([[2**55+1,2],[3,2**55+1]], dtype=np.uint64)) \
+        == 72057594037927941
+    assert maximaSuma6(np.array([[2**63,1]], dtype=np.uint64)) == 2**63 + 1
     print("Verificado")
 
 # La verificación es
 #    >>> test_maximaSuma()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# Los elementos de cada matriz son enteros pequeños, enteros que no
+# caben en int64 o reales (múltiplos de 0.5, para que las sumas sean
+# exactas).
+elementos = [st.integers(min_value=-20, max_value=20),
+             st.integers(min_value=-2**70, max_value=2**70),
+             st.integers(min_value=-200, max_value=200).map(lambda k: k / 2)]
+
+def matrices(e: st.SearchStrategy[float]
+             ) -> st.SearchStrategy[list[list[float]]]:
+    return st.integers(min_value=1, max_value=8).flatmap(
+        lambda n: st.lists(st.lists(e, min_size=n, max_size=n),
+                           min_size=1, max_size=8))
+
+# La propiedad es
+@given(st.sampled_from(elementos).flatmap(matrices))
+def test_maximaSuma_equiv(m: list[list[float]]) -> None:
+    assert maximaSuma6(m) == maximaSuma4(m)  # type: ignore[arg-type]
+
+# La comprobación es
+#    >>> test_maximaSuma_equiv()
+#    >>>
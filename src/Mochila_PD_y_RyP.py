@@ -0,0 +1,418 @@
+# Mochila_PD_y_RyP.py
+# El problema de la mochila (mediante programación dinámica y
+# ramificación y poda).
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# ---------------------------------------------------------------------
+# Introducción
+# ---------------------------------------------------------------------
+
+# En BEE_Mochila.py se resuelve el problema de la mochila (en el que
+# cada objeto se puede colocar varias veces) calculando con búsqueda en
+# profundidad todos los estados finales y eligiendo el de mayor valor.
+# El número de estados finales crece exponencialmente con la capacidad
+# de la mochila y, además, se guardan todos en memoria.
+#
+# En esta relación se resuelve el problema de tres formas:
+#    + Con programación dinámica, calculando para cada capacidad w
+#      entre 0 y la de la mochila el máximo valor que se puede colocar
+#      en una mochila de capacidad w. El coste es O(n·W), donde n es el
+#      número de objetos y W la capacidad, y sólo se usa memoria O(W).
+#    + Con programación dinámica en la que la actualización para cada
+#      objeto se hace con operaciones vectoriales de NumPy.
+#    + Con ramificación y poda, mediante búsqueda por primero el mejor
+#      en la que los estados se ordenan por una cota superior del valor
+#      que se puede alcanzar (la de la relajación fraccionaria). Su
+#      coste no depende de la capacidad, por lo que es adecuado cuando
+#      la capacidad es muy grande.
+#
+# Las tres funciones devuelven la solución en el mismo formato que la
+# función mochila de BEE_Mochila.py (los objetos ordenados de forma
+# decreciente y el valor obtenido sumándolos en orden creciente).
+
+# ---------------------------------------------------------------------
+# Importaciones
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cmp_to_key
+from random import Random
+from timeit import Timer, default_timer
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.BEE_Mochila import Objeto, Peso, Solucion, Valor, mochila
+from src.BusquedaPrimeroElMejor import buscaPM
+
+# ---------------------------------------------------------------------
+# Ejercicio 1. Definir la función
+#    solucion : (list[Objeto]) -> tuple[Solucion, Valor]
+# tal que solucion(os) es la solución formada por los objetos de os
+# (ordenados de forma decreciente) junto con su valor. Por ejemplo,
+#    >>> solucion([(2,3),(5,10),(3,5)])
+#    ([(5, 10), (3, 5), (2, 3)], 18)
+# ---------------------------------------------------------------------
+
+# El valor se calcula sumando los objetos en orden creciente, como en la
+# función mochila, para obtener el mismo resultado con valores reales.
+def solucion(os: list[Objeto]) -> tuple[Solucion, Valor]:
+    sol = sorted(os, reverse=True)
+    return (sol, sum(v for (_, v) in reversed(sol)))
+
+# ---------------------------------------------------------------------
+# Ejercicio 2. Usando programación dinámica, definir la función
+#    mochilaPD : (list[Objeto], Peso) -> tuple[Solucion, Valor]
+# tal que mochilaPD(os, l) es la solución del problema de la mochila
+# para la lista de objetos os y el límite de capacidad l. Por ejemplo,
+#    >>> mochilaPD([(2,3),(3,5),(4,6),(5,10)], 8)
+#    ([(5, 10), (3, 5)], 15)
+#    >>> mochilaPD([(2,3),(3,5),(5,6)], 10)
+#    ([(3, 5), (3, 5), (2, 3), (2, 3)], 16)
+#    >>> mochilaPD([(8,15),(15,10),(3,6),(6,13), (2,4),(4,8),(5,6),(7,7)], 35)
+#    ([(6, 13), (6, 13), (6, 13), (6, 13), (6, 13), (3, 6), (2, 4)], 75)
+#    >>> mochilaPD([(2,2.8),(3,4.4),(5,6.1)], 10)
+#    ([(3, 4.4), (3, 4.4), (2, 2.8), (2, 2.8)], 14.4)
+# ---------------------------------------------------------------------
+
+# Se supone que los pesos de los objetos son positivos.
+#
+# Se calcula el vector mejor tal que mejor[w] es el máximo valor que se
+# puede colocar en una mochila de capacidad w usando los objetos
+# considerados hasta el momento. Al considerar el objeto i, de peso p y
+# valor v, se recorren las capacidades w en orden creciente y se
+# sustituye mejor[w] por mejor[w-p]+v si es mayor (como mejor[w-p] ya
+# está actualizado, el objeto i se puede usar varias veces).
+#
+# Para reconstruir la solución, en elegido[w] se guarda el último objeto
+# que ha mejorado el valor de mejor[w] (o -1, si no lo ha mejorado
+# ninguno). La solución para la capacidad w está formada por el objeto
+# elegido[w] y la solución para la capacidad w menos su peso.
+def mochilaPD(os: list[Objeto], l: Peso) -> tuple[Solucion, Valor]:
+    obs = sorted(set(os))
+    mejor: list[Valor] = [0] * (l + 1)
+    elegido = [-1] * (l + 1)
+    for (i, (p, v)) in enumerate(obs):
+        for w in range(p, l + 1):
+            x = mejor[w - p] + v
+            if x > mejor[w]:
+                mejor[w] = x
+                elegido[w] = i
+    sol = []
+    w = l
+    while elegido[w] >= 0:
+        o = obs[elegido[w]]
+        sol.append(o)
+        w -= o[0]
+    return solucion(sol)
+
+# ---------------------------------------------------------------------
+# Ejercicio 3. Usando programación dinámica con NumPy, definir la
+# función
+#    mochilaNP : (list[Objeto], Peso) -> tuple[Solucion, Valor]
+# tal que mochilaNP(os, l) es la solución del problema de la mochila
+# para la lista de objetos os y el límite de capacidad l. Por ejemplo,
+#    >>> mochilaNP([(2,3),(3,5),(4,6),(5,10)], 8)
+#    ([(5, 10), (3, 5)], 15)
+#    >>> mochilaNP([(2,2.8),(3,4.4),(5,6.1)], 10)
+#    ([(3, 4.4), (3, 4.4), (2, 2.8), (2, 2.8)], 14.4)
+# ---------------------------------------------------------------------
+
+# El recorrido en orden creciente de mochilaPD no se puede hacer con una
+# operación vectorial, porque cada valor depende de los anteriores. Por
+# ello, cada objeto de peso p y valor v se sustituye por los "bloques"
+# de c = 1, 2, 4, 8, ... copias (mientras que c·p ≤ l), cada uno de los
+# cuales se usa como máximo una vez. Combinando los bloques se puede
+# colocar cualquier número de copias del objeto que quepa en la
+# mochila, y la actualización para un bloque es
+#    mejor[c·p:] = max(mejor[c·p:], mejor[:l+1-c·p] + c·v)
+# que es una operación vectorial.
+#
+# Para reconstruir la solución, además de elegido[w] se guarda en
+# copias[w] el número de copias del bloque que ha mejorado mejor[w].
+#
+# El tipo de mejor es float64 si algún valor es real, int64 si los
+# valores son enteros y las sumas (que están acotadas por 2·l veces el
+# mayor valor absoluto) caben en int64 y object (enteros de Python) en
+# otro caso, para que las comparaciones sean exactas.
+def mochilaNP(os: list[Objeto], l: Peso) -> tuple[Solucion, Valor]:
+    obs = sorted(set(os))
+    mejor: npt.NDArray[Any] = np.zeros(l + 1, dtype=tipoValores(obs, l))
+    elegido: npt.NDArray[np.int_] = np.full(l + 1, -1)
+    copias: npt.NDArray[np.int_] = np.zeros(l + 1, dtype=int)
+    for (i, (p, v)) in enumerate(obs):
+        c = 1
+        while c * p <= l:
+            d = c * p
+            x = mejor[:l + 1 - d] + c * v
+            mejora = np.flatnonzero(x > mejor[d:])
+            mejor[d + mejora] = x[mejora]
+            elegido[d + mejora] = i
+            copias[d + mejora] = c
+            c *= 2
+    sol = []
+    w = l
+    while elegido[w] >= 0:
+        o = obs[elegido[w]]
+        sol.extend([o] * copias[w])
+        w -= copias[w] * o[0]
+    return solucion(sol)
+
+# tipoValores(os, l) es el tipo de numpy con el que se comparan los
+# valores de mochilaNP para los objetos os y la capacidad l. Por
+# ejemplo,
+#    >>> tipoValores([(2,3),(3,5)], 8)
+#    <class 'numpy.int64'>
+#    >>> tipoValores([(2,2.8),(3,5)], 8)
+#    <class 'numpy.float64'>
+#    >>> tipoValores([(1,2**53),(1,2**62)], 8)
+#    <class 'object'>
+def tipoValores(os: list[Objeto], l: Peso) -> Any:
+    if not all(isinstance(v, int) for (_, v) in os):
+        return np.float64
+    if 2 * (l + 1) * max((abs(v) for (_, v) in os), default=0) < 2**63:
+        return np.int64
+    return object
+
+# ---------------------------------------------------------------------
+# Ejercicio 4. Los estados del problema de la mochila para la búsqueda
+# por ramificación y poda son los nodos del árbol en el que los objetos
+# se consideran en orden decreciente de su valor por unidad de peso y,
+# para cada objeto, se decide cuántas copias se colocan. Cada nodo
+# consta de:
+# + su cota: una cota superior del valor de las soluciones que se
+#   pueden alcanzar desde el nodo,
+# + el valor y el peso de los objetos ya colocados,
+# + el índice i del objeto que se está considerando,
+# + el número máximo m de copias del objeto i que se pueden colocar y
+# + los objetos colocados, representados por una lista enlazada de
+#   pares (objeto, número de copias).
+#
+# Definir la clase Nodo de los nodos, ordenados de forma que el menor
+# sea el de mayor cota (y, en caso de empate, el de mayor índice).
+# ---------------------------------------------------------------------
+
+Colocados = Optional[tuple[Objeto, int, 'Colocados']]
+
+@dataclass
+class Nodo:
+    cota: float
+    valor: Valor
+    peso: Peso
+    i: int
+    m: int
+    colocados: Colocados
+
+    def __lt__(self, otro: Nodo) -> bool:
+        return (otro.cota, otro.i) < (self.cota, self.i)
+
+# ---------------------------------------------------------------------
+# Ejercicio 5. Usando búsqueda por primero el mejor, definir la función
+#    mochilaRyP : (list[Objeto], Peso) -> tuple[Solucion, Valor]
+# tal que mochilaRyP(os, l) es la solución del problema de la mochila
+# para la lista de objetos os y el límite de capacidad l. Por ejemplo,
+#    >>> mochilaRyP([(2,3),(3,5),(4,6),(5,10)], 8)
+#    ([(5, 10), (3, 5)], 15)
+#    >>> mochilaRyP([(2,2.8),(3,4.4),(5,6.1)], 10)
+#    ([(3, 4.4), (3, 4.4), (2, 2.8), (2, 2.8)], 14.4)
+#    >>> mochilaRyP([(699999,10),(1000000,15)], 10**7)[1]
+#    150
+# ---------------------------------------------------------------------
+
+# Si los objetos están ordenados de forma decreciente según su valor
+# por unidad de peso, el valor de los objetos que se pueden añadir a
+# un nodo con capacidad libre r en el que se está considerando el
+# objeto i no supera r por el valor por unidad de peso del objeto i
+# (relajación fraccionaria). Más concretamente, si se pueden colocar
+# hasta m copias del objeto i, de peso p y valor v, y el siguiente
+# objeto que cabe en r tiene un valor por unidad de peso q, entonces la
+# cota es
+#    valor + m·v + (r - m·p)·q
+# Nótese que q se calcula con la capacidad libre r (y no con r - m·p)
+# ya que entre los descendientes del nodo están los que colocan menos
+# copias del objeto i y, en ellos, pueden caber objetos que no caben
+# después de colocar las m copias.
+#
+# Si los pesos y los valores son enteros, los valores por unidad de
+# peso se comparan de forma exacta y la cota se redondea por defecto
+# a un entero (lo que sigue siendo una cota, ya que los valores de las
+# soluciones son enteros), para que sea exacta: con números reales, el
+# redondeo de valores grandes puede hacer que se pode la rama óptima.
+#
+# Los sucesores de un nodo que considera el objeto i con m copias son
+#    + el nodo en el que se colocan las m copias y se pasa al siguiente
+#      objeto que cabe en la mochila y
+#    + el nodo en el que se consideran m-1 copias del objeto i (si
+#      m > 0).
+# Las cotas de los sucesores no superan la del nodo, por lo que el
+# primer nodo final (en el que ya se han considerado todos los objetos)
+# que se obtiene con la búsqueda por primero el mejor es óptimo.
+def mochilaRyP(os: list[Objeto], l: Peso) -> tuple[Solucion, Valor]:
+    enteros = all(isinstance(p, int) and isinstance(v, int) for (p, v) in os)
+    obs = [(p, v) for (p, v) in set(os) if p <= l]
+    if enteros:
+        # Se ordenan primero por una aproximación entera del valor por
+        # unidad de peso y luego, comparando exactamente (con productos
+        # cruzados), sólo se corrigen los pocos objetos desordenados.
+        obs.sort(key=lambda o: (-((o[1] << 64) // o[0]), o[0]))
+        obs.sort(key=cmp_to_key(lambda a, b: b[1] * a[0] - a[1] * b[0]
+                                or a[0] - b[0]))
+    else:
+        obs.sort(key=lambda o: (-o[1] / o[0], o[0]))
+    n = len(obs)
+
+    def siguiente(i: int, r: Peso) -> int:
+        """Índice del primer objeto, a partir del i, que cabe en r."""
+        while i < n and obs[i][0] > r:
+            i += 1
+        return i
+
+    def nodo(i: int, m: int, valor: Valor, peso: Peso,
+             colocados: Colocados) -> Nodo:
+        if i == n:
+            return Nodo(valor, valor, peso, i, 0, colocados)
+        (p, v) = obs[i]
+        r = l - peso
+        j = siguiente(i + 1, r)
+        if j == n:
+            resto: Valor = 0
+        elif enteros:
+            resto = (r - m * p) * obs[j][1] // obs[j][0]
+        else:
+            resto = (r - m * p) * obs[j][1] / obs[j][0]
+        return Nodo(valor + m * v + resto, valor, peso, i, m, colocados)
+
+    def sucesores(e: Nodo) -> list[Nodo]:
+        (p, v) = obs[e.i]
+        peso = e.peso + e.m * p
+        colocados = (obs[e.i], e.m, e.colocados) if e.m > 0 else e.colocados
+        j = siguiente(e.i + 1, l - peso)
+        ns = [nodo(j,
+                   (l - peso) // obs[j][0] if j < n else 0,
+                   e.valor + e.m * v,
+                   peso,
+                   colocados)]
+        if e.m > 0:
+            ns.append(nodo(e.i, e.m - 1, e.valor, e.peso, e.colocados))
+        return ns
+
+    def esFinal(e: Nodo) -> bool:
+        return e.i == n
+
+    inicial = nodo(0, l // obs[0][0], 0, 0, None) if n > 0 \
+        else nodo(0, 0, 0, 0, None)
+    e = buscaPM(sucesores, esFinal, inicial)
+    assert e is not None
+    sol = []
+    xs = e.colocados
+    while xs is not None:
+        (o, k, xs) = xs
+        sol.extend([o] * k)
+    return solucion(sol)
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# ejemplo(n, m) es una lista de n objetos, generados aleatoriamente, con
+# pesos y valores enteros entre 1 y m. Por ejemplo,
+#    >>> ejemplo(3, 20)
+#    [(8, 19), (18, 5), (12, 20)]
+def ejemplo(n: int, m: int) -> list[Objeto]:
+    r = Random(n)
+    return [(r.randint(1, m), r.randint(1, m)) for _ in range(n)]
+
+# La comparación es
+#    >>> tiempo('mochila(ejemplo(10, 20), 100)')
+#    2.07 segundos
+#    >>> tiempo('mochilaPD(ejemplo(10, 20), 100)')
+#    0.00 segundos
+#    >>> tiempo('mochilaNP(ejemplo(10, 20), 100)')
+#    0.00 segundos
+#    >>> tiempo('mochilaRyP(ejemplo(10, 20), 100)')
+#    0.00 segundos
+#    >>> tiempo('mochila(ejemplo(10, 20), 150)')
+#    31.52 segundos
+#
+# y mochila(ejemplo(10, 20), 200) agota la memoria.
+#
+# Para ejemplos mayores, los tiempos (en segundos) para ejemplo(n, m)
+# con capacidad l son
+#
+#    +-------+---------+------------+-----------+-----------+------------+
+#    | n     | m       | l          | mochilaPD | mochilaNP | mochilaRyP |
+#    +-------+---------+------------+-----------+-----------+------------+
+#    |   100 |     100 |       1000 |      0.01 |      0.00 |       0.00 |
+#    |  1000 |     100 |      10000 |      0.87 |      0.13 |       0.00 |
+#    |  1000 |    1000 |     100000 |      7.40 |      1.26 |       0.00 |
+#    |  5000 |    1000 |     100000 |           |      5.95 |       0.01 |
+#    |  5000 |    1000 |    1000000 |           |     96.17 |       0.07 |
+#    |  5000 |    1000 |   10000000 |           |           |       0.88 |
+#    |  5000 | 1000000 | 1000000000 |           |           |       0.47 |
+#    | 10000 | 1000000 | 1000000000 |           |           |       2.27 |
+#    +-------+---------+------------+-----------+-----------+------------+
+#
+# Por tanto, la programación dinámica con NumPy es unas 6 veces más
+# rápida que sin NumPy, pero su coste crece con la capacidad, mientras
+# que la ramificación y poda se mantiene rápida con miles de objetos y
+# capacidades muy grandes.
+
+# Verificación
+# ============
+
+def test_MochilaPD() -> None:
+    for f in [mochilaPD, mochilaNP, mochilaRyP]:
+        assert f([(2,3),(3,5),(4,6),(5,10)], 8) == \
+            ([(5,10),(3,5)],15)
+        assert f([(2,3),(3,5),(5,6)], 10) == \
+            ([(3,5),(3,5),(2,3),(2,3)],16)
+        assert f([(2,2.8),(3,4.4),(5,6.1)], 10) == \
+            ([(3,4.4),(3,4.4),(2,2.8),(2,2.8)],14.4)
+        assert f([(3,5)], 2) == ([], 0)
+    assert mochilaRyP([(699999,10),(1000000,15)], 10**7)[1] == 150
+    assert Nodo(6, 0, 0, 0, 0, None) < Nodo(5, 0, 0, 3, 0, None)
+    assert Nodo(5, 0, 0, 3, 0, None) < Nodo(5, 0, 0, 1, 0, None)
+    assert mochilaRyP([(1,2**60),(3,3*2**60+3),(2,2*2**60+1)], 4)[1] == \
+        4 * 2**60 + 3
+    assert mochilaNP([(1,2**53),(1,2**53+1)], 1) == \
+        ([(1, 2**53+1)], 2**53+1)
+    assert mochilaNP([(1,2**62),(2,2**63+1)], 4) == \
+        ([(2, 2**63+1), (2, 2**63+1)], 2**64+2)
+    print("Verificado")
+
+# La verificación es
+#    >>> test_MochilaPD()
+#    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# La propiedad es (los pesos empiezan en 2 para que mochila, que es
+# exponencial, termine en un tiempo razonable)
+@settings(deadline=None)
+@given(st.lists(st.tuples(st.integers(min_value=2, max_value=10),
+                          st.integers(min_value=0, max_value=20)),
+                min_size=1, max_size=5),
+       st.integers(min_value=0, max_value=25))
+def test_mochila_equiv(os: list[Objeto], l: Peso) -> None:
+    (_, v) = mochila(os, l)
+    for f in [mochilaPD, mochilaNP, mochilaRyP]:
+        (sol, v1) = f(os, l)
+        assert v1 == v
+        assert sum(p for (p, _) in sol) <= l
+        assert all(o in os for o in sol)
+
+# La comprobación es
+#    >>> test_mochila_equiv()
+#    >>>
@@ -0,0 +1,347 @@
+# NPuzzle.py
+# El 8-puzzle y el 15-puzzle con tableros codificados.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# ---------------------------------------------------------------------
+# Introducción
+# ---------------------------------------------------------------------
+
+# En BPM_8Puzzle.py los tableros se representan mediante listas de
+# listas, por lo que para calcular cada sucesor se copia el tablero
+# completo (con deepcopy), para calcular su heurística se busca cada
+# pieza recorriendo el tablero y los tableros se comparan como listas
+# de listas.
+#
+# En esta relación se resuelven el 8-puzzle y el 15-puzzle (con
+# tableros de 3x3 y de 4x4, respectivamente) mediante búsqueda A* (ver
+# BusquedaAEstrella.py) usando las siguientes mejoras:
+#    + Los tableros se codifican mediante un número entero en el que
+#      cada casilla ocupa 4 bits, por lo que mover una pieza al hueco
+#      consiste en dos operaciones xor.
+#    + Las posiciones vecinas de cada casilla y las distancias de
+#      Manhattan de cada pieza en cada casilla a su posición final se
+#      calculan una sola vez para cada puzzle.
+#    + La heurística (la suma de las distancias de Manhattan de las
+#      piezas a su posición final) de cada sucesor se calcula a partir
+#      de la de su padre, sumándole la variación de la distancia de la
+#      pieza movida.
+#    + Antes de buscar se comprueba si el tablero tiene solución.
+
+# ---------------------------------------------------------------------
+# Importaciones
+# ---------------------------------------------------------------------
+
+from dataclasses import dataclass
+from timeit import Timer, default_timer
+from typing import Optional
+
+from src.BusquedaAEstrella import buscaAEstrella
+
+# ---------------------------------------------------------------------
+# Ejercicio 1. Los tableros se representan por listas de listas de
+# enteros, donde el 0 representa el hueco, y sus códigos por números
+# enteros.
+#
+# Definir los tipos Tablero y Codigo.
+# ---------------------------------------------------------------------
+
+Tablero = list[list[int]]
+
+Codigo = int
+
+# ---------------------------------------------------------------------
+# Ejercicio 2. Las casillas de un tablero de n filas se numeran de 0 a
+# n^2-1 por filas. El código de un tablero es el número cuyos bits
+# 4i, 4i+1, 4i+2 y 4i+3 son los de la pieza de la casilla i.
+#
+# Definir las funciones
+#    codifica   : (Tablero) -> Codigo
+#    decodifica : (int, Codigo) -> Tablero
+# tales que
+# + codifica(t) es el código del tablero t y
+# + decodifica(n, c) es el tablero de n filas cuyo código es c.
+# Por ejemplo,
+#    >>> codifica([[1,2,3],[8,0,4],[7,6,5]])
+#    23207117601
+#    >>> decodifica(3, 23207117601)
+#    [[1, 2, 3], [8, 0, 4], [7, 6, 5]]
+# ---------------------------------------------------------------------
+
+def codifica(t: Tablero) -> Codigo:
+    return sum(x << 4 * i
+               for (i, x) in enumerate(x for fila in t for x in fila))
+
+def decodifica(n: int, c: Codigo) -> Tablero:
+    return [[(c >> 4 * (n * i + j)) & 15 for j in range(n)]
+            for i in range(n)]
+
+# ---------------------------------------------------------------------
+# Ejercicio 3. Un puzzle queda determinado por su tablero final. Para
+# cada puzzle se guardan
+#    + su número de filas,
+#    + el código de su tablero final,
+#    + la posición del hueco en el tablero final,
+#    + las listas de las casillas vecinas de cada casilla y
+#    + las distancias de Manhattan de cada pieza, en cada casilla, a su
+#      posición en el tablero final.
+#
+# Definir la clase Puzzle y la función
+#    puzzle : (Tablero) -> Puzzle
+# tal que puzzle(t) es el puzzle cuyo tablero final es t. Por
+# ejemplo,
+#    >>> p = puzzle([[1,2,3],[8,0,4],[7,6,5]])
+#    >>> p.vecinas[0]
+#    (3, 1)
+#    >>> p.vecinas[4]
+#    (1, 7, 3, 5)
+#    >>> p.distancias[5]
+#    (4, 3, 2, 3, 2, 1, 2, 1, 0)
+# ---------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Puzzle:
+    n: int
+    final: Codigo
+    huecoFinal: int
+    vecinas: tuple[tuple[int, ...], ...]
+    distancias: tuple[tuple[int, ...], ...]
+
+def puzzle(t: Tablero) -> Puzzle:
+    n = len(t)
+    posiciones = {t[i][j]: (i, j) for i in range(n) for j in range(n)}
+
+    def vecinas(i: int, j: int) -> tuple[int, ...]:
+        return tuple(n * i1 + j1
+                     for (i1, j1) in [(i-1, j), (i+1, j), (i, j-1), (i, j+1)]
+                     if 0 <= i1 < n and 0 <= j1 < n)
+
+    def distancias(x: int) -> tuple[int, ...]:
+        (i0, j0) = posiciones[x]
+        return tuple(abs(i - i0) + abs(j - j0)
+                     for i in range(n) for j in range(n))
+
+    (i, j) = posiciones[0]
+    return Puzzle(n,
+                  codifica(t),
+                  n * i + j,
+                  tuple(vecinas(i, j) for i in range(n) for j in range(n)),
+                  tuple((0,) * n * n if x == 0 else distancias(x)
+                        for x in range(n * n)))
+
+# ---------------------------------------------------------------------
+# Ejercicio 4. Definir los puzzles
+#    puzzle8  : Puzzle
+#    puzzle15 : Puzzle
+# correspondientes al 8-puzzle (con el tablero final de BPM_8Puzzle.py)
+# y al 15-puzzle.
+# ---------------------------------------------------------------------
+
+puzzle8 = puzzle([[1, 2, 3],
+                  [8, 0, 4],
+                  [7, 6, 5]])
+
+puzzle15 = puzzle([[ 1,  2,  3,  4],
+                   [ 5,  6,  7,  8],
+                   [ 9, 10, 11, 12],
+                   [13, 14, 15,  0]])
+
+# ---------------------------------------------------------------------
+# Ejercicio 5. Definir la función
+#    manhattan : (Puzzle, Codigo) -> int
+# tal que manhattan(p, c) es la suma de las distancias de Manhattan de
+# las piezas del tablero de código c a sus posiciones en el tablero
+# final del puzzle p. Por ejemplo,
+#    >>> manhattan(puzzle8, codifica([[2,6,3],[5,0,4],[1,7,8]]))
+#    12
+# ---------------------------------------------------------------------
+
+def manhattan(p: Puzzle, c: Codigo) -> int:
+    return sum(p.distancias[(c >> 4 * i) & 15][i] for i in range(p.n * p.n))
+
+# ---------------------------------------------------------------------
+# Ejercicio 6. Los estados son ternas formadas por el código de un
+# tablero, la posición de su hueco y su heurística.
+#
+# Definir el tipo Estado y la función
+#    sucesores : (Puzzle, Estado) -> list[tuple[Estado, int]]
+# tal que sucesores(p, e) es la lista de los sucesores del estado e en
+# el puzzle p, junto con el coste de pasar a cada uno de ellos (que es
+# 1). Por ejemplo,
+#    >>> c = codifica([[2,1,3],[8,0,4],[7,6,5]])
+#    >>> [(decodifica(3, c1), k, h) for ((c1, k, h), _) in sucesores(puzzle8, (c, 4, 2))]
+#    [([[2, 0, 3], [8, 1, 4], [7, 6, 5]], 1, 3),
+#     ([[2, 1, 3], [8, 6, 4], [7, 0, 5]], 7, 3),
+#     ([[2, 1, 3], [0, 8, 4], [7, 6, 5]], 3, 3),
+#     ([[2, 1, 3], [8, 4, 0], [7, 6, 5]], 5, 3)]
+# ---------------------------------------------------------------------
+
+Estado = tuple[Codigo, int, int]
+
+def sucesores(p: Puzzle, e: Estado) -> list[tuple[Estado, int]]:
+    (c, k, h) = e
+    r = []
+    for k1 in p.vecinas[k]:
+        x = (c >> 4 * k1) & 15
+        d = p.distancias[x]
+        r.append(((c ^ (x << 4 * k1) ^ (x << 4 * k), k1, h - d[k1] + d[k]), 1))
+    return r
+
+# ---------------------------------------------------------------------
+# Ejercicio 7. Cada movimiento intercambia el hueco con una pieza
+# vecina; por tanto, cambia la paridad de la permutación de las
+# casillas y la de la distancia del hueco a su posición final. En
+# consecuencia, un tablero tiene solución si, y sólo si, la paridad de
+# la permutación que lo transforma en el tablero final coincide con la
+# de la distancia de su hueco a la posición final del hueco.
+#
+# Definir la función
+#    tieneSolucion : (Puzzle, Tablero) -> bool
+# tal que tieneSolucion(p, t) se verifica si el tablero t tiene
+# solución en el puzzle p. Por ejemplo,
+#    >>> tieneSolucion(puzzle8, [[2,6,3],[5,0,4],[1,7,8]])
+#    True
+#    >>> tieneSolucion(puzzle8, [[0,8,7],[6,5,4],[3,2,1]])
+#    False
+# ---------------------------------------------------------------------
+
+def tieneSolucion(p: Puzzle, t: Tablero) -> bool:
+    n = p.n
+    xs = [x for fila in t for x in fila]
+    destino = [0] * (n * n)
+    for i in range(n * n):
+        destino[(p.final >> 4 * i) & 15] = i
+    # La permutación lleva cada casilla i a la posición final de su
+    # pieza y su paridad es la de n^2 menos su número de ciclos.
+    visitadas = [False] * (n * n)
+    ciclos = 0
+    for i in range(n * n):
+        if not visitadas[i]:
+            ciclos += 1
+            j = i
+            while not visitadas[j]:
+                visitadas[j] = True
+                j = destino[xs[j]]
+    k = xs.index(0)
+    distancia = abs(k // n - p.huecoFinal // n) + abs(k % n - p.huecoFinal % n)
+    return (n * n - ciclos) % 2 == distancia % 2
+
+# ---------------------------------------------------------------------
+# Ejercicio 8. Definir las funciones
+#    solucion          : (Puzzle, Tablero) -> Optional[list[Tablero]]
+#    solucion_8puzzle  : (Tablero) -> Optional[list[Tablero]]
+#    solucion_15puzzle : (Tablero) -> Optional[list[Tablero]]
+# tales que
+# + solucion(p, t) es una de las soluciones más cortas del puzzle p a
+#   partir del tablero t (o None, si no tiene solución),
+# + solucion_8puzzle(t) es la del 8-puzzle y
+# + solucion_15puzzle(t) es la del 15-puzzle.
+# Por ejemplo,
+#    >>> solucion_8puzzle([[8,1,3],[0,2,4],[7,6,5]])
+#    [[[8, 1, 3], [0, 2, 4], [7, 6, 5]],
+#     [[0, 1, 3], [8, 2, 4], [7, 6, 5]],
+#     [[1, 0, 3], [8, 2, 4], [7, 6, 5]],
+#     [[1, 2, 3], [8, 0, 4], [7, 6, 5]]]
+#    >>> len(solucion_8puzzle([[2,6,3],[5,0,4],[1,7,8]]))
+#    17
+#    >>> solucion_8puzzle([[0,8,7],[6,5,4],[3,2,1]])
+#    >>> len(solucion_15puzzle([[5,1,3,4],[9,2,7,8],[13,6,10,11],[0,14,15,12]]))
+#    10
+#
+# La función solucion_8puzzle tiene el mismo tipo que la de
+# BPM_8Puzzle.py y puede usarse en su lugar. Como usa la misma búsqueda,
+# el mismo orden de los sucesores y la misma heurística que
+# solucion_8puzzle3 de BPM_8Puzzle.py, calcula las mismas soluciones
+# (que son las más cortas).
+# ---------------------------------------------------------------------
+
+def solucion(p: Puzzle, t: Tablero) -> Optional[list[Tablero]]:
+    if not tieneSolucion(p, t):
+        return None
+    c = codifica(t)
+    k = [x for fila in t for x in fila].index(0)
+    r = buscaAEstrella(lambda e: sucesores(p, e),
+                       lambda e: e[0] == p.final,
+                       lambda e: e[2],
+                       (c, k, manhattan(p, c)),
+                       lambda e: e[0])
+    if r is None:
+        return None
+    return [decodifica(p.n, c1) for (c1, _, _) in r]
+
+def solucion_8puzzle(t: Tablero) -> Optional[list[Tablero]]:
+    return solucion(puzzle8, t)
+
+def solucion_15puzzle(t: Tablero) -> Optional[list[Tablero]]:
+    return solucion(puzzle15, t)
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# Recorriendo en anchura los 181440 tableros alcanzables desde el final
+# de puzzle8, se obtiene que los más difíciles necesitan 30
+# movimientos; por ejemplo, [[5,6,7],[4,0,8],[3,2,1]],
+# [[7,6,5],[8,0,4],[3,2,1]] y [[8,6,7],[2,0,5],[3,4,1]]. La comparación
+# con solucion_8puzzle3 de BPM_8Puzzle.py es
+#    >>> import src.BPM_8Puzzle as b
+#    >>> tiempo('b.solucion_8puzzle3([[7,6,5],[8,0,4],[3,2,1]])')
+#    0.24 segundos
+#    >>> tiempo('solucion_8puzzle([[7,6,5],[8,0,4],[3,2,1]])')
+#    0.05 segundos
+#
+#    +---------------------------+--------------+---------------------+------------------+
+#    | Tablero                   |  Movimientos | b.solucion_8puzzle3 | solucion_8puzzle |
+#    +---------------------------+--------------+---------------------+------------------+
+#    | [[2,6,3],[5,0,4],[1,7,8]] |           16 |           0.00 seg. |        0.00 seg. |
+#    | [[8,7,6],[1,0,5],[2,3,4]] |           28 |           0.27 seg. |        0.06 seg. |
+#    | [[5,6,7],[4,0,8],[3,2,1]] |           30 |           0.07 seg. |        0.01 seg. |
+#    | [[7,6,5],[8,0,4],[3,2,1]] |           30 |           0.24 seg. |        0.05 seg. |
+#    | [[8,6,7],[2,0,5],[3,4,1]] |           30 |           0.21 seg. |        0.04 seg. |
+#    | [[0,8,7],[6,5,4],[3,2,1]] | sin solución |           6.94 seg. |        0.00 seg. |
+#    +---------------------------+--------------+---------------------+------------------+
+#
+# Para el 15-puzzle, con tableros obtenidos mediante movimientos
+# aleatorios a partir del final, se obtiene
+#
+#    +-------------------------------------------------+-------------+------------+
+#    | Tablero                                         | Movimientos |     Tiempo |
+#    +-------------------------------------------------+-------------+------------+
+#    | [[1,4,3,8],[7,2,6,0],[5,9,11,12],[10,14,13,15]] |          28 |  0.17 seg. |
+#    | [[1,10,2,6],[5,4,12,15],[13,9,0,14],[11,8,3,7]] |          38 |  0.06 seg. |
+#    | [[6,5,9,3],[13,2,11,10],[1,8,15,4],[14,12,7,0]] |          42 |  0.59 seg. |
+#    | [[1,11,2,10],[13,7,15,6],[12,8,4,9],[14,0,3,5]] |          50 |  2.61 seg. |
+#    | [[9,12,11,13],[4,1,8,5],[10,14,0,7],[3,2,15,6]] |          54 |  4.57 seg. |
+#    | [[0,12,6,11],[14,13,2,10],[8,1,9,15],[5,4,7,3]] |          56 | 23.49 seg. |
+#    +-------------------------------------------------+-------------+------------+
+
+# Verificación
+# ============
+
+def test_NPuzzle() -> None:
+    assert decodifica(3, codifica([[1,2,3],[8,0,4],[7,6,5]])) == \
+        [[1,2,3],[8,0,4],[7,6,5]]
+    assert manhattan(puzzle8, codifica([[2,6,3],[5,0,4],[1,7,8]])) == 12
+    assert tieneSolucion(puzzle8, [[2,6,3],[5,0,4],[1,7,8]])
+    assert not tieneSolucion(puzzle8, [[0,8,7],[6,5,4],[3,2,1]])
+    assert solucion_8puzzle([[8,1,3],[0,2,4],[7,6,5]]) == \
+        [[[8, 1, 3], [0, 2, 4], [7, 6, 5]],
+         [[0, 1, 3], [8, 2, 4], [7, 6, 5]],
+         [[1, 0, 3], [8, 2, 4], [7, 6, 5]],
+         [[1, 2, 3], [8, 0, 4], [7, 6, 5]]]
+    assert [len(solucion_8puzzle(t) or [])
+            for t in [[[2,6,3],[5,0,4],[1,7,8]],
+                      [[5,6,7],[4,0,8],[3,2,1]]]] == [17, 31]
+    assert solucion_8puzzle([[0,8,7],[6,5,4],[3,2,1]]) is None
+    assert len(solucion_15puzzle([[5,1,3,4],[9,2,7,8],[13,6,10,11],
+                                  [0,14,15,12]]) or []) == 10
+    print("Verificado")
+
+# La verificación es
+#    >>> test_NPuzzle()
+#    Verificado
@@ -32,7 +32,11 @@
 # Importaciones
 # ---------------------------------------------------------------------
 
-from src.BusquedaEnAnchura import buscaAnchura
+from timeit import Timer, default_timer
+from typing import Optional
+
+from src.BusquedaConVisitados import buscaCaminos
+from src.BusquedaEnAnchura import buscaAnchura, iterAnchura
 
 # ---------------------------------------------------------------------
 # Ejercicio 1. Un problema es una lista de 3 números enteros (a,b,c)
@@ -188,6 +192,78 @@ def jarras(p: Problema) -> list[Estado]:
                               inicial)
     return [list(reversed(e)) for e in soluciones]
 
+# ---------------------------------------------------------------------
+# Ejercicio 11. Definir la función
+#    jarras1 : (Problema) -> Optional[Estado]
+# tal que jarras1(p) es la primera solución del problema de las
+# jarras p (que, por ser la búsqueda en anchura, es una de las más
+# cortas), o None si no tiene solución. Por ejemplo,
+#    >>> jarras1((4,3,2))
+#    [(0, 0), (4, 0), (1, 3), (1, 0), (0, 1), (4, 1), (2, 3)]
+#    >>> jarras1((15,10,4))
+# ---------------------------------------------------------------------
+
+# La búsqueda se detiene en cuanto se encuentra la primera solución.
+def jarras1(p: Problema) -> Optional[Estado]:
+    e = next(iterAnchura(lambda e: sucesores(p, e),
+                         lambda e: esFinal(p, e),
+                         inicial),
+             None)
+    return None if e is None else list(reversed(e))
+
+# ---------------------------------------------------------------------
+# Ejercicio 12. En la definición de jarras, cada estado contiene el
+# camino recorrido y, para calcular los sucesores, se comprueba que las
+# nuevas configuraciones no están en el camino.
+#
+# Definir, usando la función buscaCaminos de BusquedaConVisitados.py,
+# la función
+#    jarras2: tuple[int,int,int] -> list[list[tuple[int,int]]]
+# tal jarras2((a,b,c)) es la lista de las soluciones del problema de
+# las jarras (a,b,c) en la que los estados son las configuraciones y
+# no se repiten configuraciones. Por tanto, para cada configuración
+# final se obtiene sólo una de las soluciones más cortas. Por ejemplo,
+#    >>> jarras2((4,3,2))
+#    [[(0, 0), (4, 0), (1, 3), (1, 0), (0, 1), (4, 1), (2, 3)],
+#     [(0, 0), (0, 3), (3, 0), (3, 3), (4, 2), (0, 2), (2, 0)]]
+#    >>> jarras2((15,10,5))
+#    [[(0, 0), (15, 0), (5, 10)],
+#     [(0, 0), (0, 10), (10, 0), (10, 10), (15, 5), (0, 5), (5, 0)]]
+#    >>> jarras2((15,10,4))
+#    []
+# ---------------------------------------------------------------------
+
+def jarras2(p: Problema) -> list[list[Configuracion]]:
+    return buscaCaminos(buscaAnchura,
+                        lambda c: sucesorasConfiguracion(p, c),
+                        lambda c: esConfiguracionFinal(p, c),
+                        configuracionInicial,
+                        lambda c: c)
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> tiempo('jarras((97,89,50))')
+#    0.52 segundos
+#    >>> tiempo('jarras2((97,89,50))')
+#    0.00 segundos
+#    >>> tiempo('jarras((397,389,200))')
+#    12.36 segundos
+#    >>> tiempo('jarras2((397,389,200))')
+#    0.01 segundos
+#
+# Incluso comparando con el cálculo de la primera solución,
+#    >>> tiempo('jarras1((997,991,500))')
+#    40.43 segundos
+#    >>> tiempo('jarras2((997,991,500))')
+#    0.01 segundos
+
 # Verificación
 # ============
 
@@ -199,6 +275,14 @@ def test_jarras() -> None:
     assert len(jarras((15,10,5))) == 8
     assert [len(e) for e in jarras((15,10,5))] == [3, 5, 5, 7, 7, 7, 8, 9]
     assert jarras((15,10,4)) == []
+    assert jarras1((4,3,2)) == \
+        [(0, 0), (4, 0), (1, 3), (1, 0), (0, 1), (4, 1), (2, 3)]
+    assert jarras1((15,10,4)) is None
+    assert jarras2((4,3,2)) == jarras((4,3,2))[:2]
+    assert jarras2((15,10,5)) == \
+        [[(0, 0), (15, 0), (5, 10)],
+         [(0, 0), (0, 10), (10, 0), (10, 10), (15, 5), (0, 5), (5, 0)]]
+    assert jarras2((15,10,4)) == []
     print("Verificado")
 
 # La verificación es
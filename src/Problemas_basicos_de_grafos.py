@@ -16,7 +16,10 @@
 # Importación de librerías                                            --
 # ----------------------------------------------------------------------
 
+from random import Random
+from timeit import Timer, default_timer
 from typing import Any, Optional
+from weakref import WeakKeyDictionary
 
 from hypothesis import given
 from hypothesis import strategies as st
@@ -25,6 +28,73 @@ from hypothesis.strategies import composite
 from src.TAD.Grafo import (Grafo, Orientacion, Vertice, adyacentes, aristaEn,
                            aristas, creaGrafo_, dirigido, nodos)
 
+# ----------------------------------------------------------------------
+# Estadísticas de los grafos                                          --
+# ----------------------------------------------------------------------
+
+# Las funciones de los ejercicios sobre grados (incidentes, lazos,
+# gradoPos, gradoNeg, grado, regular, ...) recorren, para cada vértice,
+# los adyacentes de todos los vértices del grafo. Por ello, calcular el
+# grado de todos los vértices tiene un coste cuadrático.
+#
+# En su lugar, se puede recorrer una única vez la lista de aristas y
+# calcular a la vez los grados positivos, los incidentes, los lazos y
+# los grados de todos los vértices. Como los grafos no se modifican
+# después de creados, esas estadísticas se calculan la primera vez que
+# se necesitan y se guardan asociadas al grafo (en un diccionario con
+# referencias débiles, para que no impidan liberar el grafo).
+#
+# Por ejemplo,
+#    >>> e = estadisticas(creaGrafo_(Orientacion.D, (1,3),
+#    ...                             [(1,2),(2,2),(3,1),(3,2)]))
+#    >>> e.gradosPos
+#    {1: 1, 2: 1, 3: 2}
+#    >>> e.incidentes
+#    {1: [3], 2: [1, 2, 3], 3: []}
+#    >>> e.lazos
+#    [(2, 2)]
+#    >>> e.grados
+#    {1: 2, 2: 4, 3: 2}
+
+class Estadisticas:
+    def __init__(self, g: Grafo) -> None:
+        vs = nodos(g)
+        enG = set(vs)
+        self.gradosPos: dict[Vertice, int] = {v: 0 for v in vs}
+        self.incidentes: dict[Vertice, list[Vertice]] = {v: [] for v in vs}
+        self.lazos: list[tuple[Vertice, Vertice]] = []
+        # Las aristas están ordenadas, por lo que las repetidas son
+        # consecutivas y los incidentes de cada vértice se añaden en
+        # orden creciente.
+        anterior = None
+        for ((x, y), _) in aristas(g):
+            if (x, y) == anterior:
+                continue
+            anterior = (x, y)
+            self.gradosPos[x] = self.gradosPos.get(x, 0) + 1
+            if x in enG:
+                self.incidentes.setdefault(y, []).append(x)
+                if x == y:
+                    self.lazos.append((x, x))
+        self.grados: dict[Vertice, int]
+        if dirigido(g):
+            self.grados = {v: self.gradosPos[v] + len(self.incidentes[v])
+                           for v in vs}
+        else:
+            self.grados = {v: len(self.incidentes[v]) for v in vs}
+            for (v, _) in self.lazos:
+                self.grados[v] += 1
+
+_estadisticas: WeakKeyDictionary[Grafo, Estadisticas] = WeakKeyDictionary()
+
+# estadisticas(g) son las estadísticas del grafo g.
+def estadisticas(g: Grafo) -> Estadisticas:
+    e = _estadisticas.get(g)
+    if e is None:
+        e = Estadisticas(g)
+        _estadisticas[g] = e
+    return e
+
 # ---------------------------------------------------------------------
 # Ejercicio 1. El grafo completo de orden n, K(n), es un grafo no
 # dirigido cuyos conjunto de vértices es {1,..n} y tiene una arista
@@ -141,21 +211,31 @@ def test_nVertices() -> None:
 #    [1,2]
 # ---------------------------------------------------------------------
 
-def incidentes(g: Grafo, v: Vertice) -> list[Vertice]:
+# 1ª solución
+# ===========
+
+def incidentes1(g: Grafo, v: Vertice) -> list[Vertice]:
     return [x for x in nodos(g) if v in adyacentes(g, x)]
 
+# 2ª solución
+# ===========
+
+def incidentes(g: Grafo, v: Vertice) -> list[Vertice]:
+    return list(estadisticas(g).incidentes.get(v, []))
+
 # Verificación
 # ============
 
 def test_incidentes() -> None:
     g1 = creaGrafo_(Orientacion.D, (1,3), [(1,2),(2,2),(3,1),(3,2)])
     g2 = creaGrafo_(Orientacion.ND, (1,3), [(1,2),(2,2),(3,1),(3,2)])
-    assert incidentes(g1,1) == [3]
-    assert incidentes(g1,2) == [1, 2, 3]
-    assert incidentes(g1,3) == []
-    assert incidentes(g2, 1) == [2, 3]
-    assert incidentes(g2, 2) == [1, 2, 3]
-    assert incidentes(g2, 3) == [1, 2]
+    for incidentes_ in [incidentes1, incidentes]:
+        assert incidentes_(g1,1) == [3]
+        assert incidentes_(g1,2) == [1, 2, 3]
+        assert incidentes_(g1,3) == []
+        assert incidentes_(g2, 1) == [2, 3]
+        assert incidentes_(g2, 2) == [1, 2, 3]
+        assert incidentes_(g2, 3) == [1, 2]
     print("Verificado")
 
 # La verificación es
@@ -220,17 +300,27 @@ def test_contiguos() -> None:
 #    []
 # ---------------------------------------------------------------------
 
-def lazos(g: Grafo) -> list[tuple[Vertice, Vertice]]:
+# 1ª solución
+# ===========
+
+def lazos1(g: Grafo) -> list[tuple[Vertice, Vertice]]:
     return [(x, x) for x in nodos(g) if aristaEn(g, (x, x))]
 
+# 2ª solución
+# ===========
+
+def lazos(g: Grafo) -> list[tuple[Vertice, Vertice]]:
+    return list(estadisticas(g).lazos)
+
 # Verificación
 # ============
 
 def test_lazos() -> None:
     ej1 = creaGrafo_(Orientacion.D, (1,3), [(1,1),(2,3),(3,2),(3,3)])
     ej2 = creaGrafo_(Orientacion.ND, (1,3), [(2,3),(3,1)])
-    assert lazos(ej1) == [(1,1),(3,3)]
-    assert lazos(ej2) == []
+    for lazos_ in [lazos1, lazos]:
+        assert lazos_(ej1) == [(1,1),(3,3)]
+        assert lazos_(ej2) == []
     print("Verificado")
 
 # La verificación es
@@ -247,8 +337,17 @@ def test_lazos() -> None:
 #    0
 # ---------------------------------------------------------------------
 
+# 1ª solución
+# ===========
+
+def nLazos1(g: Grafo) -> int:
+    return len(lazos1(g))
+
+# 2ª solución
+# ===========
+
 def nLazos(g: Grafo) -> int:
-    return len(lazos(g))
+    return len(estadisticas(g).lazos)
 
 # Verificación
 # ============
@@ -256,8 +355,9 @@ def nLazos(g: Grafo) -> int:
 def test_nLazos() -> None:
     ej1 = creaGrafo_(Orientacion.D, (1,3), [(1,1),(2,3),(3,2),(3,3)])
     ej2 = creaGrafo_(Orientacion.ND, (1,3), [(2,3),(3,1)])
-    assert nLazos(ej1) == 2
-    assert nLazos(ej2) == 0
+    for nLazos_ in [nLazos1, nLazos]:
+        assert nLazos_(ej1) == 2
+        assert nLazos_(ej2) == 0
     print("Verificado")
 
 # La verificación es
@@ -362,9 +462,18 @@ def prop_nAristasCompleto(n: int) -> bool:
 #    3
 # ---------------------------------------------------------------------
 
-def gradoPos(g: Grafo, v: Vertice) -> int:
+# 1ª solución
+# ===========
+
+def gradoPos1(g: Grafo, v: Vertice) -> int:
     return len(adyacentes(g, v))
 
+# 2ª solución
+# ===========
+
+def gradoPos(g: Grafo, v: Vertice) -> int:
+    return estadisticas(g).gradosPos.get(v, 0)
+
 # Verificación
 # ============
 
@@ -373,9 +482,10 @@ def test_GradoPos() -> None:
                     [(1,2),(1,3),(1,5),(2,4),(2,5),(3,4),(3,5),(4,5)])
     g2 = creaGrafo_(Orientacion.D, (1,5),
                     [(1,2),(1,3),(1,5),(2,4),(2,5),(4,3),(4,5)])
-    assert gradoPos(g1, 5) == 4
-    assert gradoPos(g2, 5) == 0
-    assert gradoPos(g2, 1) == 3
+    for gradoPos_ in [gradoPos1, gradoPos]:
+        assert gradoPos_(g1, 5) == 4
+        assert gradoPos_(g2, 5) == 0
+        assert gradoPos_(g2, 1) == 3
     print("Verificado")
 
 # La verificación es
@@ -402,8 +512,17 @@ def test_GradoPos() -> None:
 #      0
 # ---------------------------------------------------------------------
 
+# 1ª solución
+# ===========
+
+def gradoNeg1(g: Grafo, v: Vertice) -> int:
+    return len(incidentes1(g, v))
+
+# 2ª solución
+# ===========
+
 def gradoNeg(g: Grafo, v: Vertice) -> int:
-    return len(incidentes(g, v))
+    return len(estadisticas(g).incidentes.get(v, []))
 
 # Verificación
 # ============
@@ -413,9 +532,10 @@ def test_GradoNeg() -> None:
                     [(1,2),(1,3),(1,5),(2,4),(2,5),(3,4),(3,5),(4,5)])
     g2 = creaGrafo_(Orientacion.D, (1,5),
                     [(1,2),(1,3),(1,5),(2,4),(2,5),(4,3),(4,5)])
-    assert gradoNeg(g1, 5) == 4
-    assert gradoNeg(g2, 5) == 3
-    assert gradoNeg(g2, 1) == 0
+    for gradoNeg_ in [gradoNeg1, gradoNeg]:
+        assert gradoNeg_(g1, 5) == 4
+        assert gradoNeg_(g2, 5) == 3
+        assert gradoNeg_(g2, 1) == 0
     print("Verificado")
 
 # La verificación es
@@ -541,12 +661,26 @@ def test_sumaGrados(g: Grafo) -> None:
 #    4
 # ---------------------------------------------------------------------
 
+# 1ª solución
+# ===========
+
+def grado1(g: Grafo, v: Vertice) -> int:
+    if dirigido(g):
+        return gradoNeg1(g, v) + gradoPos1(g, v)
+    if (v, v) in lazos1(g):
+        return len(incidentes1(g, v)) + 1
+    return len(incidentes1(g, v))
+
+# 2ª solución
+# ===========
+
 def grado(g: Grafo, v: Vertice) -> int:
+    e = estadisticas(g)
+    if v in e.grados:
+        return e.grados[v]
     if dirigido(g):
         return gradoNeg(g, v) + gradoPos(g, v)
-    if (v, v) in lazos(g):
-        return len(incidentes(g, v)) + 1
-    return len(incidentes(g, v))
+    return gradoNeg(g, v)
 
 # Verificación
 # ============
@@ -564,15 +698,16 @@ def test_grado() -> None:
                     [(1,2),(1,3),(2,3),(3,3)])
     g6 = creaGrafo_(Orientacion.D, (1,3),
                     [(1,2),(1,3),(2,3),(3,3)])
-    assert grado(g1, 5) == 4
-    assert grado(g2, 5) == 3
-    assert grado(g2, 1) == 3
-    assert grado(g3, 2) == 4
-    assert grado(g3, 1) == 2
-    assert grado(g3, 3) == 2
-    assert grado(g4, 1) == 2
-    assert grado(g5, 3) == 4
-    assert grado(g6, 3) == 4
+    for grado_ in [grado1, grado]:
+        assert grado_(g1, 5) == 4
+        assert grado_(g2, 5) == 3
+        assert grado_(g2, 1) == 3
+        assert grado_(g3, 2) == 4
+        assert grado_(g3, 1) == 2
+        assert grado_(g3, 3) == 2
+        assert grado_(g4, 1) == 2
+        assert grado_(g5, 3) == 4
+        assert grado_(g6, 3) == 4
     print("Verificado")
 
 # La verificación es
@@ -660,10 +795,19 @@ def test_GradoCompleto(n: int) -> None:
 #    True
 # ---------------------------------------------------------------------
 
-def regular(g: Grafo) -> bool:
+# 1ª solución
+# ===========
+
+def regular1(g: Grafo) -> bool:
     vs = nodos(g)
-    k = grado(g, vs[0])
-    return all(grado(g, v) == k for v in vs)
+    k = grado1(g, vs[0])
+    return all(grado1(g, v) == k for v in vs)
+
+# 2ª solución
+# ===========
+
+def regular(g: Grafo) -> bool:
+    return len(set(estadisticas(g).grados.values())) <= 1
 
 # Verificación
 # ============
@@ -671,9 +815,10 @@ def regular(g: Grafo) -> bool:
 def test_regular() -> None:
     g1 = creaGrafo_(Orientacion.D, (1,3), [(1,2),(2,3),(3,1)])
     g2 = creaGrafo_(Orientacion.ND, (1,3), [(1,2),(2,3)])
-    assert regular(g1)
-    assert not regular(g2)
-    assert regular(completo(4))
+    for regular_ in [regular1, regular]:
+        assert regular_(g1)
+        assert not regular_(g2)
+        assert regular_(completo(4))
     print("Verificado")
 
 # La verificación es
@@ -708,9 +853,21 @@ def prop_CompletoRegular(m: int, n: int) -> bool:
 #    regularidad(grafoCiclo(5))                                   == 2
 # ---------------------------------------------------------------------
 
+# 1ª solución
+# ===========
+
+def regularidad1(g: Grafo) -> Optional[int]:
+    if regular1(g):
+        return grado1(g, nodos(g)[0])
+    return None
+
+# 2ª solución
+# ===========
+
 def regularidad(g: Grafo) -> Optional[int]:
-    if regular(g):
-        return grado(g, nodos(g)[0])
+    gs = set(estadisticas(g).grados.values())
+    if len(gs) == 1:
+        return gs.pop()
     return None
 
 # Verificación
@@ -719,12 +876,13 @@ def regularidad(g: Grafo) -> Optional[int]:
 def test_k_regularidad() -> None:
     g1 = creaGrafo_(Orientacion.ND, (1,2), [(1,2),(2,3)])
     g2 = creaGrafo_(Orientacion.D, (1,2), [(1,2),(2,3)])
-    assert regularidad(g1) == 1
-    assert regularidad(g2) is None
-    assert regularidad(completo(4)) == 3
-    assert regularidad(completo(5)) == 4
-    assert regularidad(grafoCiclo(4)) == 2
-    assert regularidad(grafoCiclo(5)) == 2
+    for regularidad_ in [regularidad1, regularidad]:
+        assert regularidad_(g1) == 1
+        assert regularidad_(g2) is None
+        assert regularidad_(completo(4)) == 3
+        assert regularidad_(completo(5)) == 4
+        assert regularidad_(grafoCiclo(4)) == 2
+        assert regularidad_(grafoCiclo(5)) == 2
     print("Verificado")
 
 # La verificación es
@@ -757,6 +915,77 @@ def prop_cicloRegular(n: int) -> bool:
 #    >>> all(prop_cicloRegular(n) for n in range(3, 21))
 #    True
 
+# ---------------------------------------------------------------------
+# Ejercicio 24. Comprobar con Hypothesis que las dos definiciones de
+# las funciones sobre grados son equivalentes.
+# ---------------------------------------------------------------------
+
+# La propiedad es
+@given(gen_grafo())
+def test_estadisticas(g: Grafo) -> None:
+    vs = nodos(g)
+    assert lazos(g) == lazos1(g)
+    assert nLazos(g) == nLazos1(g)
+    assert regular(g) == regular1(g)
+    assert regularidad(g) == regularidad1(g)
+    for v in vs + [max(vs) + 1]:
+        assert incidentes(g, v) == incidentes1(g, v)
+        assert gradoPos(g, v) == gradoPos1(g, v)
+        assert gradoNeg(g, v) == gradoNeg1(g, v)
+        assert grado(g, v) == grado1(g, v)
+
+# La comprobación es
+#    >>> test_estadisticas()
+#    >>>
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# grafoAleatorio(n, m) es un grafo no dirigido con los vértices de 1 a
+# n y m aristas aleatorias. Por ejemplo,
+#    >>> grafoAleatorio(4, 3)
+#    G ND ([1, 2, 3, 4], [(1, 4), (2, 3), (2, 4)])
+def grafoAleatorio(n: int, m: int) -> Grafo:
+    r = Random(n)
+    return creaGrafo_(Orientacion.ND, (1, n),
+                      [(r.randint(1, n), r.randint(1, n)) for _ in range(m)])
+
+# La comparación es
+#    >>> g = grafoCiclo(2000)
+#    >>> tiempo('regular1(g)')
+#    3.09 segundos
+#    >>> tiempo('regular(g)')
+#    0.00 segundos
+#
+#    >>> g = grafoCiclo(4000)
+#    >>> tiempo('regularidad1(g)')
+#    14.30 segundos
+#    >>> tiempo('regularidad(g)')
+#    0.01 segundos
+#
+#    >>> g = grafoAleatorio(2000, 4000)
+#    >>> tiempo('[grado1(g, v) for v in nodos(g)]')
+#    3.62 segundos
+#    >>> tiempo('[grado(g, v) for v in nodos(g)]')
+#    0.01 segundos
+#
+#    >>> g = grafoAleatorio(10**6, 2*10**6)
+#    >>> tiempo('regularidad(g)')
+#    6.69 segundos
+#    >>> tiempo('regularidad(g)')
+#    0.02 segundos
+#    >>> tiempo('[grado(g, v) for v in nodos(g)]')
+#    0.70 segundos
+#
+# La primera llamada a regularidad calcula (en un único recorrido de
+# las aristas) las estadísticas del grafo y las siguientes consultas
+# las reutilizan.
+
 # Verificación
 # ============
 
@@ -780,4 +1009,5 @@ def prop_cicloRegular(n: int) -> bool:
 #    test_GradoCompleto PASSED
 #    test_regular PASSED
 #    test_k_regularidad PASSED
+#    test_estadisticas PASSED
 #    ====== passed in 1.17s ======
@@ -0,0 +1,337 @@
+# ProgramacionDinamica.py
+# Algoritmo de programación dinámica.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# ----------------------------------------------------------------------
+# Introducción                                                        --
+# ----------------------------------------------------------------------
+
+# La técnica de programación dinámica consiste en resolver un problema
+# a partir de las soluciones de subproblemas suyos que se solapan,
+# calculando cada subproblema una única vez y guardando su solución en
+# una tabla. Los subproblemas se representan por índices (números
+# enteros o tuplas de números enteros) comprendidos entre dos cotas y
+# se resuelven en orden creciente, de forma que, cuando se resuelve uno,
+# ya se han resuelto los subproblemas de los que depende.
+#
+# En los ejercicios de programación dinámica (por ejemplo,
+# Coeficientes_binomiales.py o Levenshtein.py) la tabla se construye
+# cada vez a mano (como una lista de listas, un diccionario o un array
+# de numpy). En esta relación se define un procedimiento genérico,
+# análogo a divideVenceras de DivideVenceras.py, en el que la forma de
+# guardar la tabla (el almacén) se elige en cada problema:
+# + AlmacenDenso guarda todas las soluciones en un array de numpy;
+# + AlmacenVentana sólo guarda las soluciones de las últimas filas (es
+#   decir, de los índices cuya primera coordenada es de las últimas) y
+# + AlmacenDiccionario las guarda en un diccionario, que puede estar
+#   acotado, en cuyo caso se eliminan las usadas hace más tiempo.
+# Si se consulta una solución que no está en el almacén (porque ya se
+# ha eliminado), se vuelve a calcular, por lo que el resultado no
+# depende del almacén, sino sólo el tiempo y la memoria necesarios. Por
+# ello, el almacén tiene que ser suficientemente grande para guardar
+# las soluciones de las que dependen las siguientes; si no lo es, las
+# soluciones se recalculan en cascada, como en la definición recursiva.
+
+# ----------------------------------------------------------------------
+# Librerías auxiliares                                                --
+# ----------------------------------------------------------------------
+
+from abc import abstractmethod
+from collections import OrderedDict
+from functools import partial
+from itertools import product
+from sys import setrecursionlimit
+from timeit import Timer, default_timer
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable, Optional, Protocol, Union
+
+import numpy as np
+
+setrecursionlimit(10**6)
+
+Indice = Union[int, tuple[int, ...]]
+Cotas = tuple[Indice, Indice]
+
+# ----------------------------------------------------------------------
+# Almacenes                                                           --
+# ----------------------------------------------------------------------
+
+# En los almacenes los índices se representan siempre por tuplas. Al
+# consultar un índice que no está en el almacén, se produce KeyError.
+
+# coordenadas(i) es la tupla correspondiente al índice i. Por ejemplo,
+#    >>> coordenadas(3)
+#    (3,)
+#    >>> coordenadas((3, 5))
+#    (3, 5)
+def coordenadas(i: Indice) -> tuple[int, ...]:
+    if isinstance(i, tuple):
+        return i
+    return (i,)
+
+class Almacen(Protocol):
+    """Interfaz de los almacenes de soluciones."""
+    @abstractmethod
+    def __getitem__(self, i: tuple[int, ...]) -> Any:
+        pass
+
+    @abstractmethod
+    def __setitem__(self, i: tuple[int, ...], v: Any) -> None:
+        pass
+
+class AlmacenDenso(Almacen):
+    """Almacén con un array de numpy con todos los índices entre las
+    cotas. Las posiciones sin solución contienen el objeto vacio (y no
+    None, que puede ser una solución). Los índices fuera de las cotas
+    producen IndexError."""
+    vacio = object()
+
+    def __init__(self, cotas: Cotas) -> None:
+        self.inicio = coordenadas(cotas[0])
+        fin = coordenadas(cotas[1])
+        self.tabla = np.full([y - x + 1 for (x, y) in zip(self.inicio, fin)],
+                             AlmacenDenso.vacio,
+                             dtype=object)
+        self.desplazado = any(self.inicio)
+
+    # Las posiciones mayores que las cotas producen IndexError en numpy,
+    # pero las negativas se contarían desde el final.
+    def posicion(self, i: tuple[int, ...]) -> tuple[int, ...]:
+        p = tuple(x - a for (x, a) in zip(i, self.inicio)) \
+            if self.desplazado else i
+        if min(p) < 0:
+            raise IndexError(f"Índice fuera de las cotas: {i}")
+        return p
+
+    def __getitem__(self, i: tuple[int, ...]) -> Any:
+        v = self.tabla[self.posicion(i)]
+        if v is AlmacenDenso.vacio:
+            raise KeyError(i)
+        return v
+
+    def __setitem__(self, i: tuple[int, ...], v: Any) -> None:
+        self.tabla[self.posicion(i)] = v
+
+class AlmacenVentana(Almacen):
+    """Almacén que sólo guarda las soluciones de las ancho últimas filas
+    (siendo la fila de un índice su primera coordenada), cada una en un
+    diccionario."""
+    def __init__(self, cotas: Cotas, ancho: int = 2) -> None:
+        self.ancho = ancho
+        self.filas = [coordenadas(cotas[0])[0] - 1] * ancho
+        self.tabla: list[dict[tuple[int, ...], Any]] = \
+            [{} for _ in range(ancho)]
+
+    def __getitem__(self, i: tuple[int, ...]) -> Any:
+        return self.tabla[i[0] % self.ancho][i]
+
+    def __setitem__(self, i: tuple[int, ...], v: Any) -> None:
+        k = i[0] % self.ancho
+        if self.filas[k] != i[0]:
+            self.filas[k] = i[0]
+            self.tabla[k] = {}
+        self.tabla[k][i] = v
+
+class AlmacenDiccionario(Almacen):
+    """Almacén con un diccionario. Si capacidad no es None, sólo se
+    guardan las capacidad soluciones usadas más recientemente."""
+    def __init__(self,
+                 cotas: Cotas,
+                 capacidad: Optional[int] = None) -> None:
+        self.capacidad = capacidad
+        self.tabla: OrderedDict[tuple[int, ...], Any] = OrderedDict()
+
+    def __getitem__(self, i: tuple[int, ...]) -> Any:
+        v = self.tabla[i]
+        if self.capacidad is not None:
+            self.tabla.move_to_end(i)
+        return v
+
+    def __setitem__(self, i: tuple[int, ...], v: Any) -> None:
+        self.tabla[i] = v
+        if self.capacidad is not None:
+            self.tabla.move_to_end(i)
+            if len(self.tabla) > self.capacidad:
+                self.tabla.popitem(last=False)
+
+# ---------------------------------------------------------------------
+# Ejercicio 1. Definir la función
+#    programacionDinamica(Callable[[Callable[[Indice], V], Indice], V],
+#                         Cotas,
+#                         Callable[[Cotas], Almacen]) -> Callable[[Indice], V]
+# tal que programacionDinamica(calcula, cotas, almacen) es la tabla (es
+# decir, la función que asigna a cada índice su solución) obtenida por
+# programación dinámica, donde
+# + calcula(t, i) es la solución del subproblema de índice i, usando la
+#   tabla t para obtener las soluciones de los subproblemas de los que
+#   depende (que tienen que ser anteriores a i en el orden
+#   lexicográfico),
+# + cotas es el par formado por el primer y el último índice y
+# + almacen(cotas) es el almacén donde se guardan las soluciones (por
+#   defecto, AlmacenDenso).
+#
+# Usando la función programacionDinamica definir las funciones
+#    fib             : (int, Callable[[Cotas], Almacen]) -> int
+#    numeroDeCaminos : (int, int, Callable[[Cotas], Almacen]) -> int
+# tales que
+# + fib(n, almacen) es el n-ésimo término de la sucesión de Fibonacci.
+#   Por ejemplo,
+#      >>> fib(6)
+#      8
+#      >>> fib(6, AlmacenVentana)
+#      8
+# + numeroDeCaminos(m, n, almacen) es el número de caminos en una
+#   retícula desde el punto (0,0) hasta el (m,n) moviéndose en cada
+#   paso una unidad hacia la derecha o hacia arriba. Por ejemplo,
+#      >>> numeroDeCaminos(2, 3)
+#      10
+#      >>> numeroDeCaminos(2, 3, AlmacenDiccionario)
+#      10
+# ---------------------------------------------------------------------
+
+def programacionDinamica(calcula: Callable[[Callable[[Any], Any], Any], Any],
+                         cotas: Cotas,
+                         almacen: Callable[[Cotas], Almacen] = AlmacenDenso
+                         ) -> Callable[[Any], Any]:
+    a = almacen(cotas)
+    unidimensional = not isinstance(cotas[0], tuple)
+
+    def t(i: Any) -> Any:
+        try:
+            return a[i]
+        except KeyError:
+            v = calcula(t, i)
+            a[i] = v
+            return v
+
+    def t1(i: int) -> Any:
+        try:
+            return a[(i,)]
+        except KeyError:
+            v = calcula(t1, i)
+            a[(i,)] = v
+            return v
+
+    rangos = [range(x, y + 1)
+              for (x, y) in zip(coordenadas(cotas[0]),
+                                coordenadas(cotas[1]))]
+    if unidimensional:
+        for (i,) in product(*rangos):
+            a[(i,)] = calcula(t1, i)
+        return t1
+    for c in product(*rangos):
+        a[c] = calcula(t, c)
+    return t
+
+def fib(n: int,
+        almacen: Callable[[Cotas], Almacen] = AlmacenDenso) -> int:
+    def calcula(t: Callable[[int], int], i: int) -> int:
+        if i < 2:
+            return i
+        return t(i - 1) + t(i - 2)
+
+    return programacionDinamica(calcula, (0, n), almacen)(n)
+
+def numeroDeCaminos(m: int,
+                    n: int,
+                    almacen: Callable[[Cotas], Almacen] = AlmacenDenso
+                    ) -> int:
+    def calcula(t: Callable[[tuple[int, int]], int],
+                p: tuple[int, int]) -> int:
+        (i, j) = p
+        if i == 0 or j == 0:
+            return 1
+        return t((i - 1, j)) + t((i, j - 1))
+
+    return programacionDinamica(calcula, ((0, 0), (m, n)), almacen)((m, n))
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+def memoria(e: str) -> None:
+    """Memoria máxima (en MB) usada al evaluar la expresión e."""
+    start()
+    eval(e, globals())
+    m = get_traced_memory()[1]
+    stop()
+    print(f"{m / 10**6:0.1f} MB")
+
+# La comparación es
+#    >>> tiempo('fib(20000)')
+#    0.03 segundos
+#    >>> tiempo('fib(20000, AlmacenVentana)')
+#    0.02 segundos
+#    >>> tiempo('fib(20000, AlmacenDiccionario)')
+#    0.03 segundos
+#    >>> tiempo('fib(20000, partial(AlmacenDiccionario, capacidad=3))')
+#    0.02 segundos
+#
+#    >>> tiempo('numeroDeCaminos(300, 300)')
+#    0.06 segundos
+#    >>> tiempo('numeroDeCaminos(300, 300, AlmacenVentana)')
+#    0.07 segundos
+#    >>> tiempo('numeroDeCaminos(300, 300, AlmacenDiccionario)')
+#    0.07 segundos
+#    >>> tiempo('numeroDeCaminos(300, 300, partial(AlmacenDiccionario, capacidad=700))')
+#    0.10 segundos
+#
+#    >>> memoria('numeroDeCaminos(1000, 1000)')
+#    151.2 MB
+#    >>> memoria('numeroDeCaminos(1000, 1000, AlmacenVentana)')
+#    0.6 MB
+#    >>> memoria('numeroDeCaminos(1000, 1000, AlmacenDiccionario)')
+#    289.9 MB
+#    >>> memoria('numeroDeCaminos(1000, 1000, partial(AlmacenDiccionario, capacidad=2500))')
+#    1.2 MB
+#
+# Los tiempos de los almacenes son parecidos, pero la memoria no: la
+# ventana sólo guarda dos filas. El diccionario acotado tiene que poder
+# guardar algo más de dos filas, ya que al consultar las soluciones de
+# la fila anterior se marcan como recientes; con una capacidad menor
+# (por ejemplo, 302) se recalculan en cascada y no termina.
+#
+# En los ejercicios en los que se ha usado programacionDinamica (con
+# AlmacenVentana) el cálculo es entre 1 y 4 veces más lento que con la
+# tabla construida a mano, por las llamadas a la tabla y al almacén,
+# pero la memoria es la de dos filas.
+
+# Verificación
+# ============
+
+def test_programacionDinamica() -> None:
+    almacenes = [AlmacenDenso,
+                 AlmacenVentana,
+                 AlmacenDiccionario,
+                 partial(AlmacenDiccionario, capacidad=3)]
+    for almacen in almacenes:
+        assert fib(6, almacen) == 8
+        assert fib(50, almacen) == 12586269025
+        assert numeroDeCaminos(2, 3, almacen) == 10
+        assert numeroDeCaminos(8, 8, almacen) == 12870
+        llamadas = []
+
+        def calcula(t: Callable[[int], Any], i: int) -> Any:
+            llamadas.append(i)
+            return None if i == 0 else t(i - 1)
+
+        assert programacionDinamica(calcula, (0, 5), almacen)(5) is None
+        assert llamadas == [0, 1, 2, 3, 4, 5]
+    a = AlmacenDenso(((1, 1), (3, 3)))
+    for i in [(0, 1), (1, 4)]:
+        try:
+            a[i] = 0
+            assert False
+        except IndexError:
+            pass
+    print("Verificado")
+
+# La verificación es
+#    >>> test_programacionDinamica()
+#    Verificado
@@ -40,6 +40,9 @@
 from collections import defaultdict
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
+from typing import Callable
+
+from src.ProgramacionDinamica import AlmacenVentana, programacionDinamica
 
 setrecursionlimit(10**6)
 
@@ -90,6 +93,26 @@ def diccionarioCaminos(p: tuple[int, int]) -> dict[tuple[int, int], list[list[tu
                 q[(i, j)] = [[(i, j)] + cs for cs in q[(i-1, j)] + q[(i, j-1)]]
     return q
 
+# 3ª solución (con programacionDinamica)
+# ======================================
+
+# Se usa el procedimiento genérico de ProgramacionDinamica.py guardando
+# sólo dos filas de las listas de caminos de diccionarioCaminos.
+def caminos3(p: tuple[int, int]) -> list[list[tuple[int, int]]]:
+    def calcula(t: Callable[[tuple[int, int]], list[list[tuple[int, int]]]],
+                q: tuple[int, int]) -> list[list[tuple[int, int]]]:
+        (i, j) = q
+        if i == 1:
+            return [[(1, z) for z in range(j, 0, -1)]]
+        if j == 1:
+            return [[(z, 1) for z in range(i, 0, -1)]]
+        return [[(i, j)] + cs for cs in t((i-1, j)) + t((i, j-1))]
+
+    return [list(reversed(ps))
+            for ps in programacionDinamica(calcula,
+                                           ((1, 1), p),
+                                           AlmacenVentana)(p)]
+
 # Comparación de eficiencia
 # =========================
 
@@ -103,6 +126,8 @@ def tiempo(e: str) -> None:
 #    26.75 segundos
 #    >>> tiempo('max(caminos2((13,13))[0])')
 #    7.40 segundos
+#    >>> tiempo('max(caminos3((13,13))[0])')
+#    8.46 segundos
 
 # Verificación
 # ============
@@ -116,6 +141,10 @@ def test_caminos() -> None:
         [[(1,1),(1,2),(1,3),(2,3)],
          [(1,1),(1,2),(2,2),(2,3)],
          [(1,1),(2,1),(2,2),(2,3)]]
+    assert caminos3((2,3)) == \
+        [[(1,1),(1,2),(1,3),(2,3)],
+         [(1,1),(1,2),(2,2),(2,3)],
+         [(1,1),(2,1),(2,2),(2,3)]]
     print("Verificado")
 
 # La verificación es
@@ -0,0 +1,239 @@
+# Reinas_con_mascaras_de_bits.py
+# El problema de las n reinas mediante máscaras de bits.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# ---------------------------------------------------------------------
+# Introducción
+# ---------------------------------------------------------------------
+
+# En BEE_Reinas_Anchura.py y BEE_Reinas_Profundidad.py, para comprobar
+# si una reina se puede colocar se recorre la solución parcial (con la
+# función valida) y cada sucesor copia la solución parcial, por lo que
+# a partir de n = 13 el cálculo de las soluciones es muy lento.
+#
+# En esta relación se colocan las reinas columna a columna y se
+# representan mediante máscaras de bits (números enteros) las filas y
+# las diagonales ocupadas por las reinas colocadas. Así, las filas
+# libres para la reina de la siguiente columna se calculan con unas
+# pocas operaciones sobre enteros.
+#
+# Además, se usan las siguientes mejoras:
+#    + Por simetría respecto de la fila central, las soluciones cuya
+#      primera reina está en la fila r se obtienen reflejando las
+#      soluciones cuya primera reina está en la fila n+1-r. Por tanto,
+#      basta calcular las soluciones con la primera reina en la mitad
+#      superior (y, si n es impar, en la fila central).
+#    + Los cálculos para cada fila de la primera reina son
+#      independientes, por lo que se pueden repartir entre varios
+#      procesos.
+
+# ---------------------------------------------------------------------
+# Importaciones
+# ---------------------------------------------------------------------
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from timeit import Timer, default_timer
+from typing import Callable, Iterator, TypeVar
+
+from src.BEE_Reinas_Anchura import Fila, SolNR
+from src.BEE_Reinas_Anchura import solucionesNR as solucionesNRAnchura
+
+B = TypeVar('B')
+
+# ---------------------------------------------------------------------
+# Ejercicio 1. Definir la función
+#    iterFilas : (int, int) -> Iterator[list[Fila]]
+# tal que iterFilas(n, r) es el generador de las soluciones del
+# problema de las n reinas cuya primera reina está en la fila r,
+# representadas por la lista de las filas de las reinas de cada
+# columna, en orden lexicográfico. Por ejemplo,
+#    >>> list(iterFilas(6, 2))
+#    [[2, 4, 6, 1, 3, 5]]
+#    >>> list(iterFilas(6, 1))
+#    []
+# ---------------------------------------------------------------------
+
+# En las máscaras, el bit i corresponde a la fila i+1. Si una reina
+# amenaza la fila i en una diagonal descendente (resp. ascendente), en
+# la columna siguiente amenaza la fila i+1 (resp. i-1); por tanto, las
+# máscaras de las diagonales se desplazan un bit al pasar a la
+# siguiente columna.
+def iterFilas(n: int, r: int) -> Iterator[list[Fila]]:
+    todas = (1 << n) - 1
+    filas: list[Fila] = [r]
+
+    def aux(ocupadas: int, desc: int, asc: int) -> Iterator[list[Fila]]:
+        if ocupadas == todas:
+            yield filas.copy()
+            return
+        libres = todas & ~(ocupadas | desc | asc)
+        while libres:
+            b = libres & -libres
+            libres ^= b
+            filas.append(b.bit_length())
+            yield from aux(ocupadas | b,
+                           ((desc | b) << 1) & todas,
+                           (asc | b) >> 1)
+            filas.pop()
+
+    b0 = 1 << (r - 1)
+    yield from aux(b0, (b0 << 1) & todas, b0 >> 1)
+
+# ---------------------------------------------------------------------
+# Ejercicio 2. Definir la función
+#    nSolucionesFila : (int, int) -> int
+# tal que nSolucionesFila(n, r) es el número de soluciones del problema
+# de las n reinas cuya primera reina está en la fila r. Por ejemplo,
+#    >>> nSolucionesFila(8, 1)
+#    4
+#    >>> [nSolucionesFila(8, r) for r in range(1, 9)]
+#    [4, 8, 16, 18, 18, 16, 8, 4]
+# ---------------------------------------------------------------------
+
+def nSolucionesFila(n: int, r: int) -> int:
+    todas = (1 << n) - 1
+
+    def aux(ocupadas: int, desc: int, asc: int) -> int:
+        if ocupadas == todas:
+            return 1
+        k = 0
+        libres = todas & ~(ocupadas | desc | asc)
+        while libres:
+            b = libres & -libres
+            libres ^= b
+            k += aux(ocupadas | b, ((desc | b) << 1) & todas, (asc | b) >> 1)
+        return k
+
+    b0 = 1 << (r - 1)
+    return aux(b0, (b0 << 1) & todas, b0 >> 1)
+
+# ---------------------------------------------------------------------
+# Ejercicio 3. Definir la función
+#    porFilas : (Callable[[int], B], int, int) -> list[B]
+# tal que porFilas(f, n, p) es la lista de los valores de f para las
+# filas de la mitad superior del tablero de n filas (incluyendo la
+# central, si n es impar), calculados con p procesos. Por ejemplo,
+#    >>> porFilas(lambda r: 10 * r, 5, 1)
+#    [10, 20, 30]
+# ---------------------------------------------------------------------
+
+def porFilas(f: Callable[[int], B], n: int, procesos: int) -> list[B]:
+    filas = range(1, (n + 1) // 2 + 1)
+    if procesos <= 1:
+        return [f(r) for r in filas]
+    with ProcessPoolExecutor(procesos) as ejecutor:
+        return list(ejecutor.map(f, filas))
+
+# ---------------------------------------------------------------------
+# Ejercicio 4. Definir la función
+#    nSolucionesNR : (int, int) -> int
+# tal que nSolucionesNR(n, procesos=1) es el número de soluciones del
+# problema de las n reinas, calculado con el número de procesos
+# indicado. Por ejemplo,
+#    >>> nSolucionesNR(8)
+#    92
+#    >>> nSolucionesNR(14, procesos=2)
+#    365596
+# ---------------------------------------------------------------------
+
+def nSolucionesNR(n: int, procesos: int = 1) -> int:
+    ks = porFilas(partial(nSolucionesFila, n), n, procesos)
+    if n % 2 == 0:
+        return 2 * sum(ks)
+    return 2 * sum(ks[:-1]) + ks[-1]
+
+# ---------------------------------------------------------------------
+# Ejercicio 5. Definir la función
+#    solucionesNR : (int, int) -> list[SolNR]
+# tal que solucionesNR(n, procesos=1) es la lista de las soluciones
+# del problema de las n reinas (en el mismo formato y orden que las de
+# BEE_Reinas_Anchura.py), calculada con el número de procesos
+# indicado. Por ejemplo,
+#    >>> solucionesNR(5)[:3]
+#    [[(1, 1), (2, 3), (3, 5), (4, 2), (5, 4)],
+#     [(1, 1), (2, 4), (3, 2), (4, 5), (5, 3)],
+#     [(1, 2), (2, 4), (3, 1), (4, 3), (5, 5)]]
+#    >>> len(solucionesNR(8))
+#    92
+# ---------------------------------------------------------------------
+
+# listaFilas(n, r) es la lista de los elementos de iterFilas(n, r).
+def listaFilas(n: int, r: int) -> list[list[Fila]]:
+    return list(iterFilas(n, r))
+
+def solucionesNR(n: int, procesos: int = 1) -> list[SolNR]:
+    grupos = porFilas(partial(listaFilas, n), n, procesos)
+    # Las soluciones con la primera reina en la fila n+1-r son las
+    # reflejadas de las que la tienen en la fila r.
+    for r in range(n // 2, 0, -1):
+        grupos.append(sorted([[n + 1 - x for x in xs]
+                              for xs in grupos[r - 1]]))
+    return [list(zip(range(1, n + 1), xs)) for g in grupos for xs in g]
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación con BEE_Reinas_Profundidad.py es
+#    >>> import src.BEE_Reinas_Profundidad as p
+#    >>> tiempo('p.nSolucionesNR(12)')
+#    24.65 segundos
+#    >>> tiempo('nSolucionesNR(12)')
+#    0.10 segundos
+#    >>> tiempo('solucionesNR(12)')
+#    0.32 segundos
+#
+# En general, el tiempo de cálculo del número de soluciones (y de las
+# soluciones) es
+#
+#    +----+-------------+------------------+------------------+-----------------+
+#    | n  | Soluciones  | p.nSolucionesNR  | nSolucionesNR    | solucionesNR    |
+#    +----+-------------+------------------+------------------+-----------------+
+#    |  8 |          92 |       0.03 seg.  |       0.00 seg.  |      0.00 seg.  |
+#    |  9 |         352 |       0.16 seg.  |       0.00 seg.  |      0.01 seg.  |
+#    | 10 |         724 |       0.80 seg.  |       0.00 seg.  |      0.01 seg.  |
+#    | 11 |        2680 |       4.28 seg.  |       0.02 seg.  |      0.07 seg.  |
+#    | 12 |       14200 |      24.65 seg.  |       0.10 seg.  |      0.32 seg.  |
+#    | 13 |       73712 |     256.16 seg.  |       0.58 seg.  |      1.93 seg.  |
+#    | 14 |      365596 |     769.80 seg.  |       3.20 seg.  |      5.18 seg.  |
+#    | 15 |     2279184 |                  |      21.55 seg.  |                 |
+#    | 16 |    14772512 |                  |     147.15 seg.  |                 |
+#    +----+-------------+------------------+------------------+-----------------+
+#
+# Los tiempos se han medido en un ordenador con un único procesador,
+# por lo que con procesos=2 no se obtiene ninguna mejora; por ejemplo,
+#    >>> tiempo('nSolucionesNR(14, procesos=2)')
+#    3.20 segundos
+# Con p procesadores, el tiempo se puede dividir, como mucho, por el
+# mínimo de p y el número de tareas independientes (que es la mitad de
+# n, redondeada por exceso); las tareas de las filas centrales son las
+# más costosas.
+
+# Verificación
+# ============
+
+def test_nReinas() -> None:
+    assert list(iterFilas(6, 2)) == [[2, 4, 6, 1, 3, 5]]
+    assert [nSolucionesFila(8, r) for r in range(1, 9)] == \
+        [4, 8, 16, 18, 18, 16, 8, 4]
+    assert [nSolucionesNR(n) for n in range(1, 11)] == \
+        [1, 0, 0, 2, 10, 4, 40, 92, 352, 724]
+    assert nSolucionesNR(9, procesos=2) == 352
+    assert solucionesNR(5)[:3] == \
+        [[(1, 1), (2, 3), (3, 5), (4, 2), (5, 4)],
+         [(1, 1), (2, 4), (3, 2), (4, 5), (5, 3)],
+         [(1, 2), (2, 4), (3, 1), (4, 3), (5, 5)]]
+    for n in range(1, 9):
+        assert solucionesNR(n) == solucionesNRAnchura(n)
+    print("Verificado")
+
+# La verificación es
+#    >>> test_nReinas()
+#    Verificado
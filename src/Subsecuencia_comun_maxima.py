@@ -35,6 +35,11 @@
 from sys import setrecursionlimit
 from timeit import Timer, default_timer
 
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.Longitud_SCM import filaLongitudSCM, longitudSCM4
+
 setrecursionlimit(10**6)
 
 # 1ª definición (por recursión)
@@ -100,6 +105,38 @@ def matrizSCM2(xs: str, ys: str) -> list[list[str]]:
                 q[i][j] = mayor(q[i - 1][j], q[i][j - 1])
     return q
 
+# 3ª definición (de Hirschberg)
+# =============================
+
+# Se divide ys en dos mitades, ys1 e ys2, y se busca la posición i en
+# la que hay que dividir xs para que la suma de las longitudes de las
+# SCM de xs[:i] e ys1 y de xs[i:] e ys2 sea máxima; entonces la SCM de
+# xs e ys es la concatenación de las SCM de cada parte. Las longitudes
+# para todos los i se obtienen con filaLongitudSCM (la de xs[i:] e ys2,
+# invirtiendo las cadenas). Las subcadenas se representan por sus
+# índices, por lo que la memoria usada es O(n+m), además de la
+# recursión, cuya profundidad es O(log(m)).
+def scm3(xs: str, ys: str) -> str:
+    trozos: list[str] = []
+
+    def aux(i0: int, i1: int, j0: int, j1: int) -> None:
+        if i0 == i1 or j0 == j1:
+            return
+        if j1 - j0 == 1:
+            if ys[j0] in xs[i0:i1]:
+                trozos.append(ys[j0])
+            return
+        j = (j0 + j1) // 2
+        l1 = filaLongitudSCM(xs[i0:i1], ys[j0:j])
+        l2 = filaLongitudSCM(xs[i0:i1][::-1], ys[j:j1][::-1])
+        n = i1 - i0
+        k = max(range(n + 1), key=lambda k: l1[k] + l2[n - k])
+        aux(i0, i0 + k, j0, j)
+        aux(i0 + k, i1, j, j1)
+
+    aux(0, len(xs), 0, len(ys))
+    return "".join(trozos)
+
 # # Comparación de eficiencia
 # # =========================
 
@@ -113,6 +150,20 @@ def tiempo(e: str) -> None:
 #    8.44 segundos
 #    >>> tiempo('scm2(["1","3"]*9, ["2","3"]*9)')
 #    0.00 segundos
+#
+#    >>> tiempo('scm2("amapola"*300, "matamoscas"*200)')
+#    1.68 segundos
+#    >>> tiempo('scm3("amapola"*300, "matamoscas"*200)')
+#    0.04 segundos
+#
+#    >>> tiempo('scm3("amapola"*3000, "matamoscas"*2000)')
+#    0.56 segundos
+#    >>> tiempo('scm3("amapola"*15000, "matamoscas"*10000)')
+#    5.39 segundos
+#
+# Con cadenas de 100000 caracteres, matrizSCM2 tendría 10^10 cadenas,
+# mientras que scm3 sólo guarda enteros de 100000 bits y los índices de
+# las subcadenas.
 
 # Verificación
 # ============
@@ -124,8 +175,37 @@ def test_scm() -> None:
     assert scm2("amapola", "matamoscas") == "amoa"
     assert scm2("atamos", "matamoscas")  == "atamos"
     assert scm2("aaa", "bbbb")           == ""
+    assert scm3("amapola", "matamoscas") == "amoa"
+    assert scm3("atamos", "matamoscas")  == "atamos"
+    assert scm3("aaa", "bbbb")           == ""
     print("Verificado")
 
 # La verificación es
 #    >>> test_scm()
 #    Verificado
+
+# Comprobación de equivalencia
+# ============================
+
+# esSubsecuencia(xs, ys) se verifica si xs es una subsecuencia de ys.
+# Por ejemplo,
+#    >>> esSubsecuencia("aaoa", "amapola")
+#    True
+#    >>> esSubsecuencia("aaoa", "amapol")
+#    False
+def esSubsecuencia(xs: str, ys: str) -> bool:
+    it = iter(ys)
+    return all(x in it for x in xs)
+
+# La propiedad es
+@given(st.text(alphabet="abc", max_size=12),
+       st.text(alphabet="abc", max_size=12))
+def test_scm_equiv(xs: str, ys: str) -> None:
+    zs = scm3(xs, ys)
+    assert len(zs) == len(scm2(xs, ys)) == longitudSCM4(xs, ys)
+    assert esSubsecuencia(zs, xs)
+    assert esSubsecuencia(zs, ys)
+
+# La comprobación es
+#    >>> test_scm_equiv()
+#    >>>
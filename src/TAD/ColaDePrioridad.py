@@ -33,7 +33,9 @@
 # + not (esVacia (inserta x c))
 #
 # Para usar el TAD hay que usar una implementación concreta. En
-# principio, consideraremos su representación mediante listas.
+# principio, consideraremos dos: una usando listas y otra usando
+# montículos zurdos persistentes. Hay que elegir la que se desee
+# utilizar, descomentándola y comentando las otras.
 
 __all__ = [
    'CPrioridad',
@@ -44,5 +46,8 @@ __all__ = [
    'esVacia',
     ]
 
-from src.TAD.ColaDePrioridadConListas import (CPrioridad, esVacia, inserta,
-                                              primero, resto, vacia)
+# from src.TAD.ColaDePrioridadConListas import (CPrioridad, esVacia, inserta,
+#                                               primero, resto, vacia)
+from src.TAD.ColaDePrioridadConMonticulos import (CPrioridad, esVacia,
+                                                  inserta, primero, resto,
+                                                  vacia)
@@ -0,0 +1,297 @@
+# ColaDePrioridadConMonticulos.py
+# El tipo de datos de las colas de prioridad mediante montículos.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# En la implementación con listas, inserta ordena la lista completa y
+# resto elimina su primer elemento, por lo que ambas tienen coste
+# lineal; además, las funciones copian la cola antes de modificarla.
+#
+# En esta implementación la cola de prioridad se representa mediante
+# un montículo zurdo persistente; es decir, un árbol binario tal que
+#    + el elemento de cada nodo es menor o igual que los de sus hijos y
+#    + el rango (longitud de la rama derecha) del hijo izquierdo es
+#      mayor o igual que el del hijo derecho.
+# Las operaciones inserta y resto se reducen a mezclar montículos
+# recorriendo sólo sus ramas derechas, por lo que tienen coste
+# logarítmico. Los nodos no se modifican nunca, sino que se comparten
+# entre las distintas versiones de la cola y, por tanto, no hay que
+# copiarla.
+#
+# Cada nodo guarda también su número de orden de inserción, que se usa
+# para desempatar los elementos equivalentes. De esta forma, como en la
+# implementación con listas, de entre los elementos equivalentes sale
+# primero el que se insertó antes.
+#
+# Se define la clase CPrioridad con los siguientes métodos:
+#    + inserta(x) añade x a la cola.
+#    + primero() es el primero de la cola.
+#    + resto() elimina el primero de la cola.
+#    + esVacia() se verifica si la cola es vacía.
+# Por ejemplo,
+#    >>> c = CPrioridad()
+#    >>> c
+#    -
+#    >>> c.inserta(5)
+#    >>> c.inserta(2)
+#    >>> c.inserta(3)
+#    >>> c.inserta(4)
+#    >>> c
+#    2 | 3 | 4 | 5
+#    >>> c.primero()
+#    2
+#    >>> c.resto()
+#    >>> c
+#    3 | 4 | 5
+#    >>> c.esVacia()
+#    False
+#    >>> c = CPrioridad()
+#    >>> c.esVacia()
+#    True
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> vacia()
+#    -
+#    >>> inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))
+#    2 | 3 | 4 | 5
+#    >>> primero (inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    2
+#    >>> resto (inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    3 | 4 | 5
+#    >>> esVacia(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    False
+#    >>> esVacia(vacia())
+#    True
+#
+# Finalmente, se define un generador aleatorio de colas de prioridad y
+# se comprueba que las colas de prioridad cumplen las propiedades de su
+# especificación.
+
+from __future__ import annotations
+
+__all__ = [
+   'CPrioridad',
+   'vacia',
+   'inserta',
+   'primero',
+   'resto',
+   'esVacia',
+]
+
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Any, Generic, Iterator, Optional, Protocol, TypeVar
+
+from hypothesis import assume, given
+from hypothesis import strategies as st
+
+
+class Comparable(Protocol):
+    @abstractmethod
+    def __lt__(self: A, otro: A) -> bool:
+        pass
+
+A = TypeVar('A', bound=Comparable)
+
+# Montículos zurdos persistentes
+# ==============================
+
+class _Nodo(Generic[A]):
+    __slots__ = ('rango', 'elemento', 'orden', 'izq', 'der')
+
+    def __init__(self,
+                 elemento: A,
+                 orden: int,
+                 izq: Optional[_Nodo[A]] = None,
+                 der: Optional[_Nodo[A]] = None) -> None:
+        # Se intercambian los hijos si es necesario para que el de
+        # mayor rango sea el izquierdo.
+        if _rango(izq) < _rango(der):
+            izq, der = der, izq
+        self.rango = _rango(der) + 1
+        self.elemento = elemento
+        self.orden = orden
+        self.izq = izq
+        self.der = der
+
+def _rango(m: Optional[_Nodo[A]]) -> int:
+    """
+    Devuelve el rango del montículo m.
+    """
+    return 0 if m is None else m.rango
+
+def _menor(m1: _Nodo[A], m2: _Nodo[A]) -> bool:
+    """
+    Se verifica si la raíz de m1 tiene que salir antes que la de m2;
+    es decir, si su elemento es menor o, siendo equivalentes, si se
+    insertó antes.
+    """
+    x, y = m1.elemento, m2.elemento
+    if x < y:
+        return True
+    if y < x:
+        return False
+    return m1.orden < m2.orden
+
+def _mezcla(m1: Optional[_Nodo[A]],
+            m2: Optional[_Nodo[A]]) -> Optional[_Nodo[A]]:
+    """
+    Devuelve el montículo obtenido mezclando m1 y m2.
+    """
+    if m1 is None:
+        return m2
+    if m2 is None:
+        return m1
+    if _menor(m2, m1):
+        m1, m2 = m2, m1
+    return _Nodo(m1.elemento, m1.orden, m1.izq, _mezcla(m1.der, m2))
+
+def _elementosMonticulo(m: Optional[_Nodo[A]]) -> Iterator[A]:
+    """
+    Genera los elementos del montículo m en el orden en que salen.
+    """
+    while m is not None:
+        yield m.elemento
+        m = _mezcla(m.izq, m.der)
+
+# Clase de las colas de prioridad mediante montículos
+# ===================================================
+
+@dataclass
+class CPrioridad(Generic[A]):
+    _raiz: Optional[_Nodo[A]] = None
+    _contador: int = 0
+
+    def __repr__(self) -> str:
+        """
+        Devuelve una cadena con los elementos de la cola separados por " | ".
+        Si la cola está vacía, devuelve "-".
+        """
+        if self.esVacia():
+            return '-'
+        return ' | '.join(str(x) for x in _elementosMonticulo(self._raiz))
+
+    def __eq__(self, c: Any) -> bool:
+        """
+        Comprueba si la cola actual es igual a otra cola; es decir, si
+        sus elementos salen en el mismo orden.
+        """
+        return list(_elementosMonticulo(self._raiz)) == \
+            list(_elementosMonticulo(c._raiz))
+
+    def esVacia(self) -> bool:
+        """
+        Comprueba si la cola está vacía.
+
+        Devuelve True si la cola está vacía, False en caso contrario.
+        """
+        return self._raiz is None
+
+    def inserta(self, x: A) -> None:
+        """
+        Inserta el elemento x en la cola de prioridad.
+        """
+        self._raiz = _mezcla(self._raiz, _Nodo(x, self._contador))
+        self._contador += 1
+
+    def primero(self) -> A:
+        """
+        Devuelve el primer elemento de la cola.
+        """
+        assert self._raiz is not None
+        return self._raiz.elemento
+
+    def resto(self) -> None:
+        """
+        Elimina el primer elemento de la cola
+        """
+        assert self._raiz is not None
+        self._raiz = _mezcla(self._raiz.izq, self._raiz.der)
+
+# Funciones del tipo de los montículos
+# ====================================
+
+# Las funciones construyen una nueva cola que comparte sus nodos con la
+# cola original, que no se modifica; por tanto, no es necesario
+# copiarla.
+
+def vacia() -> CPrioridad[A]:
+    """
+    Crea y devuelve una cola vacía de tipo A.
+    """
+    c: CPrioridad[A] = CPrioridad()
+    return c
+
+def inserta(x: A, c: CPrioridad[A]) -> CPrioridad[A]:
+    """
+    Inserta un elemento x en la cola c y devuelve una nueva cola con
+    el elemento insertado.
+    """
+    return CPrioridad(_mezcla(c._raiz, _Nodo(x, c._contador)),
+                      c._contador + 1)
+
+def esVacia(c: CPrioridad[A]) -> bool:
+    """
+    Devuelve True si la cola está vacía, False si no lo está.
+    """
+    return c.esVacia()
+
+def primero(c: CPrioridad[A]) -> A:
+    """
+    Devuelve el primer elemento de la cola c.
+    """
+    return c.primero()
+
+def resto(c: CPrioridad[A]) -> CPrioridad[A]:
+    """
+    Elimina el primer elemento de la cola c y devuelve la cola
+    resultante.
+    """
+    assert c._raiz is not None
+    return CPrioridad(_mezcla(c._raiz.izq, c._raiz.der), c._contador)
+
+# Generador de colas de prioridad
+# ===============================
+
+def colaAleatoria() -> st.SearchStrategy[CPrioridad[int]]:
+    """
+    Genera una estrategia de búsqueda para generar colas de enteros de
+    forma aleatoria.
+
+    Utiliza la librería Hypothesis para generar una lista de enteros y
+    luego se insertan sus elementos en una cola vacía.
+    """
+    def _creaCola(elementos: list[int]) -> CPrioridad[int]:
+        """
+        Crea una cola de enteros a partir de una lista de elementos.
+        """
+        c: CPrioridad[int] = vacia()
+        for x in elementos:
+            c = inserta(x, c)
+        return c
+    return st.builds(_creaCola, st.lists(st.integers()))
+
+# Comprobación de las propiedades de las colas
+# ============================================
+
+# Las propiedades son
+@given(c=colaAleatoria(), x=st.integers(), y=st.integers())
+def test_cola1(c: CPrioridad[int], x: int, y: int) -> None:
+    assert inserta(x, inserta(y, c)) == inserta(y, inserta(x, c))
+    assert primero(inserta(x, vacia())) == x
+    assert resto(inserta(x, vacia())) == vacia()
+    assert esVacia(vacia())
+    assert not esVacia(inserta(x, c))
+
+@given(c=colaAleatoria(), x=st.integers(), y=st.integers())
+def test_cola2(c: CPrioridad[int], x: int, y: int) -> None:
+    assume(not y < x)
+    assert primero(inserta(y, (inserta(x, c)))) == \
+        primero(inserta(x,c))
+    assert resto(inserta(y, (inserta(x, c)))) == \
+        inserta(y, resto(inserta(x, c)))
+
+# La comprobación es
+#    > poetry run pytest -q ColaDePrioridadConMonticulos.py
+#    2 passed in 0.62s
@@ -0,0 +1,192 @@
+# ConjuntosDisjuntos.py
+# El tipo de datos de los conjuntos disjuntos (unión-búsqueda).
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ---------------------------------------------------------------------
+
+# Una partición de los elementos 0, 1, ..., n-1 en conjuntos disjuntos
+# se representa mediante un bosque guardado en dos listas:
+#    + padre[x] es el padre de x en su árbol (o x, si x es una raíz) y
+#    + rango[x] es una cota superior de la altura del árbol de raíz x.
+# Cada conjunto se identifica por la raíz de su árbol.
+#
+# Las operaciones son
+#    + encuentra(x), que es la raíz del árbol de x. Mientras se sube
+#      por el árbol, cada nodo pasa a apuntar a su abuelo ("división a
+#      la mitad" del camino), de forma que los caminos se acortan en
+#      cada búsqueda.
+#    + une(x, y), que une los conjuntos de x y de y, colocando el árbol
+#      de menor rango bajo la raíz del de mayor rango ("unión por
+#      rango"). Devuelve True si x e y estaban en conjuntos distintos y
+#      False en caso contrario.
+# Con ambas mejoras, el coste amortizado de cada operación es
+# prácticamente constante (O(α(n)), donde α es la inversa de la función
+# de Ackermann).
+#
+# Opcionalmente, si se crea con deshacer=True, se pueden deshacer las
+# uniones:
+#    + marca() es el número de uniones realizadas y
+#    + deshaz(m) deshace las uniones realizadas después de marca m.
+# En ese caso no se acortan los caminos (ya que no se podrían deshacer
+# en tiempo constante), y el coste de encuentra es O(log n) gracias a la
+# unión por rango.
+#
+# Por ejemplo,
+#    >>> c = ConjuntosDisjuntos(6)
+#    >>> c
+#    [[0], [1], [2], [3], [4], [5]]
+#    >>> c.une(0, 1)
+#    True
+#    >>> c.une(3, 4)
+#    True
+#    >>> c.une(1, 0)
+#    False
+#    >>> c.une(4, 1)
+#    True
+#    >>> c
+#    [[0, 1, 3, 4], [2], [5]]
+#    >>> c.mismoConjunto(0, 3)
+#    True
+#    >>> c.numeroDeConjuntos()
+#    3
+#    >>> d = ConjuntosDisjuntos(4, deshacer=True)
+#    >>> d.une(0, 1)
+#    True
+#    >>> m = d.marca()
+#    >>> d.une(1, 2)
+#    True
+#    >>> d
+#    [[0, 1, 2], [3]]
+#    >>> d.deshaz(m)
+#    >>> d
+#    [[0, 1], [2], [3]]
+
+from __future__ import annotations
+
+__all__ = [
+    'ConjuntosDisjuntos',
+]
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+class ConjuntosDisjuntos:
+    def __init__(self, n: int, deshacer: bool = False) -> None:
+        self._padre = list(range(n))
+        self._rango = [0] * n
+        self._conjuntos = n
+        self._deshacer = deshacer
+        # Cada unión se guarda como el par formado por la raíz que pasa
+        # a tener padre y el rango anterior de la nueva raíz.
+        self._historia: list[tuple[int, int]] = []
+
+    def __repr__(self) -> str:
+        cs: dict[int, list[int]] = {}
+        for x in range(len(self._padre)):
+            cs.setdefault(self.encuentra(x), []).append(x)
+        return str(sorted(cs.values()))
+
+    def encuentra(self, x: int) -> int:
+        padre = self._padre
+        if self._deshacer:
+            while padre[x] != x:
+                x = padre[x]
+            return x
+        while padre[x] != x:
+            padre[x] = padre[padre[x]]
+            x = padre[x]
+        return x
+
+    def une(self, x: int, y: int) -> bool:
+        x = self.encuentra(x)
+        y = self.encuentra(y)
+        if x == y:
+            return False
+        rango = self._rango
+        if rango[x] < rango[y]:
+            (x, y) = (y, x)
+        self._padre[y] = x
+        if self._deshacer:
+            self._historia.append((y, rango[x]))
+        if rango[x] == rango[y]:
+            rango[x] += 1
+        self._conjuntos -= 1
+        return True
+
+    def mismoConjunto(self, x: int, y: int) -> bool:
+        return self.encuentra(x) == self.encuentra(y)
+
+    def numeroDeConjuntos(self) -> int:
+        return self._conjuntos
+
+    def marca(self) -> int:
+        assert self._deshacer, "Hay que crearlo con deshacer=True"
+        return len(self._historia)
+
+    def deshaz(self, m: int) -> None:
+        assert self._deshacer, "Hay que crearlo con deshacer=True"
+        while len(self._historia) > m:
+            (y, r) = self._historia.pop()
+            x = self._padre[y]
+            self._padre[y] = y
+            self._rango[x] = r
+            self._conjuntos += 1
+
+# Verificación
+# ============
+
+def test_conjuntosDisjuntos() -> None:
+    c = ConjuntosDisjuntos(6)
+    assert str(c) == '[[0], [1], [2], [3], [4], [5]]'
+    assert c.une(0, 1)
+    assert c.une(3, 4)
+    assert not c.une(1, 0)
+    assert c.une(4, 1)
+    assert str(c) == '[[0, 1, 3, 4], [2], [5]]'
+    assert c.mismoConjunto(0, 3)
+    assert not c.mismoConjunto(0, 5)
+    assert c.numeroDeConjuntos() == 3
+    print("Verificado")
+
+def test_deshaz() -> None:
+    d = ConjuntosDisjuntos(4, deshacer=True)
+    assert d.une(0, 1)
+    m = d.marca()
+    assert d.une(1, 2)
+    assert d.une(3, 0)
+    assert str(d) == '[[0, 1, 2, 3]]'
+    d.deshaz(m)
+    assert str(d) == '[[0, 1], [2], [3]]'
+    assert d.numeroDeConjuntos() == 3
+    print("Verificado")
+
+# La verificación es
+#    >>> test_conjuntosDisjuntos()
+#    Verificado
+#    >>> test_deshaz()
+#    Verificado
+
+# Comprobación de las propiedades
+# ===============================
+
+# La propiedad es que las uniones coinciden con las de una partición
+# ingenua, en la que cada elemento guarda el conjunto al que pertenece.
+@given(st.lists(st.tuples(st.integers(min_value=0, max_value=19),
+                          st.integers(min_value=0, max_value=19))),
+       st.booleans())
+def test_particion(ps: list[tuple[int, int]], deshacer: bool) -> None:
+    c = ConjuntosDisjuntos(20, deshacer)
+    cs = [frozenset([x]) for x in range(20)]
+    for (x, y) in ps:
+        assert c.une(x, y) == (cs[x] != cs[y])
+        u = cs[x] | cs[y]
+        for z in u:
+            cs[z] = u
+    assert str(c) == str(sorted(sorted(s) for s in set(cs)))
+    if deshacer:
+        c.deshaz(0)
+        assert c.numeroDeConjuntos() == 20
+
+# La comprobación es
+#    > poetry run pytest -q ConjuntosDisjuntos.py
+#    3 passed in 1.35s
@@ -87,8 +87,15 @@
 #      están conectados por la arista y el peso de dicha arista.
 #
 # Para usar el TAD hay que usar una implementación concreta. En
-# principio, consideraremos sólo la siguiente:
-#    + mediante lista de adyacencia.
+# principio, consideraremos las tres siguientes:
+#    + mediante lista de adyacencia,
+#    + mediante diccionarios de adyacencia (en la que adyacentes tiene
+#      un coste proporcional al número de adyacentes y aristaEn y peso
+#      tienen coste constante) y
+#    + mediante matrices dispersas CSR de NumPy (adecuada para grafos
+#      con millones de aristas).
+# Hay que elegir la que se desee utilizar, descomentándola y comentando
+# las otras.
 
 # pylint: disable=unused-import
 
@@ -107,8 +114,18 @@ __all__ = [
     'peso'
     ]
 
-from src.TAD.GrafoConListaDeAdyacencia import (Arista, Cotas, Grafo,
-                                               Orientacion, Peso, Vertice,
-                                               adyacentes, aristaEn, aristas,
-                                               creaGrafo, creaGrafo_, dirigido,
-                                               nodos, peso)
+# from src.TAD.GrafoConListaDeAdyacencia import (Arista, Cotas, Grafo,
+#                                                Orientacion, Peso, Vertice,
+#                                                adyacentes, aristaEn, aristas,
+#                                                creaGrafo, creaGrafo_, dirigido,
+#                                                nodos, peso)
+# from src.TAD.GrafoConCSR import (Arista, Cotas, Grafo, Orientacion, Peso,
+#                                  Vertice, adyacentes, aristaEn, aristas,
+#                                  creaGrafo, creaGrafo_, dirigido, nodos,
+#                                  peso)
+from src.TAD.GrafoConDiccionarioDeAdyacencia import (Arista, Cotas, Grafo,
+                                                     Orientacion, Peso,
+                                                     Vertice, adyacentes,
+                                                     aristaEn, aristas,
+                                                     creaGrafo, creaGrafo_,
+                                                     dirigido, nodos, peso)
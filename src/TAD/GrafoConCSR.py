@@ -0,0 +1,381 @@
+# GrafoConCSR.py
+# Implementación del TAD de los grafos mediante matrices dispersas CSR.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# En esta implementación un grafo con los vértices de x a y se
+# representa en el formato CSR (del inglés "compressed sparse row")
+# mediante tres vectores de NumPy:
+#    + indices: los destinos de todas las aristas, ordenadas por su
+#      origen, su destino y su peso,
+#    + pesos: los pesos de las aristas, en el mismo orden, y
+#    + indptr: de longitud y-x+2, tal que las aristas que salen del
+#      vértice v son las que ocupan las posiciones desde indptr[v-x]
+#      hasta indptr[v-x+1]-1 en indices y pesos.
+# Por ejemplo, el grafo dirigido ejGrafoD (definido más abajo) se
+# representa por
+#    >>> ejGrafoD._indptr
+#    array([0, 3, 5, 7, 8, 8])
+#    >>> ejGrafoD._indices
+#    array([2, 3, 5, 4, 5, 4, 5, 5])
+#    >>> ejGrafoD._pesos
+#    array([12, 34, 78, 55, 32, 61, 44, 93])
+#
+# Con esta representación, los grafos se construyen directamente a
+# partir de vectores de NumPy (sin crear una tupla por arista), se
+# pueden guardar con np.save y se pueden abrir sin leerlos en memoria
+# (con np.load y mmap_mode='r'), lo que permite trabajar con grafos de
+# millones de aristas.
+#
+# Se define la clase Grafo con los mismos métodos que en
+# GrafoConListaDeAdyacencia.py. Por ejemplo,
+#    >>> Grafo(Orientacion.ND, (1,3), [((1,2),0),((3,2),5),((2,2),0)])
+#    G ND ([1, 2, 3], [((1, 2), 0), ((2, 2), 0), ((2, 3), 5)])
+#    >>> ejGrafoND.adyacentes(4)
+#    [2, 3, 5]
+#    >>> ejGrafoD.adyacentes(4)
+#    [5]
+#    >>> ejGrafoND.aristaEn((5, 1))
+#    True
+#    >>> ejGrafoD.aristaEn((5, 1))
+#    False
+#    >>> ejGrafoND.peso(1, 5)
+#    78
+#
+# Además de las funciones del TAD, se definen
+#    + desdeArrays(o, cs, origenes, destinos, pesos), que construye el
+#      grafo a partir de los vectores de los orígenes, los destinos y
+#      los pesos de sus aristas,
+#    + leeAristas(o, f, cs), que construye el grafo a partir del
+#      fichero de texto f en el que cada línea es una arista de la forma
+#      "v1 v2 p" (o "v1 v2", si no tiene peso),
+#    + guardaGrafo(g, f), que guarda el grafo g en ficheros con prefijo
+#      f, y
+#    + cargaGrafo(f, mmap), que carga el grafo guardado con prefijo f
+#      (proyectándolo en memoria si mmap es True).
+# Por ejemplo,
+#    >>> desdeArrays(Orientacion.D, (1,3), np.array([1,3]), np.array([2,1]))
+#    G D ([1, 2, 3], [(1, 2), (3, 1)])
+#    >>> desdeArrays(Orientacion.ND, (1,3), np.array([1,3]), np.array([2,1]),
+#    ...             np.array([2.5,4]))
+#    G ND ([1, 2, 3], [((1, 2), 2.5), ((1, 3), 4.0)])
+
+# pylint: disable=protected-access
+
+from __future__ import annotations
+
+from timeit import Timer, default_timer
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from src.TAD.GrafoConListaDeAdyacencia import (Arista, Cotas, Orientacion,
+                                               Peso, Vertice)
+
+
+class Grafo:
+    def __init__(self,
+                 _orientacion: Orientacion,
+                 _cotas: Cotas,
+                 _aristas: list[Arista]):
+        if _aristas:
+            ((origenes, destinos), pesos) = \
+                (zip(*[a for (a, _) in _aristas]), [p for (_, p) in _aristas])
+        else:
+            (origenes, destinos, pesos) = ((), (), [])
+        # Si hay pesos de distintos tipos (por ejemplo, enteros y
+        # reales), se guardan como objetos para conservar sus valores.
+        self._inicia(_orientacion,
+                     _cotas,
+                     np.array(origenes, dtype=np.int64),
+                     np.array(destinos, dtype=np.int64),
+                     np.zeros(0, dtype=np.int64) if not pesos
+                     else np.array(pesos, dtype=object)
+                     if len({type(p) for p in pesos}) > 1
+                     else np.array(pesos))
+
+    def _inicia(self,
+                o: Orientacion,
+                cs: Cotas,
+                origenes: npt.NDArray[np.int64],
+                destinos: npt.NDArray[np.int64],
+                pesos: npt.NDArray[Any]) -> None:
+        """
+        Construye la representación CSR a partir de los vectores de las
+        aristas.
+        """
+        self._orientacion = o
+        self._cotas = (int(cs[0]), int(cs[1]))
+        (x, y) = self._cotas
+        fuera = (origenes < x) | (origenes > y) | (destinos < x) | (destinos > y)
+        if fuera.any():
+            k = int(np.argmax(fuera))
+            a = (int(origenes[k]), int(destinos[k]))
+            raise ValueError(f"La arista {a} no está entre las cotas {(x, y)}")
+        if o == Orientacion.ND:
+            lazos = origenes != destinos
+            (origenes, destinos, pesos) = \
+                (np.concatenate((origenes, destinos[lazos])),
+                 np.concatenate((destinos, origenes[lazos])),
+                 np.concatenate((pesos, pesos[lazos])))
+        orden = np.lexsort((pesos, destinos, origenes))
+        self._indices = destinos[orden]
+        self._pesos = pesos[orden]
+        n = self._cotas[1] - self._cotas[0] + 1
+        grados = np.bincount(origenes - self._cotas[0], minlength=n)
+        self._indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(grados, out=self._indptr[1:])
+
+    def _fila(self, v: Vertice) -> tuple[int, int]:
+        """Posiciones inicial y final de las aristas que salen de v."""
+        i = v - self._cotas[0]
+        return (int(self._indptr[i]), int(self._indptr[i + 1]))
+
+    def nodos(self) -> list[Vertice]:
+        (x, y) = self._cotas
+        return list(range(x, 1 + y))
+
+    def aristas(self) -> list[Arista]:
+        (x, _) = self._cotas
+        origenes = np.repeat(np.arange(x, x + len(self._indptr) - 1),
+                             np.diff(self._indptr))
+        return list(zip(zip(origenes.tolist(), self._indices.tolist()),
+                        self._pesos.tolist()))
+
+    def __repr__(self) -> str:
+        o = self._orientacion
+        vs = nodos(self)
+        ns = self.aristas()
+        escribeOrientacion = "D" if o == Orientacion.D else "ND"
+        ponderado = {p for ((_, _), p) in ns} != {0}
+        aristasReducidas = ns if o == Orientacion.D \
+            else [((x, y), p)
+                  for ((x, y), p) in ns
+                  if x <= y]
+        escribeAristas = str(aristasReducidas) if ponderado \
+            else str([a for (a, _) in aristasReducidas])
+        return f"G {escribeOrientacion} ({vs}, {escribeAristas})"
+
+    def dirigido(self) -> bool:
+        return self._orientacion == Orientacion.D
+
+    # Los destinos de cada fila están ordenados, por lo que los
+    # repetidos (si hay aristas repetidas) son consecutivos.
+    def adyacentes(self, v: int) -> list[int]:
+        (x, y) = self._cotas
+        if not (x <= v <= y):
+            return []
+        (i, j) = self._fila(v)
+        fila = self._indices[i:j]
+        if len(fila) > 1:
+            fila = fila[np.concatenate(([True], fila[1:] != fila[:-1]))]
+        return fila.tolist()  # type: ignore[no-any-return]
+
+    def _posicion(self, v1: Vertice, v2: Vertice) -> Optional[int]:
+        """
+        Posición de la primera arista de v1 a v2 (o None, si no existe).
+        """
+        (x, y) = self._cotas
+        if not (x <= v1 <= y):
+            return None
+        (i, j) = self._fila(v1)
+        k = i + int(np.searchsorted(self._indices[i:j], v2))
+        return k if k < j and self._indices[k] == v2 else None
+
+    def aristaEn(self, a: tuple[Vertice, Vertice]) -> bool:
+        (x, y) = a
+        return self._posicion(x, y) is not None
+
+    def peso(self, v1: Vertice, v2: Vertice) -> Peso:
+        k = self._posicion(v1, v2)
+        if k is None:
+            raise IndexError(f"No existe la arista {(v1, v2)}")
+        return self._pesos[k:k + 1].tolist()[0]  # type: ignore[no-any-return]
+
+def creaGrafo(o: Orientacion,
+              cs: Cotas,
+              as_: list[Arista]) -> Grafo:
+    return Grafo(o, cs, as_)
+
+def creaGrafo_(o: Orientacion,
+              cs: Cotas,
+              as_: list[tuple[Vertice, Vertice]]) -> Grafo:
+    return Grafo(o, cs, [((v1, v2), 0) for (v1, v2) in as_])
+
+def dirigido(g: Grafo) -> bool:
+    return g.dirigido()
+
+def nodos(g: Grafo) -> list[Vertice]:
+    return g.nodos()
+
+def adyacentes(g: Grafo, v: Vertice) -> list[Vertice]:
+    return g.adyacentes(v)
+
+def aristaEn(g: Grafo, a: tuple[Vertice, Vertice]) -> bool:
+    return g.aristaEn(a)
+
+def peso(v1: Vertice, v2: Vertice, g: Grafo) -> Peso:
+    return g.peso(v1, v2)
+
+def aristas(g: Grafo) -> list[Arista]:
+    return g.aristas()
+
+# Constructores a partir de vectores y de ficheros
+# ================================================
+
+def desdeArrays(o: Orientacion,
+                cs: Cotas,
+                origenes: npt.NDArray[Any],
+                destinos: npt.NDArray[Any],
+                pesos: Optional[npt.NDArray[Any]] = None) -> Grafo:
+    """
+    Grafo con las aristas de origenes[i] a destinos[i] con peso
+    pesos[i] (o 0, si no se indican los pesos).
+    """
+    g = Grafo.__new__(Grafo)
+    g._inicia(o,
+              cs,
+              np.asarray(origenes, dtype=np.int64),
+              np.asarray(destinos, dtype=np.int64),
+              np.zeros(len(origenes), dtype=np.int64) if pesos is None
+              else np.asarray(pesos))
+    return g
+
+def leeAristas(o: Orientacion,
+               f: str,
+               cs: Optional[Cotas] = None) -> Grafo:
+    """
+    Grafo cuyas aristas son las líneas "v1 v2 p" (o "v1 v2") del fichero
+    f. Si no se indican las cotas, son el menor y el mayor vértice.
+    """
+    datos = np.loadtxt(f, ndmin=2)
+    origenes = datos[:, 0].astype(np.int64)
+    destinos = datos[:, 1].astype(np.int64)
+    pesos = None
+    if datos.shape[1] > 2:
+        pesos = datos[:, 2]
+        if np.all(pesos == np.round(pesos)):
+            pesos = pesos.astype(np.int64)
+    if cs is None:
+        vs = np.concatenate((origenes, destinos))
+        cs = (int(vs.min()), int(vs.max()))
+    return desdeArrays(o, cs, origenes, destinos, pesos)
+
+# El grafo g se guarda con prefijo f en los ficheros f.indptr.npy,
+# f.indices.npy, f.pesos.npy y f.info.npy (que contiene la orientación
+# y las cotas).
+def guardaGrafo(g: Grafo, f: str) -> None:
+    """Guarda el grafo g en ficheros con prefijo f."""
+    (x, y) = g._cotas
+    np.save(f"{f}.info.npy", np.array([int(g.dirigido()), x, y]))
+    np.save(f"{f}.indptr.npy", g._indptr)
+    np.save(f"{f}.indices.npy", g._indices)
+    np.save(f"{f}.pesos.npy", g._pesos)
+
+def cargaGrafo(f: str, mmap: bool = False) -> Grafo:
+    """
+    Grafo guardado con prefijo f. Si mmap es True, los vectores se
+    proyectan en memoria en lugar de leerse.
+    """
+    modo: Any = 'r' if mmap else None
+    (d, x, y) = np.load(f"{f}.info.npy").tolist()
+    g = Grafo.__new__(Grafo)
+    g._orientacion = Orientacion.D if d else Orientacion.ND
+    g._cotas = (x, y)
+    g._indptr = np.load(f"{f}.indptr.npy", mmap_mode=modo)
+    g._indices = np.load(f"{f}.indices.npy", mmap_mode=modo)
+    try:
+        g._pesos = np.load(f"{f}.pesos.npy", mmap_mode=modo)
+    except ValueError:
+        # Los pesos de distintos tipos se guardan como objetos, que no
+        # se pueden proyectar en memoria.
+        g._pesos = np.load(f"{f}.pesos.npy", allow_pickle=True)
+    return g
+
+# En los ejemplos se usarán los grafos (no dirigido y dirigido)
+# correspondientes a
+#             12
+#        1 -------- 2
+#        | \78     /|
+#        |  \   32/ |
+#        |   \   /  |
+#      34|     5    |55
+#        |   /   \  |
+#        |  /44   \ |
+#        | /     93\|
+#        3 -------- 4
+#             61
+# definidos por
+ejGrafoND: Grafo = Grafo(Orientacion.ND,
+                         (1, 5),
+                         [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+                          ((2, 4), 55), ((2, 5), 32),
+                          ((3, 4), 61), ((3, 5), 44),
+                          ((4, 5), 93)])
+ejGrafoD: Grafo = Grafo(Orientacion.D,
+                        (1,5),
+                        [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+                         ((2, 4), 55), ((2, 5), 32),
+                         ((3, 4), 61), ((3, 5), 44),
+                         ((4, 5), 93)])
+
+# Comparación de eficiencia
+# =========================
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# aristasAleatorias(n, k) es el par de vectores de los orígenes y
+# destinos de k aristas aleatorias entre los vértices de 1 a n.
+def aristasAleatorias(n: int, k: int) -> tuple[npt.NDArray[np.int64],
+                                                npt.NDArray[np.int64]]:
+    r = np.random.default_rng(n)
+    return (r.integers(1, n + 1, k), r.integers(1, n + 1, k))
+
+# listaAleatoria(n, k) es la lista de las mismas aristas con pesos 0.
+def listaAleatoria(n: int, k: int) -> list[Arista]:
+    (xs, ys) = aristasAleatorias(n, k)
+    return [((x, y), 0) for (x, y) in zip(xs.tolist(), ys.tolist())]
+
+# gradoTotal(m, g) es la suma de los números de adyacentes de los
+# vértices de g, calculada con el módulo m.
+def gradoTotal(m: Any, g: Any) -> int:
+    return sum(len(m.adyacentes(g, v)) for v in m.nodos(g))
+
+# La comparación es
+#    >>> import src.TAD.GrafoConDiccionarioDeAdyacencia as gd
+#    >>> import src.TAD.GrafoConCSR as gc
+#    >>> as_ = listaAleatoria(10**5, 10**6)
+#    >>> tiempo('gd.creaGrafo(Orientacion.ND, (1, 10**5), as_)')
+#    11.33 segundos
+#    >>> tiempo('gc.creaGrafo(Orientacion.ND, (1, 10**5), as_)')
+#    3.06 segundos
+#    >>> (xs, ys) = aristasAleatorias(10**5, 10**6)
+#    >>> tiempo('g = desdeArrays(Orientacion.ND, (1, 10**5), xs, ys)')
+#    0.91 segundos
+#
+# Una vez construido, el grafo se puede guardar y volver a abrir sin
+# analizar las aristas:
+#    >>> g = desdeArrays(Orientacion.ND, (1, 10**5), xs, ys)
+#    >>> tiempo('guardaGrafo(g, "/tmp/g")')
+#    0.01 segundos
+#    >>> tiempo('cargaGrafo("/tmp/g")')
+#    0.01 segundos
+#    >>> np.savetxt("/tmp/g.txt", np.column_stack((xs, ys)), fmt="%d")
+#    >>> tiempo('leeAristas(Orientacion.ND, "/tmp/g.txt", (1, 10**5))')
+#    1.01 segundos
+#
+# Con 10^6 vértices y 10^7 aristas, la construcción a partir de los
+# vectores tarda 12.03 segundos y la carga con mmap=True 0.00 segundos.
+#
+# Las consultas individuales son más lentas que con diccionarios, por el
+# coste de acceder a los vectores de NumPy desde Python:
+#    >>> g1 = gd.creaGrafo(Orientacion.ND, (1, 10**5), as_)
+#    >>> tiempo('gradoTotal(gd, g1)')
+#    0.17 segundos
+#    >>> tiempo('gradoTotal(gc, g)')
+#    0.58 segundos
@@ -0,0 +1,239 @@
+# GrafoConDiccionarioDeAdyacencia.py
+# Implementación del TAD de los grafos mediante diccionarios de adyacencia.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# En GrafoConListaDeAdyacencia.py el grafo se representa mediante la
+# lista ordenada de todas sus aristas, por lo que para calcular los
+# adyacentes de un vértice, el peso de una arista o si una arista
+# pertenece al grafo hay que recorrer todas las aristas.
+#
+# En esta implementación, además de la lista de aristas, se guarda un
+# diccionario que asigna a cada vértice v un diccionario cuyas claves
+# son los vértices adyacentes a v y sus valores son los pesos de las
+# aristas correspondientes. Por tanto,
+#    + adyacentes(v) tiene un coste proporcional al número de adyacentes
+#      de v y
+#    + aristaEn(a) y peso(v1, v2) tienen coste constante.
+#
+# Se define la clase Grafo con los siguientes métodos:
+#    + dirigido() se verifica si el grafo es dirigido.
+#    + nodos() es la lista de todos los nodos del grafo.
+#    + aristas() es la lista de las aristas del grafo.
+#    + adyacentes(v) es la lista de los vértices adyacentes al vértice
+#      v en el grafo.
+#    + aristaEn(a) se verifica si a es una arista del grafo.
+#    + peso(v1, v2) es el peso de la arista que une los vértices v1 y
+#      v2 en el grafo.
+# Por ejemplo,
+#    >>> Grafo(Orientacion.D, (1,3), [((1,2),0),((3,2),0),((2,2),0)])
+#    G D ([1, 2, 3], [(1, 2), (2, 2), (3, 2)])
+#    >>> Grafo(Orientacion.ND, (1,3), [((1,2),0),((3,2),0),((2,2),0)])
+#    G ND ([1, 2, 3], [(1, 2), (2, 2), (2, 3)])
+#    >>> Grafo(Orientacion.ND, (1,3), [((1,2),0),((3,2),5),((2,2),0)])
+#    G ND ([1, 2, 3], [((1, 2), 0), ((2, 2), 0), ((2, 3), 5)])
+#    >>> ejGrafoND.adyacentes(4)
+#    [2, 3, 5]
+#    >>> ejGrafoD.adyacentes(4)
+#    [5]
+#    >>> ejGrafoND.aristaEn((5, 1))
+#    True
+#    >>> ejGrafoD.aristaEn((5, 1))
+#    False
+#    >>> ejGrafoND.peso(1, 5)
+#    78
+#    >>> ejGrafoND._adyacencia[5]
+#    {1: 78, 2: 32, 3: 44, 4: 93}
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> creaGrafo(Orientacion.ND, (1,3), [((1,2),12),((1,3),34)])
+#    G ND ([1, 2, 3], [((1, 2), 12), ((1, 3), 34)])
+#    >>> creaGrafo_(Orientacion.ND, (1,3), [(2, 1), (1, 3)])
+#    G ND ([1, 2, 3], [(1, 2), (1, 3)])
+#    >>> dirigido(ejGrafoD)
+#    True
+#    >>> nodos(ejGrafoND)
+#    [1, 2, 3, 4, 5]
+#    >>> adyacentes(ejGrafoND, 4)
+#    [2, 3, 5]
+#    >>> aristaEn(ejGrafoND, (4,1))
+#    False
+#    >>> peso(1, 5, ejGrafoD)
+#    78
+#    >>> aristas(ejGrafoD)
+#    [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+#     ((2, 4), 55), ((2, 5), 32),
+#     ((3, 4), 61), ((3, 5), 44),
+#     ((4, 5), 93)]
+
+# pylint: disable=protected-access
+
+from random import Random
+from timeit import Timer, default_timer
+from typing import Any
+
+from src.TAD.GrafoConListaDeAdyacencia import (Arista, Cotas, Orientacion,
+                                               Peso, Vertice)
+
+class Grafo:
+    def __init__(self,
+                 _orientacion: Orientacion,
+                 _cotas: Cotas,
+                 _aristas: list[Arista]):
+        self._orientacion = _orientacion
+        self._cotas = _cotas
+        if _orientacion == Orientacion.ND:
+            simetricas = [((v2, v1), p) for ((v1, v2), p)
+                          in _aristas
+                          if v1 != v2]
+            self._aristas = sorted(_aristas + simetricas)
+        else:
+            self._aristas = sorted(_aristas)
+        # Como las aristas están ordenadas, los adyacentes de cada
+        # vértice se insertan en orden creciente y, si hay aristas
+        # repetidas, se conserva la de menor peso (como en
+        # GrafoConListaDeAdyacencia).
+        self._adyacencia: dict[Vertice, dict[Vertice, Peso]] = {}
+        for ((v1, v2), p) in self._aristas:
+            self._adyacencia.setdefault(v1, {}).setdefault(v2, p)
+
+    def nodos(self) -> list[Vertice]:
+        (x, y) = self._cotas
+        return list(range(x, 1 + y))
+
+    def __repr__(self) -> str:
+        o = self._orientacion
+        vs = nodos(self)
+        ns = self._aristas
+        escribeOrientacion = "D" if o == Orientacion.D else "ND"
+        ponderado = {p for ((_, _), p) in ns} != {0}
+        aristasReducidas = ns if o == Orientacion.D \
+            else [((x, y), p)
+                  for ((x, y), p) in ns
+                  if x <= y]
+        escribeAristas = str(aristasReducidas) if ponderado \
+            else str([a for (a, _) in aristasReducidas])
+        return f"G {escribeOrientacion} ({vs}, {escribeAristas})"
+
+    def dirigido(self) -> bool:
+        return self._orientacion == Orientacion.D
+
+    def adyacentes(self, v: int) -> list[int]:
+        return list(self._adyacencia.get(v, {}))
+
+    def aristaEn(self, a: tuple[Vertice, Vertice]) -> bool:
+        (x, y) = a
+        return y in self._adyacencia.get(x, {})
+
+    def peso(self, v1: Vertice, v2: Vertice) -> Peso:
+        return self._adyacencia[v1][v2]
+
+def creaGrafo(o: Orientacion,
+              cs: Cotas,
+              as_: list[Arista]) -> Grafo:
+    return Grafo(o, cs, as_)
+
+def creaGrafo_(o: Orientacion,
+              cs: Cotas,
+              as_: list[tuple[Vertice, Vertice]]) -> Grafo:
+    return Grafo(o, cs, [((v1, v2), 0) for (v1, v2) in as_])
+
+def dirigido(g: Grafo) -> bool:
+    return g.dirigido()
+
+def nodos(g: Grafo) -> list[Vertice]:
+    return g.nodos()
+
+def adyacentes(g: Grafo, v: Vertice) -> list[Vertice]:
+    return g.adyacentes(v)
+
+def aristaEn(g: Grafo, a: tuple[Vertice, Vertice]) -> bool:
+    return g.aristaEn(a)
+
+def peso(v1: Vertice, v2: Vertice, g: Grafo) -> Peso:
+    return g.peso(v1, v2)
+
+def aristas(g: Grafo) -> list[Arista]:
+    return g._aristas
+
+# En los ejemplos se usarán los grafos (no dirigido y dirigido)
+# correspondientes a
+#             12
+#        1 -------- 2
+#        | \78     /|
+#        |  \   32/ |
+#        |   \   /  |
+#      34|     5    |55
+#        |   /   \  |
+#        |  /44   \ |
+#        | /     93\|
+#        3 -------- 4
+#             61
+# definidos por
+ejGrafoND: Grafo = Grafo(Orientacion.ND,
+                         (1, 5),
+                         [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+                          ((2, 4), 55), ((2, 5), 32),
+                          ((3, 4), 61), ((3, 5), 44),
+                          ((4, 5), 93)])
+ejGrafoD: Grafo = Grafo(Orientacion.D,
+                        (1,5),
+                        [((1, 2), 12), ((1, 3), 34), ((1, 5), 78),
+                         ((2, 4), 55), ((2, 5), 32),
+                         ((3, 4), 61), ((3, 5), 44),
+                         ((4, 5), 93)])
+
+# Comparación de eficiencia
+# =========================
+
+# grafoAleatorio(m, n, k) es un grafo no dirigido, construido con el
+# módulo m, con los vértices de 1 a n y k aristas elegidas
+# aleatoriamente con pesos entre 1 y 100. Por ejemplo,
+#    >>> import src.TAD.GrafoConDiccionarioDeAdyacencia as gd
+#    >>> grafoAleatorio(gd, 4, 3)
+#    G ND ([1, 2, 3, 4], [((1, 1), 3), ((2, 3), 14), ((4, 4), 20)])
+def grafoAleatorio(m: Any, n: int, k: int) -> Any:
+    r = Random(n)
+    return m.creaGrafo(Orientacion.ND,
+                       (1, n),
+                       [((r.randint(1, n), r.randint(1, n)),
+                         r.randint(1, 100))
+                        for _ in range(k)])
+
+# consultas(m, g, k) es la suma de los pesos de las aristas de g que
+# salen de los k primeros vértices, calculada con las funciones
+# adyacentes, aristaEn y peso del módulo m.
+def consultas(m: Any, g: Any, k: int) -> Peso:
+    s: Peso = 0
+    for v in m.nodos(g)[:k]:
+        for u in m.adyacentes(g, v):
+            if m.aristaEn(g, (v, u)):
+                s += m.peso(v, u, g)
+    return s
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación, con grafos de 10^4 vértices y 10^5 aristas, es
+#    >>> import src.TAD.GrafoConListaDeAdyacencia as gl
+#    >>> import src.TAD.GrafoConDiccionarioDeAdyacencia as gd
+#    >>> g1 = grafoAleatorio(gl, 10**4, 10**5)
+#    >>> g2 = grafoAleatorio(gd, 10**4, 10**5)
+#    >>> tiempo('consultas(gl, g1, 10)')
+#    30.11 segundos
+#    >>> tiempo('consultas(gd, g2, 10)')
+#    0.00 segundos
+#    >>> tiempo('consultas(gl, g1, 100)')
+#    257.89 segundos
+#    >>> tiempo('consultas(gd, g2, 100)')
+#    0.00 segundos
+#    >>> tiempo('consultas(gd, g2, 10**4)')
+#    0.08 segundos
+#
+# y, con 10^5 vértices y 10^6 aristas,
+#    >>> g3 = grafoAleatorio(gd, 10**5, 10**6)
+#    >>> tiempo('consultas(gd, g3, 10**5)')
+#    1.47 segundos
@@ -32,9 +32,11 @@
 #    + not (esVacia (inserta x c))
 #
 # Para usar el TAD hay que usar una implementación concreta. En
-# principio, consideraremos dos: una usando listas y otra usando
-# sucesiones. Hay que elegir la que se desee utilizar, descomentándola
-# y comentando las otras.
+# principio, consideraremos cuatro: una usando listas, otra usando dos
+# listas, otra usando sucesiones y otra usando colas persistentes (que
+# comparten su estructura en lugar de copiarla en cada operación). Hay
+# que elegir la que se desee utilizar, descomentándola y comentando las
+# otras.
 
 __all__ = [
     'Cola',
@@ -50,5 +52,7 @@ __all__ = [
 #                                    primero, resto, vacia)
 # from src.TAD.colaConDosListas import (Cola, colaAleatoria, esVacia, inserta,
 #                                       primero, resto, vacia)
-from src.TAD.colaConDeque import (Cola, colaAleatoria, esVacia, inserta,
-                                  primero, resto, vacia)
+# from src.TAD.colaConDeque import (Cola, colaAleatoria, esVacia, inserta,
+#                                   primero, resto, vacia)
+from src.TAD.colaPersistente import (Cola, colaAleatoria, esVacia, inserta,
+                                     primero, resto, vacia)
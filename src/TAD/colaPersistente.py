@@ -0,0 +1,344 @@
+# colaPersistente.py
+# Implementación de las colas persistentes (colas del banquero).
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# En las implementaciones anteriores, las funciones inserta y resto
+# copian la cola completa (con deepcopy) antes de modificarla, por lo
+# que cada operación tiene un coste lineal en el tamaño de la cola (y
+# copia también cada uno de sus elementos).
+#
+# En esta implementación la cola se representa mediante dos listas
+# enlazadas inmutables que se comparten entre las distintas versiones
+# de la cola (la cola del banquero de Okasaki):
+#    + el frente, que es una lista perezosa con los primeros elementos
+#      en orden, y
+#    + la trasera, que es una lista con los últimos elementos en orden
+#      inverso.
+# Se mantiene el invariante de que la longitud de la trasera no supera
+# a la del frente. Cuando se rompe, se rota la cola; es decir, el
+# frente pasa a ser la concatenación del frente y la inversa de la
+# trasera. La rotación es perezosa (cada paso se calcula cuando se
+# necesita y se memoriza), por lo que inserta, primero y resto tienen
+# coste constante amortizado sin copiar ningún elemento.
+#
+# Se define la clase Cola con los siguientes métodos:
+#    + inserta(x) añade x al final de la cola.
+#    + primero() es el primero de la cola.
+#    + resto() elimina el primero de la cola.
+#    + esVacia() se verifica si la cola es vacía.
+# Por ejemplo,
+#    >>> c = Cola()
+#    >>> print(c)
+#    -
+#    >>> c.inserta(5)
+#    >>> c.inserta(2)
+#    >>> c.inserta(3)
+#    >>> c.inserta(4)
+#    >>> print(c)
+#    5 | 2 | 3 | 4
+#    >>> c.primero()
+#    5
+#    >>> c.resto()
+#    >>> print(c)
+#    2 | 3 | 4
+#    >>> c.esVacia()
+#    False
+#    >>> c = Cola()
+#    >>> c.esVacia()
+#    True
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> print(vacia())
+#    -
+#    >>> print(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    5 | 2 | 3 | 4
+#    >>> primero(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    5
+#    >>> print(resto(inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))))
+#    2 | 3 | 4
+#    >>> esVacia(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+#    False
+#    >>> esVacia(vacia())
+#    True
+#
+# Finalmente, se define un generador aleatorio de colas y se comprueba
+# que las colas cumplen las propiedades de su especificación.
+
+from __future__ import annotations
+
+__all__ = [
+    'Cola',
+    'vacia',
+    'inserta',
+    'primero',
+    'resto',
+    'esVacia',
+    'colaAleatoria'
+]
+
+from dataclasses import dataclass
+from timeit import Timer, default_timer
+from typing import Any, Callable, Generic, Iterator, Optional, TypeVar, Union
+
+from hypothesis import assume, given
+from hypothesis import strategies as st
+
+A = TypeVar('A')
+
+# Listas enlazadas perezosas
+# ==========================
+
+# Un nodo tiene un elemento (su cabeza) y el resto de la lista, que
+# puede estar calculado (un nodo o None) o suspendido (una función sin
+# argumentos que lo calcula). Al forzar una suspensión se guarda su
+# valor, de forma que cada suspensión se calcula una sola vez aunque
+# el nodo esté compartido por varias colas.
+class _Nodo(Generic[A]):
+    __slots__ = ('cabeza', '_resto')
+
+    def __init__(self,
+                 cabeza: A,
+                 resto: Union[Optional[_Nodo[A]],
+                              Callable[[], Optional[_Nodo[A]]]]) -> None:
+        self.cabeza = cabeza
+        self._resto = resto
+
+    def resto(self) -> Optional[_Nodo[A]]:
+        """
+        Devuelve el resto de la lista, forzándolo si está suspendido.
+        """
+        r = self._resto
+        if callable(r):
+            r = r()
+            self._resto = r
+        return r
+
+def _elementosLista(xs: Optional[_Nodo[A]]) -> Iterator[A]:
+    """
+    Genera los elementos de la lista enlazada xs.
+    """
+    while xs is not None:
+        yield xs.cabeza
+        xs = xs.resto()
+
+# _rota(f, r, a) es la lista perezosa formada por los elementos de f,
+# los de r en orden inverso y los de a, supuesto que r tiene un
+# elemento más que f.
+def _rota(f: Optional[_Nodo[A]],
+          r: _Nodo[A],
+          a: Optional[_Nodo[A]]) -> _Nodo[A]:
+    if f is None:
+        return _Nodo(r.cabeza, a)
+    r1 = r.resto()
+    assert r1 is not None
+    return _Nodo(f.cabeza,
+                 lambda: _rota(f.resto(), r1, _Nodo(r.cabeza, a)))
+
+# Clase de las colas persistentes
+# ===============================
+
+@dataclass
+class Cola(Generic[A]):
+    _frente: Optional[_Nodo[A]] = None
+    _nFrente: int = 0
+    _trasera: Optional[_Nodo[A]] = None
+    _nTrasera: int = 0
+
+    def __post_init__(self) -> None:
+        self._equilibra()
+
+    def _equilibra(self) -> None:
+        """
+        Restablece el invariante de la cola (la trasera no es más larga
+        que el frente) rotándola si es necesario.
+        """
+        if self._nTrasera > self._nFrente:
+            assert self._trasera is not None
+            self._frente = _rota(self._frente, self._trasera, None)
+            self._nFrente += self._nTrasera
+            self._trasera = None
+            self._nTrasera = 0
+
+    def _elementos(self) -> Iterator[A]:
+        """
+        Genera los elementos de la cola en orden.
+        """
+        yield from _elementosLista(self._frente)
+        yield from reversed(list(_elementosLista(self._trasera)))
+
+    def __str__(self) -> str:
+        """
+        Devuelve una cadena con los elementos de la cola separados por " | ".
+        Si la cola está vacía, devuelve "-".
+        """
+        if self.esVacia():
+            return '-'
+        return ' | '.join(map(str, self._elementos()))
+
+    def __eq__(self, c: Any) -> bool:
+        """
+        Comprueba si la cola actual es igual a otra cola; es decir, si
+        tienen los mismos elementos en el mismo orden.
+        """
+        return self._nFrente + self._nTrasera == c._nFrente + c._nTrasera \
+            and list(self._elementos()) == list(c._elementos())
+
+    def inserta(self, x: A) -> None:
+        """
+        Inserta el elemento x en la cola.
+        """
+        self._trasera = _Nodo(x, self._trasera)
+        self._nTrasera += 1
+        self._equilibra()
+
+    def esVacia(self) -> bool:
+        """
+        Devuelve si la cola está vacía.
+        """
+        return self._frente is None
+
+    def primero(self) -> A:
+        """
+        Devuelve el primer elemento de la cola.
+        """
+        assert self._frente is not None
+        return self._frente.cabeza
+
+    def resto(self) -> None:
+        """
+        Elimina el primer elemento de la cola.
+        """
+        assert self._frente is not None
+        self._frente = self._frente.resto()
+        self._nFrente -= 1
+        self._equilibra()
+
+# Funciones del tipo de las colas persistentes
+# ============================================
+
+# Las funciones construyen una nueva cola que comparte sus listas con
+# la cola original, que no se modifica; por tanto, no es necesario
+# copiarla.
+
+def vacia() -> Cola[A]:
+    """
+    Crea y devuelve una cola vacía de tipo A.
+    """
+    c: Cola[A] = Cola()
+    return c
+
+def inserta(x: A, c: Cola[A]) -> Cola[A]:
+    """
+    Inserta un elemento x en la cola c y devuelve una nueva cola con
+    el elemento insertado.
+    """
+    return Cola(c._frente, c._nFrente, _Nodo(x, c._trasera), c._nTrasera + 1)
+
+def esVacia(c: Cola[A]) -> bool:
+    """
+    Devuelve True si la cola está vacía, False si no lo está.
+    """
+    return c.esVacia()
+
+def primero(c: Cola[A]) -> A:
+    """
+    Devuelve el primer elemento de la cola c.
+    """
+    return c.primero()
+
+def resto(c: Cola[A]) -> Cola[A]:
+    """
+    Elimina el primer elemento de la cola c y devuelve la cola
+    resultante.
+    """
+    assert c._frente is not None
+    return Cola(c._frente.resto(), c._nFrente - 1, c._trasera, c._nTrasera)
+
+# Generador de colas
+# ==================
+
+def colaAleatoria() -> st.SearchStrategy[Cola[int]]:
+    """
+    Genera una cola aleatoria de enteros utilizando el módulo "hypothesis".
+
+    Utiliza la función "builds" para construir una cola a partir de una lista
+    de enteros generada aleatoriamente.
+    """
+    def _creaCola(elementos: list[int]) -> Cola[int]:
+        """
+        Crea una cola de enteros a partir de una lista de elementos.
+        """
+        cola: Cola[int] = vacia()
+        for x in elementos:
+            cola = inserta(x, cola)
+        return cola
+    return st.builds(_creaCola, st.lists(st.integers()))
+
+# Comprobación de las propiedades de las colas
+# ============================================
+
+# Las propiedades son
+@given(c=colaAleatoria(), x=st.integers())
+def test_cola1(c: Cola[int], x: int) -> None:
+    assert primero(inserta(x, vacia())) == x
+    assert resto(inserta(x, vacia())) == vacia()
+    assert esVacia(vacia())
+    assert not esVacia(inserta(x, c))
+
+@given(c=colaAleatoria(), x=st.integers())
+def test_cola2(c: Cola[int], x: int) -> None:
+    assume(not esVacia(c))
+    assert primero(inserta(x, c)) == primero(c)
+    assert resto(inserta(x, c)) == inserta(x, resto(c))
+
+# La comprobación es
+#    > poetry run pytest -q colaPersistente.py
+#    2 passed in 0.45s
+
+# Comparación de eficiencia
+# =========================
+
+# operaciones(m, n) inserta los números de 0 a n-1 en una cola vacía
+# usando las funciones del módulo m y, a continuación, los va sacando
+# (es decir, realiza 2n operaciones). Devuelve la suma de los elementos
+# sacados. Por ejemplo,
+#    >>> import src.TAD.colaPersistente as cp
+#    >>> operaciones(cp, 10)
+#    45
+def operaciones(m: Any, n: int) -> int:
+    c = m.vacia()
+    for x in range(n):
+        c = m.inserta(x, c)
+    s = 0
+    while not m.esVacia(c):
+        s += m.primero(c)
+        c = m.resto(c)
+    return s
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+# La comparación es
+#    >>> import src.TAD.colaConDeque as cd
+#    >>> import src.TAD.colaConDosListas as c2
+#    >>> import src.TAD.colaPersistente as cp
+#    >>> tiempo('operaciones(cd, 2*10**3)')
+#    1.72 segundos
+#    >>> tiempo('operaciones(c2, 2*10**3)')
+#    1.49 segundos
+#    >>> tiempo('operaciones(cp, 2*10**3)')
+#    0.01 segundos
+#
+#    >>> tiempo('operaciones(cd, 10**4)')
+#    32.80 segundos
+#    >>> tiempo('operaciones(cp, 10**4)')
+#    0.03 segundos
+#
+#    >>> tiempo('operaciones(cp, 10**5)')
+#    0.24 segundos
+#    >>> tiempo('operaciones(cp, 10**6)')
+#    3.06 segundos
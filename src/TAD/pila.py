@@ -29,9 +29,10 @@
 # + not esVacia(apila(x, p))
 #
 # Para usar el TAD hay que usar una implementación concreta. En
-# principio, consideraremos dos una usando listas y otra usando
-# sucesiones. Hay que elegir la que se desee utilizar, descomentándola
-# y comentando las otras.
+# principio, consideraremos tres: una usando listas, otra usando
+# sucesiones y otra usando pilas persistentes (que comparten sus nodos
+# en lugar de copiarlos en cada operación). Hay que elegir la que se
+# desee utilizar, descomentándola y comentando las otras.
 
 __all__ = [
     'Pila',
@@ -42,8 +43,9 @@ __all__ = [
     'desapila',
     'pilaAleatoria'
 ]
-from src.TAD.pilaConListas import (Pila, apila, cima, desapila, esVacia,
-                                   pilaAleatoria, vacia)
-
+# from src.TAD.pilaConListas import (Pila, apila, cima, desapila, esVacia,
+#                                    pilaAleatoria, vacia)
 # from src.TAD.pilaConDeque import (Pila, apila, cima, desapila, esVacia,
 #                                   pilaAleatoria, vacia)
+from src.TAD.pilaPersistente import (Pila, apila, cima, desapila, esVacia,
+                                     pilaAleatoria, vacia)
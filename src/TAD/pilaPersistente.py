@@ -0,0 +1,330 @@
+# pilaPersistente.py
+# Implementación de las pilas persistentes mediante listas enlazadas.
+# José A. Alonso Jiménez <https://jaalonso.github.io>
+# Sevilla, 18-octubre-2026
+# ======================================================================
+
+# En las implementaciones con listas y con deque, las funciones apila y
+# desapila copian la pila completa (con deepcopy) antes de modificarla,
+# por lo que cada operación tiene un coste lineal en el tamaño de la
+# pila y copia también cada uno de sus elementos.
+#
+# En esta implementación la pila se representa mediante una lista
+# enlazada de nodos inmutables. Apilar consiste en crear un nodo cuyo
+# resto es la pila original y desapilar en tomar el resto del nodo de
+# la cima, por lo que ambas operaciones tienen coste constante y las
+# distintas versiones de la pila comparten sus nodos.
+#
+# Se define la clase Pila con los siguientes métodos:
+#    + apila(x) añade x al principio de la pila.
+#    + cima() devuelve la cima de la pila.
+#    + desapila() elimina la cima de la pila.
+#    + esVacia() se verifica si la pila es vacía.
+# Por ejemplo,
+#    >>> p = Pila()
+#    >>> print(p)
+#    -
+#    >>> p.apila(5)
+#    >>> p.apila(2)
+#    >>> p.apila(3)
+#    >>> p.apila(4)
+#    >>> print(p)
+#    4 | 3 | 2 | 5
+#    >>> p.cima()
+#    4
+#    >>> p.desapila()
+#    >>> print(p)
+#    3 | 2 | 5
+#    >>> p.esVacia()
+#    False
+#    >>> p = Pila()
+#    >>> p.esVacia()
+#    True
+#
+# Además se definen las correspondientes funciones. Por ejemplo,
+#    >>> print(vacia())
+#    -
+#    >>> print(apila(4, apila(3, apila(2, apila(5, vacia())))))
+#    4 | 3 | 2 | 5
+#    >>> print(cima(apila(4, apila(3, apila(2, apila(5, vacia()))))))
+#    4
+#    >>> print(desapila(apila(4, apila(3, apila(2, apila(5, vacia()))))))
+#    3 | 2 | 5
+#    >>> print(esVacia(apila(4, apila(3, apila(2, apila(5, vacia()))))))
+#    False
+#    >>> print(esVacia(vacia()))
+#    True
+#
+# Finalmente, se define un generador aleatorio de pilas y se comprueba
+# que las pilas cumplen las propiedades de su especificación.
+
+from __future__ import annotations
+
+__all__ = [
+    'Pila',
+    'vacia',
+    'apila',
+    'esVacia',
+    'cima',
+    'desapila',
+    'pilaAleatoria'
+]
+
+import tracemalloc
+from copy import deepcopy
+from dataclasses import dataclass
+from timeit import Timer, default_timer
+from typing import Any, Generic, Iterator, Optional, TypeVar
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+A = TypeVar('A')
+
+# Nodos de las listas enlazadas
+# =============================
+
+class _Nodo(Generic[A]):
+    __slots__ = ('cabeza', 'resto')
+
+    def __init__(self, cabeza: A, resto: Optional[_Nodo[A]]) -> None:
+        self.cabeza = cabeza
+        self.resto = resto
+
+# Clase de las pilas persistentes
+# ===============================
+
+@dataclass
+class Pila(Generic[A]):
+    _cima: Optional[_Nodo[A]] = None
+
+    def _elementos(self) -> Iterator[A]:
+        """
+        Genera los elementos de la pila, empezando por la cima.
+        """
+        xs = self._cima
+        while xs is not None:
+            yield xs.cabeza
+            xs = xs.resto
+
+    def __str__(self) -> str:
+        """
+        Devuelve una cadena con los elementos de la pila separados por " | ".
+        Si la pila está vacía, devuelve "-".
+        """
+        if self.esVacia():
+            return '-'
+        return " | ".join(str(x) for x in self._elementos())
+
+    def __eq__(self, p: Any) -> bool:
+        """
+        Comprueba si la pila actual es igual a otra pila; es decir, si
+        tienen los mismos elementos en el mismo orden.
+        """
+        return list(self._elementos()) == list(p._elementos())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Pila[A]:
+        """
+        Devuelve una copia de la pila con copias de sus elementos. Los
+        nodos se construyen iterativamente (para no superar el límite de
+        recursión con pilas grandes). Para una copia que comparta los
+        nodos con la original, basta usar copy.copy.
+        """
+        p: Pila[A] = Pila()
+        memo[id(self)] = p
+        xs = [deepcopy(x, memo) for x in self._elementos()]
+        for x in reversed(xs):
+            p._cima = _Nodo(x, p._cima)
+        return p
+
+    def apila(self, x: A) -> None:
+        """
+        Agrega el elemento x al inicio de la pila.
+        """
+        self._cima = _Nodo(x, self._cima)
+
+    def esVacia(self) -> bool:
+        """
+        Verifica si la pila está vacía.
+
+        Devuelve True si la pila está vacía, False en caso contrario.
+        """
+        return self._cima is None
+
+    def cima(self) -> A:
+        """
+        Devuelve el elemento en la cima de la pila.
+        """
+        assert self._cima is not None
+        return self._cima.cabeza
+
+    def desapila(self) -> None:
+        """
+        Elimina el elemento en la cima de la pila.
+        """
+        assert self._cima is not None
+        self._cima = self._cima.resto
+
+# Funciones del tipo de las pilas persistentes
+# ============================================
+
+# Las funciones construyen una nueva pila que comparte sus nodos con la
+# pila original, que no se modifica; por tanto, no es necesario
+# copiarla.
+
+def vacia() -> Pila[A]:
+    """
+    Crea y devuelve una pila vacía de tipo A.
+    """
+    p: Pila[A] = Pila()
+    return p
+
+def apila(x: A, p: Pila[A]) -> Pila[A]:
+    """
+    Añade un elemento x al tope de la pila p y devuelve la pila
+    resultante.
+    """
+    return Pila(_Nodo(x, p._cima))
+
+def esVacia(p: Pila[A]) -> bool:
+    """
+    Devuelve True si la pila está vacía, False si no lo está.
+    """
+    return p.esVacia()
+
+def cima(p: Pila[A]) -> A:
+    """
+    Devuelve el elemento en la cima de la pila p.
+    """
+    return p.cima()
+
+def desapila(p: Pila[A]) -> Pila[A]:
+    """
+    Elimina el elemento en la cima de la pila p y devuelve la pila
+    resultante.
+    """
+    assert p._cima is not None
+    return Pila(p._cima.resto)
+
+# Generador de pilas
+# ==================
+
+def pilaAleatoria() -> st.SearchStrategy[Pila[int]]:
+    """
+    Genera una estrategia de búsqueda para generar pilas de enteros de
+    forma aleatoria.
+
+    Utiliza la librería Hypothesis para generar una lista de enteros y
+    luego se apilan sus elementos, de forma que el primero de la lista
+    sea la cima de la pila.
+    """
+    def _creaPila(elementos: list[int]) -> Pila[int]:
+        """
+        Crea una pila de enteros cuya cima es el primero de elementos.
+        """
+        p: Pila[int] = vacia()
+        for x in reversed(elementos):
+            p = apila(x, p)
+        return p
+    return st.builds(_creaPila, st.lists(st.integers()))
+
+# Comprobación de las propiedades de las pilas
+# ============================================
+
+# Las propiedades son
+@given(p=pilaAleatoria(), x=st.integers())
+def test_pila(p: Pila[int], x: int) -> None:
+    assert cima(apila(x, p)) == x
+    assert desapila(apila(x, p)) == p
+    assert esVacia(vacia())
+    assert not esVacia(apila(x, p))
+
+# La comprobación es
+#    > poetry run pytest -q pilaPersistente.py
+#    1 passed in 0.31s
+
+# Comparación de eficiencia
+# =========================
+
+# operaciones(m, n) apila los números de 0 a n-1 en una pila vacía
+# usando las funciones del módulo m y, a continuación, los va
+# desapilando (es decir, realiza 2n operaciones). Devuelve la suma de
+# los elementos desapilados. Por ejemplo,
+#    >>> import src.TAD.pilaPersistente as pp
+#    >>> operaciones(pp, 10)
+#    45
+def operaciones(m: Any, n: int) -> int:
+    p = m.vacia()
+    for x in range(n):
+        p = m.apila(x, p)
+    s = 0
+    while not m.esVacia(p):
+        s += m.cima(p)
+        p = m.desapila(p)
+    return s
+
+# versiones(m, n) es la lista de las n+1 pilas que se obtienen apilando
+# sucesivamente los números de 0 a n-1 en la pila vacía usando las
+# funciones del módulo m. Por ejemplo,
+#    >>> import src.TAD.pilaPersistente as pp
+#    >>> [str(p) for p in versiones(pp, 3)]
+#    ['-', '0', '1 | 0', '2 | 1 | 0']
+def versiones(m: Any, n: int) -> list[Any]:
+    ps = [m.vacia()]
+    for x in range(n):
+        ps.append(m.apila(x, ps[-1]))
+    return ps
+
+def tiempo(e: str) -> None:
+    """Tiempo (en segundos) de evaluar la expresión e."""
+    t = Timer(e, "", default_timer, globals()).timeit(1)
+    print(f"{t:0.2f} segundos")
+
+def memoria(e: str) -> None:
+    """Memoria máxima (en megabytes) usada al evaluar la expresión e."""
+    tracemalloc.start()
+    eval(e, globals())  # pylint: disable=eval-used
+    _, m = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{m / 2**20:0.2f} MB")
+
+# La comparación es
+#    >>> import src.TAD.pilaConListas as pl
+#    >>> import src.TAD.pilaConDeque as pd
+#    >>> import src.TAD.pilaPersistente as pp
+#    >>> tiempo('operaciones(pl, 2*10**3)')
+#    1.44 segundos
+#    >>> tiempo('operaciones(pd, 2*10**3)')
+#    1.61 segundos
+#    >>> tiempo('operaciones(pp, 2*10**3)')
+#    0.00 segundos
+#
+#    >>> tiempo('operaciones(pl, 10**4)')
+#    32.55 segundos
+#    >>> tiempo('operaciones(pp, 10**4)')
+#    0.01 segundos
+#
+#    >>> tiempo('operaciones(pp, 10**5)')
+#    0.15 segundos
+#    >>> tiempo('operaciones(pp, 10**6)')
+#    1.40 segundos
+#
+#    >>> memoria('versiones(pl, 2*10**3)')
+#    16.85 MB
+#    >>> memoria('versiones(pd, 2*10**3)')
+#    17.70 MB
+#    >>> memoria('versiones(pp, 2*10**3)')
+#    0.32 MB
+#    >>> memoria('versiones(pp, 10**5)')
+#    16.02 MB
+#
+# Además, el cálculo de solucionesNR(n) del problema de las n reinas
+# por búsqueda en profundidad (en BEE_Reinas_Profundidad.py), según la
+# implementación de las pilas elegida en src/TAD/pila.py, es
+#
+#    +----+------------+------------+-------------+
+#    | n  | Con listas | Con deque  | Persistente |
+#    +----+------------+------------+-------------+
+#    |  8 |  0.52 seg. |  0.69 seg. |  0.04 seg.  |
+#    | 10 | 17.09 seg. | 17.37 seg. |  1.34 seg.  |
+#    +----+------------+------------+-------------+
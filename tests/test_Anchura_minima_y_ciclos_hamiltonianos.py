@@ -0,0 +1,7 @@
+from src.Anchura_minima_y_ciclos_hamiltonianos import (
+    test_anchuraMinima, test_anchuraMinima_equiv, test_anchuraOrden,
+    test_cicloHamiltoniano)
+
+test_anchuraOrden()
+test_anchuraMinima()
+test_cicloHamiltoniano()
@@ -1,3 +1,4 @@
-from src.Camino_de_maxima_suma_en_una_matriz import test_caminoMaxSuma
+from src.Camino_de_maxima_suma_en_una_matriz import (test_caminoMaxSuma,
+                                                     test_caminoMaxSuma_equiv)
 
 test_caminoMaxSuma()
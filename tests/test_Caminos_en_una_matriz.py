@@ -1,3 +1,3 @@
-from src.Caminos_en_una_matriz import test_caminos
+from src.Caminos_en_una_matriz import test_caminos, test_caminos_equiv
 
 test_caminos()
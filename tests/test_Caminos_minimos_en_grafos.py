@@ -0,0 +1,4 @@
+from src.Caminos_minimos_en_grafos import (test_caminosMinimos,
+                                           test_caminosMinimos_equiv)
+
+test_caminosMinimos()
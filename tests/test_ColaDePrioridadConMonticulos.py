@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.TAD.ColaDePrioridadConMonticulos import (CPrioridad, esVacia,
+                                                  inserta, primero, resto,
+                                                  test_cola1, test_cola2,
+                                                  vacia)
+
+test_cola1()
+test_cola2()
+
+
+def test_CPrioridad() -> None:
+    c: CPrioridad[int] = CPrioridad()
+    assert str(c) == "-"
+    c.inserta(5)
+    c.inserta(2)
+    c.inserta(3)
+    c.inserta(4)
+    assert str(c) == "2 | 3 | 4 | 5"
+    assert c.primero() == 2
+    c.resto()
+    assert str(c) == "3 | 4 | 5"
+    assert not c.esVacia()
+    c = CPrioridad()
+    assert c.esVacia()
+    assert str(vacia()) == "-"
+    assert str(inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))) \
+        == "2 | 3 | 4 | 5"
+    assert primero(inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))) \
+        == 2
+    assert str(resto(inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))))\
+        == "3 | 4 | 5"
+    assert not esVacia(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+    assert esVacia(vacia())
+
+
+@dataclass
+class Tarea:
+    prioridad: int
+    nombre: str
+
+    def __lt__(self, otra: Tarea) -> bool:
+        return self.prioridad < otra.prioridad
+
+
+def test_empates() -> None:
+    c: CPrioridad[Tarea] = vacia()
+    for (p, n) in [(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd')]:
+        c = inserta(Tarea(p, n), c)
+    ns = []
+    while not esVacia(c):
+        ns.append(primero(c).nombre)
+        c = resto(c)
+    assert ns == ['b', 'd', 'a', 'c']
@@ -0,0 +1,6 @@
+from src.Componentes_conexas_de_grafos import (
+    test_componentesFuertes, test_IndiceDeConectividad,
+    test_IndiceDeConectividad_equiv)
+
+test_componentesFuertes()
+test_IndiceDeConectividad()
@@ -0,0 +1,5 @@
+from src.TAD.ConjuntosDisjuntos import (test_conjuntosDisjuntos, test_deshaz,
+                                       test_particion)
+
+test_conjuntosDisjuntos()
+test_deshaz()
@@ -0,0 +1,3 @@
+from src.Generadores_de_grafos import test_gen_grafoGrande, test_generadores
+
+test_generadores()
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import numpy as np
+
+import src.TAD.GrafoConCSR as gc
+import src.TAD.GrafoConListaDeAdyacencia as gl
+from src.TAD.GrafoConCSR import (Orientacion, adyacentes, aristaEn, aristas,
+                                 cargaGrafo, creaGrafo, creaGrafo_,
+                                 desdeArrays, ejGrafoD, ejGrafoND,
+                                 guardaGrafo, leeAristas, listaAleatoria,
+                                 nodos, peso)
+
+
+def test_grafo() -> None:
+    assert str(creaGrafo(Orientacion.ND, (1,3), [((1,2),12),((1,3),34)])) \
+        == "G ND ([1, 2, 3], [((1, 2), 12), ((1, 3), 34)])"
+    assert str(creaGrafo_(Orientacion.D, (1,3), [(2, 1), (1, 3)])) \
+        == "G D ([1, 2, 3], [(1, 3), (2, 1)])"
+    assert str(desdeArrays(Orientacion.ND, (1,3),
+                           np.array([1,3]), np.array([2,1]),
+                           np.array([2.5,4]))) \
+        == "G ND ([1, 2, 3], [((1, 2), 2.5), ((1, 3), 4.0)])"
+    assert adyacentes(ejGrafoND, 4) == [2, 3, 5]
+    assert adyacentes(ejGrafoD, 5) == []
+    g = creaGrafo_(Orientacion.ND, (1,3), [(1, 2), (2, 3), (3, 1)])
+    assert [adyacentes(g, v) for v in [-2, -1, 0, 4]] == [[], [], [], []]
+    assert aristaEn(ejGrafoND, (5, 1))
+    assert not aristaEn(ejGrafoD, (5, 1))
+    assert peso(5, 1, ejGrafoND) == 78
+    g = creaGrafo(Orientacion.ND, (1,3), [((1,2),12),((2,3),2.5)])
+    assert str(g) == "G ND ([1, 2, 3], [((1, 2), 12), ((2, 3), 2.5)])"
+    assert peso(2, 1, g) == 12 and isinstance(peso(2, 1, g), int)
+    for as_ in [[((1,5),2)], [((0,1),2)], [((1,2),0), ((4,4),0)]]:
+        try:
+            creaGrafo(Orientacion.ND, (1,3), as_)
+            assert False
+        except ValueError:
+            pass
+
+
+def test_equivalencia() -> None:
+    as_ = listaAleatoria(30, 100)
+    for o in [Orientacion.D, Orientacion.ND]:
+        g1 = gl.creaGrafo(o, (1, 30), as_)
+        g2 = creaGrafo(o, (1, 30), as_)
+        assert str(g1) == str(g2)
+        assert aristas(g2) == gl.aristas(g1)
+        for v in nodos(g2):
+            assert adyacentes(g2, v) == sorted(gl.adyacentes(g1, v))
+            for u in nodos(g2):
+                assert aristaEn(g2, (v, u)) == gl.aristaEn(g1, (v, u))
+
+
+def test_ficheros(tmp_path: Path) -> None:
+    f = tmp_path / "aristas.txt"
+    f.write_text("1 2 3\n2 3 4.5\n")
+    g = leeAristas(Orientacion.D, str(f))
+    assert str(g) == "G D ([1, 2, 3], [((1, 2), 3.0), ((2, 3), 4.5)])"
+    guardaGrafo(ejGrafoND, str(tmp_path / "g"))
+    for mmap in [False, True]:
+        h = cargaGrafo(str(tmp_path / "g"), mmap)
+        assert str(h) == str(ejGrafoND)
+        assert gc.peso(4, 2, h) == 55
+    g = creaGrafo(Orientacion.D, (1,3), [((1,2),12),((2,3),2.5)])
+    guardaGrafo(g, str(tmp_path / "m"))
+    for mmap in [False, True]:
+        assert str(cargaGrafo(str(tmp_path / "m"), mmap)) == str(g)
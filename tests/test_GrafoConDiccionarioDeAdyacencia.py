@@ -0,0 +1,36 @@
+import src.TAD.GrafoConDiccionarioDeAdyacencia as gd
+import src.TAD.GrafoConListaDeAdyacencia as gl
+from src.TAD.GrafoConDiccionarioDeAdyacencia import (Orientacion, adyacentes,
+                                                     aristaEn, aristas,
+                                                     creaGrafo, creaGrafo_,
+                                                     ejGrafoD, ejGrafoND,
+                                                     grafoAleatorio, nodos,
+                                                     peso)
+
+
+def test_grafo() -> None:
+    assert str(creaGrafo(Orientacion.ND, (1,3), [((1,2),12),((1,3),34)])) \
+        == "G ND ([1, 2, 3], [((1, 2), 12), ((1, 3), 34)])"
+    assert str(creaGrafo_(Orientacion.D, (1,3), [(2, 1), (1, 3)])) \
+        == "G D ([1, 2, 3], [(1, 3), (2, 1)])"
+    assert adyacentes(ejGrafoND, 4) == [2, 3, 5]
+    assert adyacentes(ejGrafoD, 4) == [5]
+    assert adyacentes(ejGrafoD, 5) == []
+    assert aristaEn(ejGrafoND, (5, 1))
+    assert not aristaEn(ejGrafoND, (4, 1))
+    assert not aristaEn(ejGrafoD, (5, 1))
+    assert peso(1, 5, ejGrafoND) == 78
+    assert peso(5, 1, ejGrafoND) == 78
+
+
+def test_equivalencia() -> None:
+    g1 = grafoAleatorio(gl, 30, 100)
+    g2 = grafoAleatorio(gd, 30, 100)
+    assert str(g1) == str(g2)
+    assert aristas(g2) == gl.aristas(g1)
+    for v in nodos(g2):
+        assert adyacentes(g2, v) == sorted(gl.adyacentes(g1, v))
+        for u in nodos(g2):
+            assert aristaEn(g2, (v, u)) == gl.aristaEn(g1, (v, u))
+            if aristaEn(g2, (v, u)):
+                assert peso(v, u, g2) == gl.peso(v, u, g1)
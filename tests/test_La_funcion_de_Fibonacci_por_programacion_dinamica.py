@@ -1,3 +1,4 @@
-from src.La_funcion_de_Fibonacci_por_programacion_dinamica import test_fib
+from src.La_funcion_de_Fibonacci_por_programacion_dinamica import (
+    test_fib, test_fib_equiv)
 
 test_fib()
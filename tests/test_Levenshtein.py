@@ -1,3 +1,3 @@
-from src.Levenshtein import test_levenshtein
+from src.Levenshtein import test_levenshtein, test_levenshtein_equiv
 
 test_levenshtein()
@@ -1,3 +1,3 @@
-from src.Longitud_SCM import test_longitudSCM
+from src.Longitud_SCM import test_longitudSCM, test_longitudSCM_equiv
 
 test_longitudSCM()
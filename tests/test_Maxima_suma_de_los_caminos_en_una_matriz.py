@@ -1,3 +1,4 @@
-from src.Maxima_suma_de_los_caminos_en_una_matriz import test_maximaSuma
+from src.Maxima_suma_de_los_caminos_en_una_matriz import (
+    test_maximaSuma, test_maximaSuma_equiv)
 
 test_maximaSuma()
@@ -0,0 +1,3 @@
+from src.Mochila_PD_y_RyP import test_mochila_equiv, test_MochilaPD
+
+test_MochilaPD()
@@ -0,0 +1,3 @@
+from src.NPuzzle import test_NPuzzle
+
+test_NPuzzle()
@@ -1,4 +1,5 @@
 from src.Problemas_basicos_de_grafos import (test_completo, test_contiguos,
+                                             test_estadisticas,
                                              test_grado, test_GradoNeg,
                                              test_GradoPos, test_grafoCiclo,
                                              test_incidentes,
@@ -0,0 +1,3 @@
+from src.ProgramacionDinamica import test_programacionDinamica
+
+test_programacionDinamica()
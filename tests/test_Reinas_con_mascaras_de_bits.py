@@ -0,0 +1,3 @@
+from src.Reinas_con_mascaras_de_bits import test_nReinas
+
+test_nReinas()
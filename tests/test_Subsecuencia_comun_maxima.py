@@ -1,3 +1,3 @@
-from src.Subsecuencia_comun_maxima import test_scm
+from src.Subsecuencia_comun_maxima import test_scm, test_scm_equiv
 
 test_scm()
@@ -0,0 +1,39 @@
+from src.TAD.colaPersistente import (Cola, esVacia, inserta, primero, resto,
+                                     test_cola1, test_cola2, vacia)
+
+test_cola1()
+test_cola2()
+
+def test_cola() -> None:
+    assert str(vacia()) == '-'
+    assert str(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))\
+        == '5 | 2 | 3 | 4'
+    assert primero(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))\
+        == 5
+    assert str(resto(inserta(4, inserta(3, inserta(2, inserta(5, vacia()))))))\
+        == '2 | 3 | 4'
+    assert not esVacia(inserta(4, inserta(3, inserta(2, inserta(5, vacia())))))
+    assert esVacia(vacia())
+    c: Cola[int] = Cola()
+    assert str(c) == '-'
+    c.inserta(5)
+    c.inserta(2)
+    c.inserta(3)
+    c.inserta(4)
+    assert str(c) == '5 | 2 | 3 | 4'
+    assert c.primero() == 5
+    c.resto()
+    assert str(c) == '2 | 3 | 4'
+    assert not c.esVacia()
+    d: Cola[int] = Cola()
+    assert d.esVacia()
+
+
+def test_persistencia() -> None:
+    c = inserta(3, inserta(2, inserta(1, vacia())))
+    c1 = resto(c)
+    c2 = inserta(4, c)
+    assert str(c) == '1 | 2 | 3'
+    assert str(c1) == '2 | 3'
+    assert str(c2) == '1 | 2 | 3 | 4'
+    assert str(inserta(5, c)) == '1 | 2 | 3 | 5'
@@ -0,0 +1,61 @@
+from copy import copy, deepcopy
+
+from src.TAD.pilaPersistente import (Pila, apila, cima, desapila, esVacia,
+                                     test_pila, vacia)
+
+test_pila()
+
+
+def test_pila() -> None:
+    assert str(vacia()) == '-'
+    assert str(apila(4, apila(3, apila(2, apila(5, vacia())))))\
+        == '4 | 3 | 2 | 5'
+    assert cima(apila(4, apila(3, apila(2, apila(5, vacia())))))\
+        == 4
+    assert str(desapila(apila(4, apila(3, apila(2, apila(5, vacia()))))))\
+        == '3 | 2 | 5'
+    assert not esVacia(apila(4, apila(3, apila(2, apila(5, vacia())))))
+    assert esVacia(vacia())
+    p: Pila[int] = Pila()
+    assert str(p) == '-'
+    p.apila(5)
+    p.apila(2)
+    p.apila(3)
+    p.apila(4)
+    assert str(p) == '4 | 3 | 2 | 5'
+    assert p.cima() == 4
+    p.desapila()
+    assert str(p) == '3 | 2 | 5'
+    assert not p.esVacia()
+    q: Pila[int] = Pila()
+    assert q.esVacia()
+
+
+def test_persistencia() -> None:
+    p = apila(3, apila(2, apila(1, vacia())))
+    p1 = desapila(p)
+    p2 = apila(4, p)
+    assert str(p) == '3 | 2 | 1'
+    assert str(p1) == '2 | 1'
+    assert str(p2) == '4 | 3 | 2 | 1'
+    assert desapila(p2)._cima is p._cima
+
+
+def test_copias() -> None:
+    p = apila([2], apila([1], vacia()))
+    q = deepcopy(p)
+    assert q == p
+    assert q._cima is not p._cima
+    q.cima().append(3)
+    assert str(p) == '[2] | [1]'
+    r = copy(p)
+    r.desapila()
+    assert str(p) == '[2] | [1]'
+    assert r._cima is p._cima.resto
+    xs = [0]
+    ps = deepcopy([xs, apila(xs, vacia())])
+    assert ps[1].cima() is ps[0]
+    p = vacia()
+    for x in range(10**5):
+        p = apila(x, p)
+    assert deepcopy(p) == p